@@ -13,6 +13,9 @@ import word_app.lib.darkdetect as darkdetect
 from word_app.app.tui.screens.quick_search.suggestion_provider import (
     Provider,
 )
+from word_app.infra.cache import TieredCache
+from word_app.infra.factories import HttpClientRegistry
+from word_app.lib._shr.limit import RateLimit
 
 if TYPE_CHECKING:
     from word_app.data.vo import DataSource as DataSourceInformation
@@ -26,18 +29,38 @@ class ThemeMode(StrEnum):
     LIGHT = "1"
 
 
+class RateLimitSettings(BaseModel):
+    """Client side limits on the requests sent to a data source."""
+
+    rate: float = 10.0
+    """Requests a second, sustained."""
+    burst: int = 20
+    """Requests that can be sent at once, after a quiet spell."""
+    daily_quota: int | None = None
+    """Requests a day, None for no limit."""
+
+    def as_limit(self) -> RateLimit:
+        return RateLimit(
+            rate=self.rate, burst=self.burst, daily_quota=self.daily_quota
+        )
+
+
 class DataSource(BaseModel):
     """Base class for data source configurations."""
 
     enabled: bool = True
+    rate_limit: RateLimitSettings = RateLimitSettings()
 
 
 class DataMuse(DataSource):
-    pass
+    # https://www.datamuse.com/api/ allows 100,000 requests a day.
+    rate_limit: RateLimitSettings = RateLimitSettings(daily_quota=100_000)
 
 
 class Wordnik(DataSource):
     api_key: str = ""
+    # A word takes six requests, Wordnik's own limits are in its headers.
+    rate_limit: RateLimitSettings = RateLimitSettings(rate=5.0, burst=12)
 
 
 class DataSources(BaseModel):
@@ -51,6 +74,20 @@ class ApplicationSettings(BaseSettings):
     )
 
     data_sources: DataSources = DataSources()
+    hot_word_screens: int = 5
+    """Word screens kept as they are for going back to, older ones are
+    rebuilt from their details. The word history's memory budget, counted in
+    screens, as a composed screen's size in bytes isn't cheap to measure."""
+    offline: bool = False
+    """Answer word details from the cache only."""
+    prefetch_dwell: float = 0.3
+    """Seconds a suggestion is highlighted, or a word hovered, before its
+    details are fetched ahead of it being chosen."""
+    reuse_word_screen: bool = False
+    """Show a word on the word screen on top, keeping whatever's the same as
+    the last word's, rather than on a new screen. Faster to hop between
+    words, but the last word is only kept as details, so going back rebuilds
+    it rather than showing one of the `hot_word_screens`."""
     theme_mode: ThemeMode = ThemeMode.AUTO
 
     @classmethod
@@ -92,7 +129,9 @@ class ApplicationSettings(BaseSettings):
 @dataclass
 class ApplicationDependencies:
     detail_provider: AbstractWordDetailProvider
-    search_provider_cls: type[Provider]
+    http_clients: HttpClientRegistry
+    search_cache: TieredCache
+    search_providers: list[type[Provider]]
     theme_dark: Theme
     theme_light: Theme
 
@@ -123,6 +162,16 @@ class PathManager:
     def usr(self) -> Path:
         return self.root / "../../usr"
 
+    @property
+    def cache(self) -> Path:
+        """SQLite database holding cached API results."""
+        return self.usr / "cache.sqlite3"
+
+    @property
+    def usage(self) -> Path:
+        """JSON file counting the day's requests to each data source."""
+        return self.usr / "usage.json"
+
 
 @dataclass
 class AppContext:
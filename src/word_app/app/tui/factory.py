@@ -11,6 +11,8 @@ from word_app.app.tui.screens.quick_search.suggestion_provider import (
     Provider,
 )
 from word_app.data.vo import DataSource
+from word_app.infra.cache import TieredCache
+from word_app.infra.factories import HttpClientRegistry
 from word_app.services.wdp.base import AbstractWordDetailProvider
 
 
@@ -19,14 +21,18 @@ def create_app(
     dark_theme: Theme,
     data_sources: list[DataSource],
     detail_provider: AbstractWordDetailProvider,
+    http_clients: HttpClientRegistry,
     light_theme: Theme,
     path: PathManager,
-    search_provider_cls: type[Provider],
+    search_cache: TieredCache,
+    search_providers: list[type[Provider]],
     settings: ApplicationSettings,
 ) -> WordApp:
     deps = ApplicationDependencies(
         detail_provider=detail_provider,
-        search_provider_cls=search_provider_cls,
+        http_clients=http_clients,
+        search_cache=search_cache,
+        search_providers=search_providers,
         theme_dark=dark_theme,
         theme_light=light_theme,
     )
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import partial
+from typing import Any, AsyncIterator
+
+from textual.app import App
+
+from word_app.app.tui.screens.word_detail import WordDetailScreen
+from word_app.data.models import Word
+from word_app.services.wdp.base import (
+    AbstractWordDetailProvider,
+    DeferredSection,
+    DetailSection,
+    SectionUpdate,
+)
+from word_app.services.wdp.prefetch import DetailPrefetcher
+
+
+class WordHistory:
+    """Words navigated through, and the screens showing them.
+
+    Going to a word replaces the word screen on top rather than stacking
+    another on it, going back replaces it with the word before. Screens of
+    the last `hot` words shown are kept, so going back or revisiting one
+    shows it as it was. Older screens are dropped down to the details they'd
+    loaded and rebuilt from those, without the provider, if they're shown
+    again.
+
+    With `reuse`, a word without a screen kept is shown on the screen on top
+    instead, which keeps whatever it can of the last word's, and the last
+    word is kept as details. Only the screen on top is then kept hot.
+
+    A word fetched afresh is claimed from `prefetcher`, if there's one, so
+    it's counted as prefetched or not and shares a prefetch still running.
+    """
+
+    _COLD_LIMIT: int = 100
+    """Words kept as details once their screens are dropped."""
+
+    def __init__(
+        self,
+        app: App[Any],
+        provider: AbstractWordDetailProvider,
+        hot: int = 5,
+        reuse: bool = False,
+        prefetcher: DetailPrefetcher | None = None,
+    ) -> None:
+        self._app = app
+        self._provider = provider
+        self._prefetcher = prefetcher
+        self._hot_limit = max(hot, 1)
+        self._reuse = reuse
+        self._hot: OrderedDict[str, WordDetailScreen] = OrderedDict()
+        self._cold: OrderedDict[str, tuple[Word, set[DetailSection]]] = (
+            OrderedDict()
+        )
+        self._back: list[str] = []
+        self._current: WordDetailScreen | None = None
+        self._current_word = ""
+
+    @property
+    def _on_top(self) -> bool:
+        return self._current is not None and self._app.screen is self._current
+
+    def _details_for(
+        self, word: str
+    ) -> tuple[
+        Word, AsyncIterator[SectionUpdate] | None, list[DeferredSection]
+    ]:
+        """What to show a word with, from what's kept of it if anything."""
+        if (cold := self._cold.pop(word, None)) is None:
+            updates, deferred = self._provider.lazy_details_for_word(word)
+            if self._prefetcher is not None:
+                updates = self._prefetcher.claim(word, updates)
+            return Word(word=word), updates, deferred
+        details, unloaded = cold
+        # Whatever hadn't loaded is left to load once it's looked at.
+        return (
+            details,
+            None,
+            [
+                DeferredSection(
+                    section=section,
+                    load=partial(
+                        self._provider.stream_details_for_word,
+                        word,
+                        (section,),
+                    ),
+                )
+                for section in unloaded
+            ],
+        )
+
+    def _keep_cold(self, word: str, screen: WordDetailScreen) -> None:
+        self._cold[word] = (screen.word, screen.unloaded)
+        while len(self._cold) > self._COLD_LIMIT:
+            self._cold.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Drop the screens of the least recently shown words, over
+        `hot`."""
+        stack = self._app.screen_stack
+        for word, screen in list(self._hot.items()):
+            if len(self._hot) <= self._hot_limit:
+                break
+            if screen in stack:
+                continue
+            del self._hot[word]
+            self._keep_cold(word, screen)
+            self._app.uninstall_screen(screen)
+            # Stopped before its widgets go, rather than loading into them.
+            self._app.workers.cancel_node(screen)
+            screen.remove()
+
+    def _go_to(self, word: str, replace: bool) -> None:
+        if (screen := self._hot.get(word, None)) is not None:
+            self._hot.move_to_end(word)
+        elif replace and self._reuse and self._current is not None:
+            screen = self._current
+            del self._hot[self._current_word]
+            self._keep_cold(self._current_word, screen)
+            details, updates, deferred = self._details_for(word)
+            screen.show_word(details, updates, deferred)
+            self._hot[word] = screen
+            self._current_word = word
+            return
+        else:
+            details, updates, deferred = self._details_for(word)
+            screen = WordDetailScreen(
+                word=details, updates=updates, deferred=deferred
+            )
+            self._app.install_screen(screen, f"word-detail-{id(screen)}")
+            self._hot[word] = screen
+
+        if replace:
+            self._app.switch_screen(screen)
+        else:
+            self._app.push_screen(screen)
+        self._current = screen
+        self._current_word = word
+        self._evict()
+
+    def visit(self, word: str) -> None:
+        """Show a word, remembering the one it's gone to from."""
+        # Anything else on top, e.g. the home screen, starts afresh.
+        if on_top := self._on_top:
+            if self._current_word == word:
+                return
+            self._back.append(self._current_word)
+        else:
+            self._back.clear()
+        self._go_to(word, replace=on_top)
+
+    def back(self) -> None:
+        """Show the word gone to the current one from, or leave the words
+        if there's none."""
+        if self._back and self._on_top:
+            self._go_to(self._back.pop(), replace=True)
+            return
+        self._back.clear()
+        self._current = None
+        self._app.pop_screen()
@@ -4,9 +4,14 @@ from textual.app import App
 from textual.theme import BUILTIN_THEMES
 
 from word_app.app.base import AppContext
+from word_app.app.tui.history import WordHistory
 from word_app.app.tui.screens.home import HomeScreen
 from word_app.app.tui.screens.quick_search.search import SuggestionPalette
-from word_app.lex import LEX
+from word_app.app.tui.widgets import Suggestion
+from word_app.lex import LEX, LEX_FMT
+from word_app.lib._shr.breaker import CircuitBreaker
+from word_app.lib.wordnik.exceptions import Unauthorized
+from word_app.services.wdp.prefetch import DetailPrefetcher
 
 
 class WordApp(App):
@@ -28,6 +33,17 @@ class WordApp(App):
 
         self.ctx: AppContext = ctx
         super().__init__(*args, **kwargs)
+        ctx.deps.http_clients.on_trip = self._source_tripped
+        self.prefetcher = DetailPrefetcher(
+            ctx.deps.detail_provider, dwell=ctx.settings.prefetch_dwell
+        )
+        self.history = WordHistory(
+            self,
+            ctx.deps.detail_provider,
+            hot=ctx.settings.hot_word_screens,
+            reuse=ctx.settings.reuse_word_screen,
+            prefetcher=self.prefetcher,
+        )
 
     # Base Class Methods.
     def get_theme_variable_defaults(self) -> dict[str, str]:
@@ -37,12 +53,27 @@ class WordApp(App):
             "user-action": "#3376CD",
         }
 
+    def _source_tripped(
+        self, breaker: CircuitBreaker, failure: Exception
+    ) -> None:
+        # Word screens already tell the user about a bad API key.
+        if isinstance(failure, Unauthorized):
+            return
+        self.notify(
+            LEX_FMT.service.unavailable.format(
+                source=breaker.source, seconds=breaker.cooldown
+            ),
+            title=LEX.ui.label.error,
+            timeout=self.NOTIFY_TIMEOUT,
+            severity="warning",
+        )
+
     # Action Methods.
     def action_push_suggestion(self) -> None:
         self.app.push_screen(
             SuggestionPalette(
                 placeholder=LEX.screen.quick_search.placeholder,
-                providers=[self.ctx.deps.search_provider_cls],
+                providers=self.ctx.deps.search_providers,
             )
         )
 
@@ -57,3 +88,39 @@ class WordApp(App):
             self.ctx.settings.theme_mode
         ).name
         self.push_screen("home")
+        self.run_worker(self.ctx.deps.http_clients.connect())
+
+    def on_suggestion_palette_option_highlighted(
+        self, event: SuggestionPalette.OptionHighlighted
+    ) -> None:
+        # Results settling highlight the first, so both dwell the same.
+        option = event.highlighted_event.option
+        if isinstance(option, Suggestion):
+            self.prefetcher.attend(option.hit.text)
+
+    def on_suggestion_palette_closed(
+        self, event: SuggestionPalette.Closed
+    ) -> None:
+        if not event.option_selected:
+            self.prefetcher.attend(None)
+
+    async def on_unmount(self) -> None:
+        self.log.info(f"Detail prefetches: {self.prefetcher.stats}")
+        http_clients = self.ctx.deps.http_clients
+        self.log.info(f"HTTP retries: {http_clients.retry_stats}")
+        for origin, limiter in http_clients.limiters.items():
+            self.log.info(
+                f"Rate limited requests to {origin}: {limiter.stats}, "
+                f"{limiter.used_today} today"
+            )
+        for origin, hedger in http_clients.hedgers.items():
+            self.log.info(f"Hedged requests to {origin}: {hedger.report()}")
+        for priority, stats in http_clients.scheduler.stats.items():
+            self.log.info(
+                f"Scheduled {priority.name.lower()} requests: {stats}, "
+                f"mean wait {stats.mean_wait * 1_000:.0f}ms"
+            )
+        self.prefetcher.attend(None)
+        await self.ctx.deps.detail_provider.clean()
+        await self.ctx.deps.http_clients.aclose()
+        self.ctx.deps.search_cache.close()
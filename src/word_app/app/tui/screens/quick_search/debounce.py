@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from time import monotonic
+
+
+@dataclass
+class SearchStats:
+    """Counters for the searches run by a suggestion palette."""
+
+    started: int = 0
+    """Searches started, after debouncing."""
+
+    cancelled: int = 0
+    """Searches superseded by a newer one before they completed."""
+
+    completed: int = 0
+    """Searches that ran to completion."""
+
+    debounced: int = 0
+    """Keystrokes that never started a search, a newer one came first."""
+
+
+class AdaptiveDebouncer:
+    """Work out how long to wait after a keystroke before searching.
+
+    A search started while the user is still typing is likely to be superseded
+    before it answers, wasting requests. When keystrokes come in faster than
+    searches complete, wait a little longer than the usual gap between
+    keystrokes. Otherwise, search straight away.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_latency: float = 0.2,
+        max_delay: float = 0.35,
+        min_delay: float = 0.0,
+        pause: float = 1.0,
+        slack: float = 1.5,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            initial_latency: Assumed search latency, in seconds, until one
+                has been measured.
+            max_delay: Longest delay, in seconds.
+            min_delay: Shortest delay, in seconds.
+            pause: Gaps between keystrokes longer than this, in seconds, are
+                pauses and don't count towards the typing speed.
+            slack: Multiplier of the typing interval used as the delay.
+            smoothing: Weight of new samples in the moving averages.
+        """
+        self.max_delay = max_delay
+        self.min_delay = min_delay
+        self.pause = pause
+        self.slack = slack
+        self.smoothing = smoothing
+
+        self._last_keystroke: float | None = None
+        self._latency: float = initial_latency
+        self._typing_interval: float | None = None
+
+    def _smooth(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
+
+    @property
+    def latency(self) -> float:
+        """Moving average of search latency, in seconds."""
+        return self._latency
+
+    @property
+    def typing_interval(self) -> float | None:
+        """Moving average of the gap between keystrokes, in seconds."""
+        return self._typing_interval
+
+    @property
+    def delay(self) -> float:
+        """Seconds to wait after the latest keystroke before searching."""
+        interval = self._typing_interval
+        if interval is None or interval >= self._latency:
+            return self.min_delay
+        return max(self.min_delay, min(self.max_delay, interval * self.slack))
+
+    def keystroke(self, now: float | None = None) -> None:
+        """Record a keystroke."""
+        now = monotonic() if now is None else now
+        if self._last_keystroke is not None:
+            gap = now - self._last_keystroke
+            if gap < self.pause:
+                self._typing_interval = self._smooth(self._typing_interval, gap)
+        self._last_keystroke = now
+
+    def search_completed(self, latency: float) -> None:
+        """Record how long, in seconds, a completed search took."""
+        self._latency = self._smooth(self._latency, latency)
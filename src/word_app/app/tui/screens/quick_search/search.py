@@ -51,6 +51,10 @@ if TYPE_CHECKING:
 from word_app.app.tui._models import Hit, Hits
 from word_app.app.tui.constants import HELP_HCLICK_ICON
 from word_app.app.tui.screens.help import HelpScreen
+from word_app.app.tui.screens.quick_search.debounce import (
+    AdaptiveDebouncer,
+    SearchStats,
+)
 from word_app.app.tui.screens.quick_search.suggestion_provider import (
     Provider,
     ProviderSource,
@@ -62,6 +66,8 @@ from word_app.app.tui.widgets import (
     SuggestionList,
 )
 from word_app.lex import LEX
+from word_app.lib._shr.retry import request_deadline
+from word_app.lib._shr.schedule import Priority, request_priority
 
 
 class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
@@ -199,6 +205,9 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
     _BUSY_COUNTDOWN: Final[float] = 0.5
     """How many seconds to wait for hits to come in before showing busy."""
 
+    _SEARCH_BUDGET: Final[float] = 1.5
+    """How many seconds a search's requests have, retries included."""
+
     _GATHER_SUGGESTIONS_GROUP: Final[str] = (
         "--suggestion-palette-gather-suggestions"
     )
@@ -295,6 +304,15 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
         self._hit_count: int = 0
         """Number of hits displayed."""
 
+        self._debouncer = AdaptiveDebouncer()
+        """Decides how long to wait after a keystroke before searching."""
+
+        self._debounce_timer: Timer | None = None
+        """Keeps track of a search waiting for the user to stop typing."""
+
+        self.search_stats = SearchStats()
+        """Counters of searches started, cancelled and completed."""
+
         self._placeholder = placeholder
 
     # Properties
@@ -324,9 +342,34 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
 
     # Private methods
     def _cancel_gather_suggestions(self) -> None:
-        """Cancel any operation that is gather suggestions."""
+        """Cancel any operation that is gather suggestions.
+
+        Cancelling the worker cancels the provider searches, and with them
+        their in-flight HTTP requests.
+        """
+        self._stop_debounce()
+        self.search_stats.cancelled += sum(
+            1
+            for worker in self.workers
+            if worker.node is self
+            and worker.group == self._GATHER_SUGGESTIONS_GROUP
+            and worker.is_running
+        )
         self.workers.cancel_group(self, self._GATHER_SUGGESTIONS_GROUP)
 
+    def _debounce_gather_suggestions(self, search_value: str) -> None:
+        """Gather suggestions once the user has, probably, stopped typing."""
+        self._debouncer.keystroke()
+        if (delay := self._debouncer.delay) <= 0:
+            self._gather_suggestions(search_value)
+            return
+
+        def _search() -> None:
+            self._debounce_timer = None
+            self._gather_suggestions(search_value)
+
+        self._debounce_timer = self.set_timer(delay, _search)
+
     def _refresh_suggestion_list(
         self,
         suggestion_list: SuggestionList,
@@ -364,16 +407,21 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
         suggestions: Queue[Hit] = Queue()
 
         # Fire up an instance of each provider, inside a task, and
-        # have them go start looking for matches.
-        searches = [
-            create_task(
-                self._consume(
-                    provider._search(search_value),
-                    suggestions,
+        # have them go start looking for matches. The tasks keep to the
+        # deadline, and priority, they're started under.
+        with (
+            request_deadline(self._SEARCH_BUDGET),
+            request_priority(Priority.INTERACTIVE),
+        ):
+            searches = [
+                create_task(
+                    self._consume(
+                        provider._search(search_value),
+                        suggestions,
+                    )
                 )
-            )
-            for provider in self._providers
-        ]
+                for provider in self._providers
+            ]
         # Set up a delay for showing that we're busy.
         self._start_busy_countdown()
 
@@ -445,6 +493,13 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
 
         self._busy_timer = self.set_timer(self._BUSY_COUNTDOWN, _become_busy)
 
+    def _stop_debounce(self) -> None:
+        """Stop any search waiting on the debounce delay."""
+        if self._debounce_timer is not None:
+            self.search_stats.debounced += 1
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+
     def _stop_busy_countdown(self) -> None:
         """Stop any busy countdown that's in effect."""
         if self._busy_timer is not None:
@@ -544,7 +599,7 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
         event.stop()
         self._cancel_gather_suggestions()
         self._stop_no_matches_countdown()
-        self._gather_suggestions(event.value.strip())
+        self._debounce_gather_suggestions(event.value.strip())
 
     def _on_click(self, event: Click) -> None:  # type: ignore[override]
         """Handle the click events"""
@@ -593,6 +648,7 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
                 ],
             )
             self._providers.clear()
+        self.log.info(f"Suggestion palette searches: {self.search_stats}")
         if screen := self._calling_screen:
             screen.remove_class(self._BELOW_CLASS)
 
@@ -717,6 +773,11 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
         # providers.
         gathered_suggestions: list[Suggestion] = []
 
+        # Where each hit's text sits in the gathered suggestions. Providers
+        # stream hits, so a better scored hit for a text already gathered
+        # replaces it rather than being listed twice.
+        gathered_positions: dict[str | None, int] = {}
+
         # Get a reference to the widget that we're going to drop the
         # (display of) suggestions into.
         suggestion_list = self.query_one(SuggestionList)
@@ -739,6 +800,8 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
         # We're going to be checking in on the worker as we loop around, so
         # grab a reference to that.
         worker = get_current_worker()
+        self.search_stats.started += 1
+        started = monotonic()
 
         # Reset busy mode.
         self._show_busy = False
@@ -747,6 +810,20 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
         # we've just done an update.
         last_update = monotonic()
 
+        # Fast providers can be done long before slow ones send their next
+        # hit, so don't leave their hits waiting on it; flush them once the
+        # batch time is up.
+        flush_timer: Timer | None = None
+
+        def _flush() -> None:
+            nonlocal flush_timer, last_update
+            flush_timer = None
+            if not worker.is_cancelled:
+                self._refresh_suggestion_list(
+                    suggestion_list, gathered_suggestions
+                )
+                last_update = monotonic()
+
         # Kick off the search, grabbing the iterator.
         search_routine = self._search_for(search_value)
         search_results = search_routine.__aiter__()
@@ -784,10 +861,13 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
                     )
 
             prompt = Content("\n").join(build_prompt())
+            suggestion = Suggestion(prompt, hit, id=str(suggestion_id))
 
-            gathered_suggestions.append(
-                Suggestion(prompt, hit, id=str(suggestion_id))
-            )
+            if (position := gathered_positions.get(hit.text, None)) is None:
+                gathered_positions[hit.text] = len(gathered_suggestions)
+                gathered_suggestions.append(suggestion)
+            elif hit.score > gathered_suggestions[position].hit.score:
+                gathered_suggestions[position] = suggestion
 
             if worker.is_cancelled:
                 break
@@ -799,6 +879,10 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
                     gathered_suggestions,
                 )
                 last_update = now
+            elif flush_timer is None:
+                flush_timer = self.set_timer(
+                    self._RESULT_BATCH_TIME - (now - last_update), _flush
+                )
 
             suggestion_id += 1
 
@@ -810,10 +894,18 @@ class SuggestionPalette(ModalScreen[ScreenResultType], inherit_css=False):
             except StopAsyncIteration:
                 break
 
+        if flush_timer is not None:
+            flush_timer.stop()
+
         # On the way out, if we're still in play, ensure everything has been
         # dropped into the suggestion list.
         if not worker.is_cancelled:
             self._refresh_suggestion_list(suggestion_list, gathered_suggestions)
+            self.search_stats.completed += 1
+            # Searches that found nothing, e.g. too short to query, aren't
+            # representative of how long a search takes.
+            if gathered_suggestions:
+                self._debouncer.search_completed(monotonic() - started)
 
         # One way or another, we're not busy any more.
         self._show_busy = False
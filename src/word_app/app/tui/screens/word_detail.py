@@ -1,10 +1,14 @@
+import asyncio
+from functools import partial
+from itertools import islice
 from statistics import mean
+from typing import AsyncIterator, Callable, Collection, Iterator, NamedTuple
 
 import pyperclip
 from pydantic import BaseModel
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
-from textual.containers import HorizontalGroup, ItemGrid, VerticalScroll
+from textual.containers import HorizontalGroup, VerticalScroll
 from textual.events import Key
 from textual.widget import Widget
 from textual.widgets import (
@@ -21,7 +25,7 @@ from word_app.app.tui.constants import HELP_HOVER_ICON
 from word_app.app.tui.ext import WAScreen
 from word_app.app.tui.utils import hoverable
 from word_app.app.tui.widgets import (
-    ClickablePhrase,
+    ClickableGrid,
     ClickableSentence,
     ClickableText,
     Sidebar,
@@ -31,7 +35,16 @@ from word_app.app.tui.widgets import (
 from word_app.data import vo
 from word_app.data.models import Word, WordDetailContainer
 from word_app.lex import LEX, LEX_FMT
+from word_app.lib._shr.breaker import CircuitOpen
+from word_app.lib._shr.retry import request_deadline
+from word_app.lib._shr.schedule import Priority, request_priority
 from word_app.lib.wordnik.exceptions import Unauthorized
+from word_app.services.wdp.base import (
+    AbstractWordDetailProvider,
+    DeferredSection,
+    DetailSection,
+    SectionUpdate,
+)
 
 
 class WordDetailSection(BaseModel):
@@ -90,6 +103,35 @@ PhraseSection = WordDetailSection(
     id="section-phrase",
 )
 
+SECTION_SOURCES: dict[str, tuple[DetailSection, ...]] = {
+    InformationSection.id: (
+        DetailSection.ETYMOLOGIES,
+        DetailSection.FREQUENCY_GRAPH,
+        DetailSection.SYLLABLES,
+    ),
+    DefinitionSection.id: (DetailSection.DEFINITIONS,),
+    ThesaurusSection.id: (DetailSection.THESAURUS,),
+    RelatedSection.id: (DetailSection.THESAURUS,),
+    ExampleSection.id: (DetailSection.EXAMPLES,),
+    PhraseSection.id: (DetailSection.PHRASES,),
+}
+"""The detail sections each section of the screen is made from."""
+
+
+class _SectionInputs(NamedTuple):
+    """What a section is composed from, the same for two words if it would
+    look the same for both."""
+
+    word: str
+    values: tuple
+    deferred: set[DetailSection]
+    pending: set[DetailSection]
+    failed: set[DetailSection]
+
+    @property
+    def loaded(self) -> bool:
+        return not (self.deferred or self.pending or self.failed)
+
 
 def _make_attribution(*attributions: str) -> str:
     no_repeats = set(attributions)
@@ -99,7 +141,7 @@ def _make_attribution(*attributions: str) -> str:
 class WordDetailScreen(WAScreen):
     AUTO_FOCUS = ""
     BINDINGS = [
-        ("escape", "app.pop_screen", LEX.ui.btn.back),
+        ("escape", "back", LEX.ui.btn.back),
         ("-", "close_all_sections", LEX.ui.btn.close_all),
     ]
 
@@ -107,6 +149,15 @@ class WordDetailScreen(WAScreen):
     WA_ICON = "🗣️"
     WA_TITLE = "Word Details"
 
+    _CHUNK_ROWS: int = 20
+    """Rows of a long list mounted per frame, once the first screenful is."""
+    _CHUNK_INTERVAL: float = 1 / 60
+    _LOAD_BUDGET: float = 5.0
+    """Seconds the requests loading sections have, retries included."""
+    _STALE_DELAY: float = 0.25
+    """Seconds the last word's details are shown as they are, then dimmed
+    while the new word's are still loading."""
+
     class SidebarButtonManager:
         id_prefix = "sidebarbutton"
         sep = "_"
@@ -119,13 +170,85 @@ class WordDetailScreen(WAScreen):
         def parse_button_id(cls, button_id: str) -> str:
             return button_id.split(cls.sep)[-1]
 
-    def __init__(self, *, word: Word) -> None:
+    def __init__(
+        self,
+        *,
+        word: Word,
+        updates: AsyncIterator[SectionUpdate] | None = None,
+        deferred: Collection[DeferredSection] = (),
+        chunked: bool = True,
+    ) -> None:
+        """
+        Args:
+            word: The word and whatever details of it are already loaded.
+            updates: Sections still loading, e.g. from a provider's
+                `stream_details_for_word`. Each is filled in as it arrives.
+            deferred: Sections loaded only once they're expanded, scrolled
+                into view or jumped to.
+            chunked: Mount a screenful of each list straight away and the
+                rest a chunk per frame, rather than all before showing.
+        """
         super().__init__()
-        self._word = word
         self._active_sections: dict[str, Collapsible] = {}
+        self._inputs: dict[str, _SectionInputs] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._chunked = chunked
+        self._unmounted: dict[str, tuple[Collapsible, Iterator[Widget]]] = {}
+        self._generation = 0
+        """Counts words shown, loading one stops once it's not the last."""
+        self._set_word(word, updates, deferred)
+
+    def _set_word(
+        self,
+        word: Word,
+        updates: AsyncIterator[SectionUpdate] | None,
+        deferred: Collection[DeferredSection],
+    ) -> None:
+        self._generation += 1
+        self._word = word
+        self._updates = updates
+        self._deferred: dict[DetailSection, DeferredSection] = {
+            d.section: d for d in deferred
+        }
+        self._pending: set[DetailSection] = (
+            set(DetailSection) - set(self._deferred)
+            if updates is not None
+            else set()
+        )
+        self._failed: set[DetailSection] = set()
+        self._notified_unauthorized = False
 
         self.title = f"{self.WA_ICON}  {self._word.word}"
 
+    @classmethod
+    def streaming(
+        cls, word: str, provider: AbstractWordDetailProvider, lazy: bool = True
+    ) -> "WordDetailScreen":
+        """A screen for a word, shown straight away and filled in section by
+        section as the provider loads them.
+
+        Args:
+            word: The word to show.
+            provider: Where the word's details come from.
+            lazy: Leave the provider's costly sections, `LAZY_SECTIONS`, to
+                load only once they're looked at.
+        """
+        if lazy:
+            updates, deferred = provider.lazy_details_for_word(word)
+        else:
+            updates, deferred = provider.stream_details_for_word(word), []
+        return cls(word=Word(word=word), updates=updates, deferred=deferred)
+
+    @property
+    def word(self) -> Word:
+        """The word and whatever details of it have loaded so far."""
+        return self._word
+
+    @property
+    def unloaded(self) -> set[DetailSection]:
+        """Sections still loading, deferred or failed."""
+        return set(self._deferred) | self._pending | self._failed
+
     # Composition
     def _compose_collapsible_grid(
         self,
@@ -137,46 +260,17 @@ class WordDetailScreen(WAScreen):
     ) -> Collapsible | None:
         # Allowed Types and order they are displayed.
         if container.has_value:
-            content: list[Widget] = []
-            column_padding = 3
-            """int: The padding between columns in the ItemGrid."""
-
             # Store map so I don't calculate it multiple times.
             by_type = container.by_type
 
-            for idx, allowed in enumerate(allowed_types):
-                # Don't show *nym section if none exist.
-                if nyms := by_type.get(allowed, []):
-                    longest_word = 0
-
-                    # Label for the section.
-                    content.append(
-                        WALabel(
-                            f"{allowed.title_display} ({len(nyms)}):",
-                            classes="collapsible--pos",
-                            styles="ib",
-                        )
-                    )
-
-                    # Create a list of *nyms and calculate the longest word
-                    # for column padding.
-                    items: list[Widget] = []
-                    for nym in nyms:
-                        if len(nym.text) > longest_word:
-                            longest_word = len(nym.text)
-                        items.append(ClickablePhrase(nym.text))
-                    # Everything goes in an item grid for dynamic layout.
-                    content.append(
-                        ItemGrid(
-                            *items,
-                            min_column_width=longest_word + column_padding,
-                        )
-                    )
-
-                    # Horizontal rule between sections, but not after the
-                    # last section.
-                    if idx != len(allowed_types) - 1:
-                        content.append(Rule())
+            # One grid for every type, it only draws the rows on screen, so
+            # thousands of *nyms cost no more than a screenful.
+            groups = [
+                (allowed.title_display, [n.text for n in by_type[allowed]])
+                for allowed in allowed_types
+                if by_type.get(allowed, [])
+            ]
+            content: list[Widget] = [ClickableGrid(groups)]
 
             con = Collapsible(
                 *content,
@@ -198,78 +292,139 @@ class WordDetailScreen(WAScreen):
         id: str = "",
     ) -> Collapsible | None:
         if container.has_value:
-            labels: list[Widget] = []
-
-            if include_attribution:
-                attr_tooltip = _make_attribution(
-                    *[w.attribution for w in container.details]
-                )
-                if attr_tooltip:
-                    attr_text = hoverable(LEX.ui.label.attribution)
-                    attr = WALabel(
-                        attr_text, classes="collapsible--attribution"
-                    )
-                    attr.tooltip = attr_tooltip
-                    labels.append(attr)
-
-            by_type = container.by_type
-            i = 0
-            keys = sorted(
-                [key for key in by_type.keys()],
-                key=lambda k: k.title_display.lower(),
+            rows = self._list_rows(
+                container=container,
+                section=section,
+                include_attribution=include_attribution,
+            )
+            # Every row is a line at least, a screen's height of them fills
+            # the screen.
+            first = (
+                list(islice(rows, self.app.size.height))
+                if self._chunked
+                else list(rows)
             )
-
-            for part in keys:
-                labels.append(
-                    WALabel(
-                        part.title_display,
-                        classes="collapsible--pos",
-                        separator=": ",
-                        styles="ib",
-                    )
-                )
-                details = by_type.get(part, [])
-                for j, detail in enumerate(details):
-                    horizontal = HorizontalGroup(
-                        Label(f"[b]{j + 1}.[/]"),
-                        ClickableSentence(detail.text, classes="text"),
-                        classes=(
-                            "collapsible--list "
-                            f"collapsible--{section.css_class}"
-                        ),
-                    )
-                    labels.append(horizontal)
-
-                if i < len(keys) - 1:
-                    labels.append(Rule())
-                i += 1
 
             con = Collapsible(
-                *labels,
+                *first,
                 title=section.title,
                 collapsed=False,
                 classes="word-detail--container",
                 id=id,
             )
             self._active_sections[section.key_binding] = con
+            if self._chunked:
+                self._unmounted[section.key_binding] = (con, rows)
             return con
         return None
 
-    def _compose_content(self) -> ComposeResult:
-        all_sections: list[Collapsible] = []
+    def _list_rows(
+        self,
+        *,
+        container: WordDetailContainer,
+        section: WordDetailSection,
+        include_attribution: bool,
+    ) -> Iterator[Widget]:
+        """Rows of a list section, made as they're asked for."""
+        if include_attribution:
+            attr_tooltip = _make_attribution(
+                *[w.attribution for w in container.details]
+            )
+            if attr_tooltip:
+                attr_text = hoverable(LEX.ui.label.attribution)
+                attr = WALabel(attr_text, classes="collapsible--attribution")
+                attr.tooltip = attr_tooltip
+                yield attr
+
+        by_type = container.by_type
+        i = 0
+        keys = sorted(
+            [key for key in by_type.keys()],
+            key=lambda k: k.title_display.lower(),
+        )
 
-        section_callables = [
-            self._compose_information,
-            self._compose_definitions,
-            self._compose_thesaurus,
-            self._compose_related,
-            self._compose_examples,
-            self._compose_phrases,
+        for part in keys:
+            yield WALabel(
+                part.title_display,
+                classes="collapsible--pos",
+                separator=": ",
+                styles="ib",
+            )
+            details = by_type.get(part, [])
+            for j, detail in enumerate(details):
+                yield HorizontalGroup(
+                    Label(f"[b]{j + 1}.[/]"),
+                    ClickableSentence(detail.text, classes="text"),
+                    classes=(
+                        f"collapsible--list collapsible--{section.css_class}"
+                    ),
+                )
+
+            if i < len(keys) - 1:
+                yield Rule()
+            i += 1
+
+    def _section_composers(
+        self,
+    ) -> list[tuple[WordDetailSection, Callable[[], Collapsible | None]]]:
+        """Sections, in display order, and what composes each."""
+        return [
+            (InformationSection, self._compose_information),
+            (DefinitionSection, self._compose_definitions),
+            (ThesaurusSection, self._compose_thesaurus),
+            (RelatedSection, self._compose_related),
+            (ExampleSection, self._compose_examples),
+            (PhraseSection, self._compose_phrases),
         ]
 
-        for sc in section_callables:
-            if section := sc():
-                all_sections.append(section)
+    def _compose_section(
+        self, section: WordDetailSection, sc: Callable[[], Collapsible | None]
+    ) -> Collapsible | None:
+        """A section with its details, or a stand in while they are loading
+        or if they failed to."""
+        self._inputs[section.id] = self._section_inputs(section)
+        if con := sc():
+            return con
+
+        sources = SECTION_SOURCES[section.id]
+        deferred = bool(self._deferred.keys() & set(sources))
+        if deferred or self._pending.intersection(sources):
+            text = LEX.screen.word_details.loading
+        elif self._failed.intersection(sources):
+            text = LEX.screen.word_details.section_failed
+        else:
+            return None
+
+        con = Collapsible(
+            WALabel(text, classes="collapsible--status", styles="i"),
+            title=section.title,
+            collapsed=deferred,
+            classes="word-detail--container",
+            id=section.id,
+        )
+        con.set_class(deferred, "-deferred")
+        self._active_sections[section.key_binding] = con
+        return con
+
+    def _section_inputs(self, section: WordDetailSection) -> _SectionInputs:
+        sources = SECTION_SOURCES[section.id]
+        return _SectionInputs(
+            # The information section shows the word itself.
+            word=self._word.word if section is InformationSection else "",
+            values=tuple(
+                getattr(self._word, source.value) for source in sources
+            ),
+            deferred=self._deferred.keys() & set(sources),
+            pending=self._pending.intersection(sources),
+            failed=self._failed.intersection(sources),
+        )
+
+    def _compose_content(self) -> ComposeResult:
+        all_sections: list[Collapsible] = []
+
+        for section, sc in self._section_composers():
+            if con := self._compose_section(section, sc):
+                all_sections.append(con)
 
         yield VerticalScroll(*all_sections, classes="word-detail--content")
 
@@ -355,6 +510,16 @@ class WordDetailScreen(WAScreen):
                     )
                 )
 
+        sources = SECTION_SOURCES[InformationSection.id]
+        if self._pending.intersection(sources):
+            elements.append(
+                WALabel(
+                    LEX.screen.word_details.loading,
+                    classes="collapsible--status mt-1",
+                    styles="i",
+                )
+            )
+
         con = Collapsible(
             *elements,
             title=InformationSection.title,
@@ -476,10 +641,196 @@ class WordDetailScreen(WAScreen):
             id=ThesaurusSection.id,
         )
 
-    def _wa_scroll_to(self, *, collapsible: Collapsible) -> None:
+    # Loading
+    def _handle_failure(self, e: Exception) -> None:
+        if type(e) is Unauthorized:
+            # Every section fails alike, tell the user once.
+            if not self._notified_unauthorized:
+                self._notified_unauthorized = True
+                self.app.notify(
+                    LEX.screen.quick_search.failure_auth,
+                    title=LEX.ui.label.error,
+                    timeout=self.app.NOTIFICATION_TIMEOUT,
+                    severity="error",
+                )
+        elif isinstance(e, CircuitOpen):
+            # The app tells the user once when the source stops answering.
+            self.log.warning(e)
+        else:
+            self.log.error(e)
+
+    @work(group="sections")
+    async def _load_sections(
+        self,
+        updates: AsyncIterator[SectionUpdate],
+        sections: Collection[DetailSection],
+    ) -> None:
+        # Left to stop by itself once another word is shown, rather than
+        # cancelled, which could leave a section half replaced.
+        generation = self._generation
+        with (
+            request_deadline(self._LOAD_BUDGET),
+            request_priority(Priority.VISIBLE),
+        ):
+            async for update in updates:
+                if generation != self._generation:
+                    return
+                self._pending.discard(update.section)
+                if update.error is not None:
+                    self._failed.add(update.section)
+                    self._handle_failure(update.error)
+                elif update.value is not None:
+                    self._word = self._word.model_copy(
+                        update={update.section.value: update.value}
+                    )
+                await self._refresh_sections(update.section)
+
+        # Sections the provider doesn't load are no longer loading either.
+        if generation != self._generation:
+            return
+        for section in self._pending.intersection(sections):
+            self._pending.discard(section)
+            await self._refresh_sections(section)
+
+    def _load_deferred(self, section: WordDetailSection) -> None:
+        """Start loading the deferred details a section is made from."""
+        for source in SECTION_SOURCES[section.id]:
+            if (deferred := self._deferred.pop(source, None)) is None:
+                continue
+            self._pending.add(source)
+            self._load_sections(deferred.load(), (source,))
+
+    @work(group="chunks", exclusive=True)
+    async def _mount_chunks(self) -> None:
+        """Mount the rows left out of long lists, a chunk per frame."""
+        while self._unmounted:
+            async with self._refresh_lock:
+                key, (con, rows) = next(iter(self._unmounted.items()))
+                # Left alone if it's been removed, e.g. closing the app.
+                contents = con.query(Collapsible.Contents)
+                chunk = list(islice(rows, self._CHUNK_ROWS))
+                if chunk and contents:
+                    await contents.first().mount_all(chunk)
+                if len(chunk) < self._CHUNK_ROWS or not contents:
+                    del self._unmounted[key]
+            await asyncio.sleep(self._CHUNK_INTERVAL)
+
+    def _mount_chunks_soon(self) -> None:
+        if self._unmounted:
+            self._mount_chunks()
+
+    async def _mount_rest_above(self, collapsible: Collapsible) -> None:
+        """Mount every row of the lists above a section, so it's where it
+        will stay once they're done."""
+        async with self._refresh_lock:
+            for section, _ in self._section_composers():
+                if section.id == collapsible.id:
+                    break
+                if unmounted := self._unmounted.pop(section.key_binding, None):
+                    con, rows = unmounted
+                    await con.query_one(Collapsible.Contents).mount_all(rows)
+
+    def _load_visible(self) -> None:
+        """Start loading deferred sections scrolled into view."""
+        # Everything is in view until the sections loading push the rest
+        # down, wait for them.
+        if not self._deferred or self._pending:
+            return
+        content = self.query_one(".word-detail--content", VerticalScroll)
+        window = content.window_region
+        for section, _ in self._section_composers():
+            con = self._active_sections.get(section.key_binding, None)
+            if (
+                con is not None
+                and con.has_class("-deferred")
+                and window.overlaps(con.virtual_region)
+            ):
+                self._load_deferred(section)
+
+    async def _refresh_sections(self, source: DetailSection) -> None:
+        """Recompose the sections made from a detail section, in place."""
+        async with self._refresh_lock:
+            await self._recompose_sections(source)
+        self.call_after_refresh(self._load_visible)
+
+    async def _recompose_sections(self, source: DetailSection) -> None:
+        changed: list[str] = []
+        for section, _ in self._section_composers():
+            if source not in SECTION_SOURCES[section.id]:
+                continue
+            if self._inputs.get(section.id) != self._section_inputs(section):
+                changed.append(section.id)
+            elif con := self._active_sections.get(section.key_binding):
+                # The last word's, and the same as this one's.
+                con.remove_class("-stale")
+        await self._replace_sections(changed, keep_collapsed=True)
+
+    async def _replace_sections(
+        self, ids: Collection[str], keep_collapsed: bool
+    ) -> None:
+        """Compose sections again, in place.
+
+        Args:
+            ids: Sections to compose.
+            keep_collapsed: Collapse those that were, rather than opening
+                them all.
+        """
+        content = self.query_one(".word-detail--content", VerticalScroll)
+        composers = self._section_composers()
+
+        for idx, (section, sc) in enumerate(composers):
+            if section.id not in ids:
+                continue
+
+            old = self._active_sections.pop(section.key_binding, None)
+            self._inputs.pop(section.id, None)
+            self._unmounted.pop(section.key_binding, None)
+            if old is not None:
+                # Removal waits on the section's widgets, cancelling this,
+                # closing the screen, mustn't cancel them.
+                await asyncio.shield(old.remove())
+            new = self._compose_section(section, sc)
+            if new is not None:
+                # A deferred section opens once loaded, like any other.
+                if (
+                    keep_collapsed
+                    and old is not None
+                    and not old.has_class("-deferred")
+                ):
+                    new.collapsed = old.collapsed
+                before = next(
+                    (
+                        self._active_sections[later.key_binding]
+                        for later, _ in composers[idx + 1 :]
+                        if later.key_binding in self._active_sections
+                    ),
+                    None,
+                )
+                await content.mount(new, before=before)
+
+            if not self.is_running:
+                # Closing, its widgets are going, the sidebar's too.
+                return
+            button_id = self.SidebarButtonManager.make_button_id(
+                section.key_binding
+            )
+            button = self.query_one(f"#{button_id}", Button)
+            button.disabled = new is None
+            button.tooltip = None if new is None else section.desc
+
+        self._mount_chunks_soon()
+
+    async def _wa_scroll_to(self, *, collapsible: Collapsible) -> None:
         if collapsible.collapsed:
             collapsible.collapsed = False
-        self.scroll_to_widget(collapsible, top=True)
+        if self._unmounted:
+            await self._mount_rest_above(collapsible)
+            # Scrolled to once the rows just mounted are laid out.
+            self.call_after_refresh(
+                self.scroll_to_widget, collapsible, top=True
+            )
+        else:
+            self.scroll_to_widget(collapsible, top=True)
 
     def compose(self) -> ComposeResult:
         yield from self._compose_content()
@@ -491,12 +842,95 @@ class WordDetailScreen(WAScreen):
 
         yield Footer()
 
+    def _start_loading(self) -> None:
+        if self._updates is not None:
+            self._load_sections(self._updates, set(self._pending))
+            self._updates = None
+        self.call_after_refresh(self._load_visible)
+        self._mount_chunks_soon()
+
+    def show_word(
+        self,
+        word: Word,
+        updates: AsyncIterator[SectionUpdate] | None = None,
+        deferred: Collection[DeferredSection] = (),
+    ) -> None:
+        """Show another word on this screen, as if it were a new one.
+
+        Takes the same details a new screen would. Sections made from the
+        same details as before are left as they are, the others are
+        composed again, all in a single update.
+        """
+        self.workers.cancel_group(self, "chunks")
+        self._set_word(word, updates, deferred)
+        self._show_word()
+
+    @work(group="sections")
+    async def _show_word(self) -> None:
+        content = self.query_one(".word-detail--content", VerticalScroll)
+        async with self._refresh_lock:
+            changed: list[str] = []
+            stale: list[Collapsible] = []
+            for section, _ in self._section_composers():
+                inputs = self._section_inputs(section)
+                shown = self._inputs.get(section.id, None)
+                con = self._active_sections.get(section.key_binding, None)
+                if shown == inputs:
+                    continue
+                if (
+                    con is not None
+                    and shown is not None
+                    and shown.loaded
+                    and shown.word == inputs.word
+                    and inputs.pending
+                ):
+                    # Left showing the last word's details until this one's
+                    # arrive, they may well be the same.
+                    stale.append(con)
+                    continue
+                changed.append(section.id)
+            with self.app.batch_update():
+                await self._replace_sections(changed, keep_collapsed=False)
+                for con in self._active_sections.values():
+                    con.collapsed = con.has_class("-deferred")
+                content.scroll_home(animate=False)
+        self._start_loading()
+        # Only marked if they're still loading by then, most details come
+        # from the cache well before, and marking restyles the section.
+        self.set_timer(
+            self._STALE_DELAY,
+            partial(self._mark_stale, stale, self._generation),
+        )
+
+    def _mark_stale(self, stale: list[Collapsible], generation: int) -> None:
+        if generation != self._generation:
+            return
+        for section, _ in self._section_composers():
+            con = self._active_sections.get(section.key_binding, None)
+            if con in stale and self._section_inputs(section).pending:
+                con.add_class("-stale")
+
+    def on_mount(self) -> None:
+        content = self.query_one(".word-detail--content", VerticalScroll)
+        self.watch(content, "scroll_y", self._load_visible, init=False)
+        self._start_loading()
+
     # Action Methods
+    def action_back(self) -> None:
+        self.app.history.back()
+
     def action_close_all_sections(self) -> None:
         for section in self._active_sections.values():
             section.collapsed = True
 
     # Event Listeners
+    @on(Collapsible.Expanded)
+    def on_section_expanded(self, event: Collapsible.Expanded) -> None:
+        if event.collapsible.has_class("-deferred"):
+            for section, _ in self._section_composers():
+                if section.id == event.collapsible.id:
+                    self._load_deferred(section)
+
     @on(ClickableText.TextClicked)
     async def on_word_click(self, event: ClickableText.TextClicked) -> None:
         if event.word.lower() == self._word.word.lower():
@@ -508,35 +942,24 @@ class WordDetailScreen(WAScreen):
             )
             return None
         if event.click.button == 1:
-
-            def _on_failure(e: Exception) -> None:
-                if type(e) is Unauthorized:
-                    self.screen.app.notify(
-                        LEX.screen.quick_search.failure_auth,
-                        title=LEX.ui.label.error,
-                        timeout=self.screen.app.NOTIFICATION_TIMEOUT,
-                        severity="error",
-                    )
-                else:
-                    raise e
-                return None
-
-            if details := (
-                await self.app.ctx.deps.detail_provider.get_details_for_word(
-                    event.word.lower(), _on_failure
-                )
-            ):
-                self.app.push_screen(WordDetailScreen(word=details))
+            self.app.history.visit(event.word.lower())
         elif event.click.button == 2:
             pyperclip.copy(event.word)
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    @on(ClickableText.TextHovered)
+    def on_word_hover(self, event: ClickableText.TextHovered) -> None:
+        word = event.word.lower() if event.word else None
+        if word == self._word.word.lower():
+            word = None
+        self.app.prefetcher.attend(word)
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         id_ = event.control.id or ""
         key_bind = self.SidebarButtonManager.parse_button_id(id_)
         if widget := self._active_sections.get(key_bind, None):
-            self._wa_scroll_to(collapsible=widget)
+            await self._wa_scroll_to(collapsible=widget)
 
-    def on_key(self, event: Key) -> None:
+    async def on_key(self, event: Key) -> None:
         # Scroll the section if it's keyboard shortcut is pressed.
         if widget := self._active_sections.get(event.key, None):
-            self._wa_scroll_to(collapsible=widget)
+            await self._wa_scroll_to(collapsible=widget)
@@ -1,4 +1,9 @@
-from .clickables import ClickablePhrase, ClickableSentence, ClickableText
+from .clickables import (
+    ClickableGrid,
+    ClickablePhrase,
+    ClickableSentence,
+    ClickableText,
+)
 from .labels import WALabel
 from .sidebar import Sidebar, SidebarButton
 from .suggestion import (
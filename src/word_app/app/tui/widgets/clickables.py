@@ -1,9 +1,19 @@
+import re
 from abc import abstractmethod
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Hashable, Iterable
 
+from rich.cells import cell_len
+from rich.segment import Segment
+from rich.style import Style
 from textual.app import RenderResult
-from textual.events import MouseDown, MouseEvent
+from textual.events import Click, Leave, MouseDown, MouseEvent, MouseMove
+from textual.geometry import Region, Size
 from textual.message import Message
+from textual.strip import Strip
 from textual.visual import Visual, visualize
 from textual.widget import Widget
 
@@ -14,6 +24,11 @@ class ClickableText(Widget, inherit_bindings=False):
         word: str
         click: MouseEvent
 
+    @dataclass
+    class TextHovered(Message):
+        word: str | None
+        """The word under the mouse, None once it's off every word."""
+
     def __init__(self, text: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._current_click_event: MouseEvent | None = None
@@ -54,39 +69,398 @@ class ClickablePhrase(ClickableText):
         return f"[u]{self._markup(text)}[/]"
 
 
-class ClickableSentence(ClickableText):
+class _ClickableLines(Widget, inherit_bindings=False):
+    """Words drawn line by line, found under the mouse by position.
+
+    Only the lines on screen are rendered, and rendered lines are kept until
+    the layout, style or hovered word changes. Posts
+    `ClickableText.TextClicked` like the other clickables, and
+    `ClickableText.TextHovered` as the mouse moves onto and off words.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._hover: Hashable | None = None
+        self._height = 0
+        self._layout_width = -1
+        self._strips: dict[int, Strip] = {}
+        self._styles: dict[str, Style] = {}
+
+    @abstractmethod
+    def _layout(self, width: int) -> int:
+        """Lay the words out over a width, returning the number of lines."""
+
+    @abstractmethod
+    def _lines_of(self, hover: Hashable) -> Iterable[int]:
+        """Lines a hovered word is drawn on."""
+
+    @abstractmethod
+    def _render_line(self, y: int, width: int) -> list[Segment]:
+        """Segments of a line, at most `width` cells long."""
+
+    @abstractmethod
+    def _word_at(self, x: int, y: int) -> tuple[Hashable, str] | None:
+        """The word at a point of the content, and what identifies it for
+        hovering, if there's one."""
+
+    def _style(self, component: str = "") -> Style:
+        """The widget's style, with a component's on top if given."""
+        if (style := self._styles.get(component, None)) is None:
+            style = self.rich_style
+            if component:
+                style += self.get_component_rich_style(component)
+            self._styles[component] = style
+        return style
+
+    def _relayout(self, width: int) -> int:
+        if width != self._layout_width:
+            self._layout_width = width
+            self._strips.clear()
+            self._hover = None
+            self._height = self._layout(width)
+        return self._height
+
+    def _set_hover(self, hover: Hashable | None, word: str | None) -> None:
+        if hover == self._hover:
+            return
+        self.post_message(ClickableText.TextHovered(word=word))
+        lines: set[int] = set()
+        for h in (self._hover, hover):
+            if h is not None:
+                lines.update(self._lines_of(h))
+        self._hover = hover
+        for line in lines:
+            self._strips.pop(line, None)
+            self.refresh(Region(0, line, self.size.width, 1))
+
+    def get_content_height(
+        self, container: Size, viewport: Size, width: int
+    ) -> int:
+        return self._relayout(width)
+
+    def notify_style_update(self) -> None:
+        super().notify_style_update()
+        self._strips.clear()
+        self._styles.clear()
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        height = self._relayout(width)
+        if (strip := self._strips.get(y, None)) is not None:
+            return strip
+        if y >= height:
+            return Strip.blank(width, self._style())
+        strip = Strip(self._render_line(y, width)).adjust_cell_length(
+            width, self._style()
+        )
+        self._strips[y] = strip
+        return strip
+
+    # Event Listeners
+    def on_click(self, event: Click) -> None:
+        if (offset := event.get_content_offset(self)) is None:
+            return
+        self._relayout(self.size.width)
+        if found := self._word_at(offset.x, offset.y):
+            self.post_message(
+                ClickableText.TextClicked(word=found[1], click=event)
+            )
+
+    def on_leave(self, event: Leave) -> None:
+        self._set_hover(None, None)
+
+    def on_mouse_move(self, event: MouseMove) -> None:
+        self._relayout(self.size.width)
+        if (offset := event.get_content_offset(self)) is not None and (
+            found := self._word_at(offset.x, offset.y)
+        ):
+            self._set_hover(*found)
+        else:
+            self._set_hover(None, None)
+
+
+_WORD = re.compile(r"[^\W\d_]+(?:[-'’.][^\W\d_]+)*")
+"""Letters, joined by hyphens, apostrophes or dots, e.g. 'well-known',
+'don't' or 'e.g'. Quotes and punctuation around a word are left out."""
+
+_TOKEN = re.compile(r"\S+")
+
+
+class ClickableSentence(_ClickableLines):
+    """A sentence, every word of which can be clicked.
+
+    The sentence is wrapped and drawn as is, no markup, with the offsets of
+    its words kept in two arrays. A click is mapped to an offset by its
+    position, then to a word with a binary search.
+    """
+
+    COMPONENT_CLASSES = {
+        "clickable-sentence--word",
+        "clickable-sentence--word-hover",
+    }
+
     DEFAULT_CSS = """
     ClickableSentence {
         height: auto;
         width: auto;
+        text-style: underline;
+
+        & > .clickable-sentence--word {
+            color: $link-color;
+            background: $link-background;
+            text-style: $link-style;
+        }
+        & > .clickable-sentence--word-hover {
+            color: $link-color-hover;
+            background: $link-background-hover;
+            text-style: $link-style-hover;
+        }
     }
     """
 
-    def _make_clickable(self, text: str) -> str:
-        def _for_word(word: str) -> str:
-            if not word:
-                return word
+    def __init__(self, text: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._text = " ".join(text.split())
+        self._starts = array("i")
+        self._ends = array("i")
+        for m in _WORD.finditer(self._text):
+            self._starts.append(m.start())
+            self._ends.append(m.end())
+        self._line_starts = array("i")
+        """Offset each line starts at, lines ending where the next starts
+        or, for the last, at the end of the text."""
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def _layout(self, width: int) -> int:
+        width = max(width, 1)
+        self._line_starts = array("i", [0])
+        used = 0
+        for m in _TOKEN.finditer(self._text):
+            start, token = m.start(), m[0]
+            size = cell_len(token)
+            if used and used + 1 + size > width:
+                self._line_starts.append(start)
+                used = 0
+            elif used:
+                used += 1
+            if used + size <= width:
+                used += size
+                continue
+            # Break tokens too long for a line anywhere, by the cells of each
+            # character.
+            for offset in range(start, m.end()):
+                cells = cell_len(self._text[offset])
+                if used and used + cells > width:
+                    self._line_starts.append(offset)
+                    used = 0
+                used += cells
+        return len(self._line_starts) if self._text else 0
+
+    def _line_span(self, y: int) -> tuple[int, int]:
+        start = self._line_starts[y]
+        if y + 1 < len(self._line_starts):
+            end = self._line_starts[y + 1]
+        else:
+            end = len(self._text)
+        return start, end
+
+    def _lines_of(self, hover: Hashable) -> Iterable[int]:
+        assert isinstance(hover, int)
+        first = bisect_right(self._line_starts, self._starts[hover]) - 1
+        last = bisect_right(self._line_starts, self._ends[hover] - 1) - 1
+        return range(first, last + 1)
+
+    def _render_line(self, y: int, width: int) -> list[Segment]:
+        base = self._style()
+        word_style = self._style("clickable-sentence--word")
+        hover_style = self._style("clickable-sentence--word-hover")
+
+        start, end = self._line_span(y)
+        segments: list[Segment] = []
+        position = start
+        i = max(bisect_right(self._starts, start) - 1, 0)
+        while i < len(self._starts) and self._starts[i] < end:
+            word_start = max(self._starts[i], start)
+            word_end = min(self._ends[i], end)
+            if word_end > position:
+                if word_start > position:
+                    segments.append(
+                        Segment(self._text[position:word_start], base)
+                    )
+                style = hover_style if self._hover == i else word_style
+                segments.append(Segment(self._text[word_start:word_end], style))
+                position = word_end
+            i += 1
+        if position < end:
+            segments.append(Segment(self._text[position:end], base))
+        # Drop the space a line was wrapped at.
+        if segments and segments[-1].text.endswith(" "):
+            last = segments[-1]
+            segments[-1] = Segment(last.text.rstrip(" "), last.style)
+        return segments
+
+    def _word_at(self, x: int, y: int) -> tuple[int, str] | None:
+        if not 0 <= y < len(self._line_starts) or x < 0:
+            return None
+        start, end = self._line_span(y)
+        offset = start
+        cells = 0
+        while offset < end and cells + cell_len(self._text[offset]) <= x:
+            cells += cell_len(self._text[offset])
+            offset += 1
+        if offset >= end:
+            return None
+        i = bisect_right(self._starts, offset) - 1
+        if i < 0 or offset >= self._ends[i]:
+            return None
+        return i, self._text[self._starts[i] : self._ends[i]]
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        return cell_len(self._text)
+
+
+class _LineKind(Enum):
+    BLANK = auto()
+    HEADER = auto()
+    ROW = auto()
+    RULE = auto()
+
 
-            allowed_non_alpha = {"-", ".", ";", ":", ","}
+@dataclass(frozen=True)
+class _GridLine:
+    kind: _LineKind
+    group: int = 0
+    start: int = 0
+    """Index, in its group, of the row's first word."""
+
+
+class ClickableGrid(_ClickableLines):
+    """Groups of clickable words, each under a header, laid out in columns.
+
+    One widget however many words there are, drawn line by line, so only the
+    lines on screen are ever rendered.
+    """
+
+    COMPONENT_CLASSES = {
+        "clickable-grid--header",
+        "clickable-grid--rule",
+        "clickable-grid--word",
+        "clickable-grid--word-hover",
+    }
+
+    DEFAULT_CSS = """
+    ClickableGrid {
+        height: auto;
+
+        & > .clickable-grid--header {
+            text-style: bold italic;
+        }
+        & > .clickable-grid--rule {
+            color: $secondary;
+        }
+        & > .clickable-grid--word {
+            color: $link-color;
+            background: $link-background;
+            text-style: $link-style;
+        }
+        & > .clickable-grid--word-hover {
+            color: $link-color-hover;
+            background: $link-background-hover;
+            text-style: $link-style-hover;
+        }
+    }
+    """
+
+    COLUMN_PADDING: int = 3
+    """Columns between the longest word of a group and the next column."""
+
+    INDENT: int = 2
+    """Columns rows of words are indented by."""
+
+    def __init__(
+        self, groups: list[tuple[str, list[str]]], *args, **kwargs
+    ) -> None:
+        """
+        Args:
+            groups: Headers and their words. Groups without words are left
+                out.
+        """
+        super().__init__(*args, **kwargs)
+        self._groups = [(header, words) for header, words in groups if words]
+        self._widths = [
+            max(map(cell_len, words)) + self.COLUMN_PADDING
+            for _, words in self._groups
+        ]
+        self._columns: list[tuple[int, int]] = []
+        """Number and width of the columns of each group."""
+        self._lines: list[_GridLine] = []
 
-            not_alphas: set[str] = set()
-            for character in word:
-                if not character.isalpha():
-                    not_alphas.add(character)
+    def _layout(self, width: int) -> int:
+        available = max(width - self.INDENT, 1)
+        self._columns = []
+        self._lines = []
+        for group, (_, words) in enumerate(self._groups):
+            count = max(available // self._widths[group], 1)
+            self._columns.append((count, max(available // count, 1)))
+            if group:
+                self._lines += [
+                    _GridLine(_LineKind.BLANK),
+                    _GridLine(_LineKind.RULE),
+                    _GridLine(_LineKind.BLANK),
+                ]
+            self._lines.append(_GridLine(_LineKind.HEADER, group))
+            self._lines += [
+                _GridLine(_LineKind.ROW, group, start)
+                for start in range(0, len(words), count)
+            ]
+        return len(self._lines)
 
-            if (not not_alphas) or (
-                not_alphas and not_alphas - allowed_non_alpha == set()
-            ):
-                w = word[0:-1] if word[-1] in allowed_non_alpha else word
-                lc = word[-1] if word[-1] in allowed_non_alpha else ""
-                return self._markup(w, lc)
+    def _lines_of(self, hover: Hashable) -> Iterable[int]:
+        assert isinstance(hover, tuple)
+        return (hover[0],)
 
-            return word
+    def _render_line(self, y: int, width: int) -> list[Segment]:
+        base = self._style()
+        line = self._lines[y]
+        if line.kind is _LineKind.HEADER:
+            header, words = self._groups[line.group]
+            style = self._style("clickable-grid--header")
+            return [Segment(f"{header} ({len(words)}):", style)]
+        if line.kind is _LineKind.RULE:
+            style = self._style("clickable-grid--rule")
+            return [Segment("─" * width, style)]
+        if line.kind is _LineKind.BLANK:
+            return []
 
-        words = text.split(" ")
-        new_words: list[str] = []
-        for word in words:
-            new_words.append(_for_word(word))
+        word_style = self._style("clickable-grid--word")
+        hover_style = self._style("clickable-grid--word-hover")
+        count, column_width = self._columns[line.group]
+        words = self._groups[line.group][1]
+        segments = [Segment(" " * self.INDENT, base)]
+        for column, word in enumerate(words[line.start : line.start + count]):
+            hovered = self._hover == (y, column)
+            segments.append(
+                Segment(word, hover_style if hovered else word_style)
+            )
+            segments.append(
+                Segment(" " * max(column_width - cell_len(word), 0), base)
+            )
+        return segments
 
-        new_sent = " ".join(new_words)
-        return f"[u]{new_sent}[/]"
+    def _word_at(self, x: int, y: int) -> tuple[tuple[int, int], str] | None:
+        if not 0 <= y < len(self._lines):
+            return None
+        if (line := self._lines[y]).kind is not _LineKind.ROW:
+            return None
+        count, width = self._columns[line.group]
+        column, offset = divmod(x - self.INDENT, width)
+        if x < self.INDENT or column >= count:
+            return None
+        words = self._groups[line.group][1]
+        if (index := line.start + column) >= len(words):
+            return None
+        word = words[index]
+        return ((y, column), word) if offset < cell_len(word) else None
@@ -0,0 +1,408 @@
+"""Benchmarks, run with `python -m word_app.dev.benchmarks [name ...]`.
+
+Without names, every benchmark is run.
+"""
+
+import asyncio
+import sys
+import timeit
+from time import perf_counter
+from typing import Any, Callable
+
+import httpx
+
+BENCHMARKS: dict[str, Callable[[], None]] = {}
+
+
+def benchmark(func: Callable[[], None]) -> Callable[[], None]:
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def _per_call(func: Callable[[], object], number: int = 200) -> float:
+    """Best time, in seconds, of a single call."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def _report(label: str, seconds: float, note: str = "") -> None:
+    print(f"  {label:<32} {seconds * 1_000_000:>12.1f} us  {note}")
+
+
+def _time_datamuse_words(like: str, queries: list[str]) -> None:
+    """Time Datamuse's `/words` for each query, stopping at a failure.
+
+    Args:
+        like: The `get_words` argument to pass queries as.
+        queries: Queries to time.
+    """
+    from word_app.infra.factories import http_client_factory
+    from word_app.lib.datamuse.client import DEFAULT_API_CONF, DatamuseApiClient
+    from word_app.lib.datamuse.exceptions import DatamuseError
+
+    async def _remote() -> None:
+        client = DatamuseApiClient(
+            client=http_client_factory(retry_total=0), conf=DEFAULT_API_CONF
+        )
+        try:
+            for query in queries:
+                start = perf_counter()
+                kwargs: dict[str, Any] = {like: query}
+                try:
+                    words = [w async for w in client.get_words(**kwargs)]
+                except (DatamuseError, httpx.HTTPError) as e:
+                    seconds = perf_counter() - start
+                    _report(f"remote, {query}", seconds, f"failed, {e!r}")
+                    return
+                seconds = perf_counter() - start
+                _report(f"remote, {query}", seconds, f"{len(words)}")
+        finally:
+            await client.clean()
+
+    asyncio.run(_remote())
+
+
+@benchmark
+def request_params() -> None:
+    """Building a Wordnik request, compiled against the reflective path."""
+    from copy import deepcopy
+    from dataclasses import fields
+
+    from word_app.lib._shr.models import Param
+    from word_app.lib.wordnik.client import DEFAULT_API_CONF, WordnikApiClient
+    from word_app.lib.wordnik.endpoints import (
+        DefinitionsEndpoint,
+        WordnikEndpoint,
+    )
+
+    conf = DEFAULT_API_CONF(api_key="key")
+    client = WordnikApiClient(conf=conf, client=httpx.AsyncClient())
+    endpoint = DefinitionsEndpoint()
+
+    def _reflective(endpoint: WordnikEndpoint) -> tuple[str, dict]:
+        ep = deepcopy(endpoint)
+        ep.api_key.value = conf.api_key
+        params: dict = {}
+        for _field in fields(ep):
+            value = getattr(ep, _field.name)
+            if issubclass(value.__class__, Param):
+                if _ := value.value:
+                    params |= value.as_dict
+        location = ep._endpoint.format(
+            type=ep._endpoint_type, purpose=ep._endpoint_purpose, word="cat"
+        )
+        return f"{conf.root}/{location}", params
+
+    def _compiled(endpoint: WordnikEndpoint) -> tuple[str, dict]:
+        return (
+            conf.full_path("cat", endpoint),
+            endpoint.params | client._auth_params,
+        )
+
+    assert _reflective(endpoint) == _compiled(endpoint)
+    _report("reflective", _per_call(lambda: _reflective(endpoint), 2_000))
+    _report("compiled", _per_call(lambda: _compiled(endpoint), 2_000))
+
+
+@benchmark
+def sounds_like() -> None:
+    """Local phonetic index against Datamuse's `/words?sl=`."""
+    from word_app.lib.lexicon.phonetic import PhoneticIndex
+    from word_app.lib.lexicon.wordlist import default_wordlist
+
+    queries = ["jirafe", "nite", "elefant", "definately", "zzxq"]
+
+    start = perf_counter()
+    index = PhoneticIndex(default_wordlist())
+    _report("local, build index", perf_counter() - start)
+    for query in queries:
+        seconds = _per_call(lambda: index.match(query))
+        _report(f"local, {query}", seconds, f"{index.match(query)[0][0]}")
+
+    _time_datamuse_words("sounds_like", queries)
+
+
+@benchmark
+def spelled_like() -> None:
+    """Local wildcard index against Datamuse's `/words?sp=`."""
+    from word_app.lib.lexicon.wildcard import WildcardIndex
+    from word_app.lib.lexicon.wordlist import default_wordlist
+
+    patterns = ["b?n*a", "t??o", "*ing", "s*e*s", "????????????q"]
+
+    start = perf_counter()
+    index = WildcardIndex(default_wordlist())
+    _report("local, build index", perf_counter() - start)
+    for pattern in patterns:
+        seconds = _per_call(lambda: index.match(pattern))
+        _report(f"local, {pattern}", seconds, f"{len(index.match(pattern))}")
+
+    _time_datamuse_words("spelled_like", patterns)
+
+
+@benchmark
+def wordnik_decode() -> None:
+    """Compiled Wordnik decoders against the library's `deserialize`."""
+    from wordnik.swagger import ApiClient
+
+    from word_app.lib.wordnik._transformer import _deserialize
+
+    related = [
+        {
+            "relationshipType": f"type-{i}",
+            "words": [f"w{j}" for j in range(1000)],
+        }
+        for i in range(12)
+    ]
+    definition = {
+        "word": "cat",
+        "text": "A small carnivorous mammal.",
+        "partOfSpeech": "noun",
+        "score": 1.0,
+        "citations": [{"cite": "The cat sat.", "source": "Anon"}] * 2,
+        "labels": [{"text": "informal", "type": "register"}],
+        "exampleUses": [{"text": "A cat."}],
+        "relatedWords": [{"relationshipType": "synonym", "words": ["puss"]}],
+        "textProns": [{"raw": "kat", "seq": 0}],
+    }
+    definitions = [definition] * 500
+
+    wordnik = ApiClient(apiKey="")
+    for label, obj, type_name in [
+        ("related, 12 x 1000 words", related, "list[Related]"),
+        ("definitions, 500", definitions, "list[Definition]"),
+    ]:
+        _report(
+            f"{label}, library",
+            _per_call(lambda: wordnik.deserialize(obj, type_name), 5),
+        )
+        _report(
+            f"{label}, compiled",
+            _per_call(lambda: _deserialize(obj, type_name), 5),
+        )
+
+
+@benchmark
+def thesaurus_grid() -> None:
+    """Mounting 6 x 1000 *nyms, as one grid against a widget per *nym."""
+    import tracemalloc
+
+    from textual.app import App
+    from textual.containers import ItemGrid, VerticalScroll
+    from textual.widget import Widget
+
+    from word_app.app.tui.widgets import ClickableGrid, ClickablePhrase
+
+    groups = [
+        (f"type {i}", [f"word{i}x{j}" for j in range(1000)]) for i in range(6)
+    ]
+
+    def _per_nym() -> list[Widget]:
+        return [
+            ItemGrid(
+                *(ClickablePhrase(word) for word in words),
+                min_column_width=len(words[-1]) + 3,
+            )
+            for _, words in groups
+        ]
+
+    def _grid() -> list[Widget]:
+        return [ClickableGrid(groups)]
+
+    async def _mount(make: Callable[[], list[Widget]]) -> None:
+        app: App[None] = App()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await app.mount(VerticalScroll(*make()))
+            await pilot.pause()
+
+    for label, make in [("widget per nym", _per_nym), ("grid", _grid)]:
+        start = perf_counter()
+        asyncio.run(_mount(make))
+        seconds = perf_counter() - start
+        # Traced separately, tracing slows the mount down a lot.
+        tracemalloc.start()
+        asyncio.run(_mount(make))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        _report(label, seconds, f"peak {peak / 1_000_000:.1f} MB")
+
+
+@benchmark
+def definition_list() -> None:
+    """Mounting 500 sentences, drawn as is against marked up per word."""
+    from textual.app import App
+    from textual.containers import VerticalScroll
+    from textual.widget import Widget
+
+    from word_app.app.tui.widgets import ClickableSentence, ClickableText
+
+    class _MarkedUpSentence(ClickableText):
+        """The sentence as it was, a click markup span per word."""
+
+        DEFAULT_CSS = """
+        _MarkedUpSentence {
+            height: auto;
+        }
+        """
+
+        def _make_clickable(self, text: str) -> str:
+            allowed_non_alpha = {"-", ".", ";", ":", ","}
+            words = []
+            for word in text.split(" "):
+                not_alphas = {c for c in word if not c.isalpha()}
+                if word and not not_alphas - allowed_non_alpha:
+                    lc = word[-1] if word[-1] in allowed_non_alpha else ""
+                    word = self._markup(word[: len(word) - len(lc)], lc)
+                words.append(word)
+            return f"[u]{' '.join(words)}[/]"
+
+    sentence = (
+        "A small domesticated carnivorous mammal with soft fur, a short "
+        "snout, and retractable claws, kept as a pet or for catching mice."
+    )
+
+    async def _mount(make: Callable[[str], Widget]) -> None:
+        app: App[None] = App()
+        # Tall enough to render every sentence.
+        async with app.run_test(size=(120, 1_100)) as pilot:
+            widgets = [make(sentence) for _ in range(500)]
+            for widget in widgets:
+                widget.styles.width = "100%"
+            await app.mount(VerticalScroll(*widgets))
+            await pilot.pause()
+
+    for label, make in [
+        ("marked up", _MarkedUpSentence),
+        ("drawn", ClickableSentence),
+    ]:
+        start = perf_counter()
+        asyncio.run(_mount(make))
+        _report(label, perf_counter() - start)
+
+
+@benchmark
+def detail_screen() -> None:
+    """Showing a word of 500 definitions, chunked against all at once."""
+    from textual.app import App
+
+    from word_app.app.tui.screens.word_detail import WordDetailScreen
+    from word_app.data import vo
+    from word_app.data.models import Definition, Definitions, Word
+
+    word = Word(
+        word="cat",
+        definitions=Definitions(
+            definitions=[
+                Definition(
+                    type=vo.Noun,
+                    text="A small domesticated carnivorous mammal.",
+                )
+                for _ in range(500)
+            ]
+        ),
+    )
+
+    async def _show(chunked: bool) -> float:
+        app: App[None] = App()
+        async with app.run_test(size=(120, 40)):
+            start = perf_counter()
+            await app.push_screen(WordDetailScreen(word=word, chunked=chunked))
+            return perf_counter() - start
+
+    for label, chunked in [("all at once", False), ("chunked", True)]:
+        _report(label, asyncio.run(_show(chunked)), "until mounted")
+
+
+@benchmark
+def word_hop() -> None:
+    """Going through 10 words, a new screen each against one in place."""
+    from typing import AsyncGenerator, Collection
+
+    from textual.app import App
+
+    from word_app.app.tui.history import WordHistory
+    from word_app.dev.fake import WordFactory
+    from word_app.services.wdp.base import (
+        AbstractWordDetailProvider,
+        DetailSection,
+        SectionUpdate,
+    )
+
+    details = WordFactory(word="")
+
+    class _Provider(AbstractWordDetailProvider):
+        """Answers at once, as if cached, the same details for any word."""
+
+        async def get_details_for_word(self, word, on_failure=None):
+            return details.model_copy(update={"word": word})
+
+        async def stream_details_for_word(
+            self, word: str, sections: Collection[DetailSection] | None = None
+        ) -> AsyncGenerator[SectionUpdate, None]:
+            for section in self.SECTIONS if sections is None else sections:
+                yield SectionUpdate(
+                    section=section, value=getattr(details, section.value)
+                )
+
+    async def _hop(reuse: bool) -> float:
+        app: App[None] = App()
+        async with app.run_test(size=(120, 40)) as pilot:
+            history = WordHistory(app, _Provider(), reuse=reuse)
+            history.visit("word0")
+            await pilot.pause()
+            start = perf_counter()
+            for i in range(1, 11):
+                history.visit(f"word{i}")
+                await pilot.pause()
+            return (perf_counter() - start) / 10
+
+    for label, reuse in [("new screen", False), ("in place", True)]:
+        _report(label, asyncio.run(_hop(reuse)), "per word")
+
+
+@benchmark
+def hedged_requests() -> None:
+    """Datamuse requests with a slow tail, hedged against not."""
+    import random
+
+    from word_app.lib._shr.hedge import Hedger, LatencyWindow
+    from word_app.lib.datamuse.client import DEFAULT_API_CONF, DatamuseApiClient
+
+    rng = random.Random(0)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # One in twenty answers takes 15 times as long.
+        await asyncio.sleep(0.3 if rng.random() < 0.05 else 0.02)
+        return httpx.Response(200, json=[])
+
+    async def _run(hedger: Hedger | None) -> LatencyWindow:
+        client = DatamuseApiClient(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            conf=DEFAULT_API_CONF,
+            hedger=hedger,
+        )
+        waited = LatencyWindow(200)
+        for i in range(200):
+            start = perf_counter()
+            _ = [s async for s in client.get_suggestions(f"word{i}")]
+            waited.add(perf_counter() - start)
+        await client.clean()
+        return waited
+
+    for label, hedger in [("unhedged", None), ("hedged", Hedger())]:
+        waited = asyncio.run(_run(hedger))
+        for q in (0.5, 0.95, 0.99):
+            _report(f"{label}, p{q * 100:.0f}", waited.percentile(q))
+        if hedger is not None:
+            print(f"  {hedger.report()}")
+
+
+def main(names: list[str]) -> None:
+    for name in names or list(BENCHMARKS):
+        if (func := BENCHMARKS.get(name, None)) is None:
+            raise SystemExit(f"Unknown benchmark, '{name}'.")
+        print(f"{name}: {func.__doc__}")
+        func()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,40 @@
+"""Generate the word list bundled with `word_app.lib.lexicon`.
+
+Requires `wordfreq`, which is not a project dependency. Install it on the side
+and run, `python -m word_app.dev.make_lexicon`.
+"""
+
+import gzip
+import re
+
+from word_app.lib.lexicon.phonetic import metaphone
+from word_app.lib.lexicon.wordlist import DEFAULT_WORDLIST
+
+LANGUAGE = "en"
+SIZE = 70_000
+"""Number of most frequent words considered, before filtering."""
+
+_WORD = re.compile(r"[a-z]+")
+
+
+def _keep(word: str) -> bool:
+    return bool(_WORD.fullmatch(word)) and (len(word) > 1 or word in "ai")
+
+
+def main() -> None:
+    import wordfreq  # type: ignore
+
+    lines = [
+        f"{word}\t{round(wordfreq.zipf_frequency(word, LANGUAGE) * 100)}\t"
+        f"{metaphone(word)}\n"
+        for word in wordfreq.top_n_list(LANGUAGE, SIZE, wordlist="large")
+        if _keep(word)
+    ]
+    DEFAULT_WORDLIST.write_bytes(
+        gzip.compress("".join(lines).encode(), compresslevel=9, mtime=0)
+    )
+    print(f"Wrote {len(lines)} words to {DEFAULT_WORDLIST}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,24 @@ from word_app.app.tui.theme import DarkTheme, LightTheme
 from word_app.data.vo import get_available_data_sources
 from word_app.dev.fake import FakerProvider, fake  # type: ignore
 from word_app.dev.fake_detail_provider import FakeDetailProvider  # type: ignore
+from word_app.infra.cache import TieredCache
+from word_app.infra.cached_wdp import CachedDetailProvider
 from word_app.infra.datamuse.suggestion_provider import (
     DatamuseSearchProvider,
 )
-from word_app.infra.factories import http_client_factory
+from word_app.infra.factories import HttpClientRegistry
+from word_app.infra.lexicon.suggestion_provider import LexiconSearchProvider
 from word_app.infra.worknik.transformers import WnToWaTransformer
 from word_app.infra.worknik.wdp import MultisourceDetailProvider
 from word_app.lib.datamuse.client import DEFAULT_API_CONF as DMC
 from word_app.lib.datamuse.client import DatamuseApiClient
 from word_app.lib.wordnik.client import DEFAULT_API_CONF, WordnikApiClient
 
+SEARCH_CACHE_MAX_SIZE = 500
+SEARCH_CACHE_TTL = 7 * 24 * 60 * 60.0
+DETAIL_CACHE_MAX_SIZE = 100
+DETAIL_CACHE_KEEP_STALE = 365 * 24 * 60 * 60.0
+
 
 def create_dummy_app() -> WordApp:
     path = PathManager()
@@ -26,9 +34,11 @@ def create_dummy_app() -> WordApp:
         dark_theme=DarkTheme,
         data_sources=get_available_data_sources(),
         detail_provider=FakeDetailProvider(faker=fake),
+        http_clients=HttpClientRegistry(),
         light_theme=LightTheme,
         path=path,
-        search_provider_cls=FakerProvider,
+        search_cache=TieredCache(namespace="search"),
+        search_providers=[FakerProvider],
         settings=settings,
     )
 
@@ -39,25 +49,58 @@ def create_real_app() -> WordApp:
         lambda: ApplicationSettings(_env_file=(path.usr / ".env")),  # type: ignore
         ApplicationSettings,
     )
+    wordnik_conf = DEFAULT_API_CONF(
+        api_key=settings.data_sources.wordnik.api_key,
+    )
+    http_clients = HttpClientRegistry(
+        limits={
+            DMC.root: settings.data_sources.datamuse.rate_limit.as_limit(),
+            wordnik_conf.root: (
+                settings.data_sources.wordnik.rate_limit.as_limit()
+            ),
+        },
+        usage_path=path.usage,
+    )
     return create_app(
         dark_theme=DarkTheme,
         data_sources=get_available_data_sources(),
-        detail_provider=MultisourceDetailProvider(
-            datamuse_client=DatamuseApiClient(
-                client=http_client_factory(), conf=DMC
-            ),
-            datamuse_transformer=WnToWaTransformer(),
-            wordnik_client=WordnikApiClient(
-                client=http_client_factory(),
-                conf=DEFAULT_API_CONF(
-                    api_key=settings.data_sources.wordnik.api_key,
+        detail_provider=CachedDetailProvider(
+            provider=MultisourceDetailProvider(
+                datamuse_client=DatamuseApiClient(
+                    client=http_clients.client(DMC.root),
+                    conf=DMC,
+                    breaker=http_clients.breaker(
+                        DMC.root, DatamuseApiClient.circuit_breaker
+                    ),
+                ),
+                datamuse_transformer=WnToWaTransformer(),
+                wordnik_client=WordnikApiClient(
+                    client=http_clients.client(wordnik_conf.root),
+                    conf=wordnik_conf,
+                    breaker=http_clients.breaker(
+                        wordnik_conf.root, WordnikApiClient.circuit_breaker
+                    ),
                 ),
+                wordnik_transformer=WnToWaTransformer(),
             ),
-            wordnik_transformer=WnToWaTransformer(),
+            cache=TieredCache(
+                namespace="details",
+                path=path.cache,
+                maxsize=DETAIL_CACHE_MAX_SIZE,
+                keep_stale=DETAIL_CACHE_KEEP_STALE,
+            ),
+            offline=settings.offline,
         ),
+        http_clients=http_clients,
         light_theme=LightTheme,
         path=path,
-        search_provider_cls=DatamuseSearchProvider,
+        search_cache=TieredCache(
+            namespace="search",
+            path=path.cache,
+            maxsize=SEARCH_CACHE_MAX_SIZE,
+            ttl=SEARCH_CACHE_TTL,
+        ),
+        search_providers=[LexiconSearchProvider, DatamuseSearchProvider],
         settings=settings,
     )
 
@@ -0,0 +1,184 @@
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cachetools import LRUCache
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value and when it stops being fresh."""
+
+    value: Any
+    expires_at: float
+
+    @property
+    def is_expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_size: int = 0
+    disk_size: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TieredCache:
+    """In-memory LRU cache in front of an on-disk SQLite store.
+
+    Values must be JSON serializable. Entries past their TTL are not returned
+    by `get`, but are kept around for `keep_stale` seconds and can still be
+    read with `lookup`.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str,
+        path: Path | None = None,
+        maxsize: int = 256,
+        ttl: float = 86_400.0,
+        keep_stale: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            namespace: Name of the table entries are stored in.
+            path: SQLite database file. No disk tier if not provided.
+            maxsize: Maximum number of entries kept in memory.
+            ttl: Default seconds an entry is fresh for.
+            keep_stale: Seconds an expired entry is kept before being purged.
+        """
+        if not namespace.isidentifier():
+            raise ValueError(f"Invalid cache namespace, '{namespace}'.")
+
+        self.namespace = namespace
+        self.ttl = ttl
+        self.keep_stale = keep_stale
+        self._memory: LRUCache[str, CacheEntry] = LRUCache(maxsize=maxsize)
+        self._stats = CacheStats()
+        self._db: sqlite3.Connection | None = None
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path)
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.namespace} ("
+                "key TEXT PRIMARY KEY, "
+                "value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+            self.purge()
+
+    def _disk_get(self, key: str) -> CacheEntry | None:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            f"SELECT value, expires_at FROM {self.namespace} WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(value=json.loads(row[0]), expires_at=row[1])
+
+    def _disk_set(self, key: str, entry: CacheEntry) -> None:
+        if self._db is None:
+            return None
+        with self._db:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {self.namespace} "
+                "(key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(entry.value), entry.expires_at),
+            )
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit counters and current size of each tier."""
+        self._stats.memory_size = len(self._memory)
+        if self._db is not None:
+            (self._stats.disk_size,) = self._db.execute(
+                f"SELECT COUNT(*) FROM {self.namespace}"
+            ).fetchone()
+        return self._stats
+
+    def _find(self, key: str) -> tuple[CacheEntry | None, bool]:
+        """The entry for a key, and whether it was in memory."""
+        if (entry := self._memory.get(key, None)) is not None:
+            return entry, True
+        if (entry := self._disk_get(key)) is not None:
+            self._memory[key] = entry
+        return entry, False
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Get the entry for a key, fresh or stale, without counting it as a
+        hit or a miss."""
+        return self._find(key)[0]
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Get the entry for a key, fresh or stale."""
+        entry, in_memory = self._find(key)
+        if entry is None:
+            self._stats.misses += 1
+        elif in_memory:
+            self._stats.memory_hits += 1
+        else:
+            self._stats.disk_hits += 1
+        return entry
+
+    def get(self, key: str) -> Any | None:
+        """Get the value for a key, if it's fresh."""
+        entry, in_memory = self._find(key)
+        if entry is None or entry.is_expired:
+            self._stats.misses += 1
+            # Still readable with `lookup` while it's kept stale, from disk
+            # if there's a disk tier to read it back from.
+            if entry is not None and (
+                self._db is not None
+                or entry.expires_at < time.time() - self.keep_stale
+            ):
+                self._memory.pop(key, None)
+            return None
+        if in_memory:
+            self._stats.memory_hits += 1
+        else:
+            self._stats.disk_hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store a value, fresh for `ttl` seconds or the cache's default."""
+        ttl = self.ttl if ttl is None else ttl
+        entry = CacheEntry(value=value, expires_at=time.time() + ttl)
+        self._memory[key] = entry
+        self._disk_set(key, entry)
+
+    def purge(self) -> None:
+        """Remove entries that have been expired for longer than allowed."""
+        cutoff = time.time() - self.keep_stale
+        for key, entry in list(self._memory.items()):
+            if entry.expires_at < cutoff:
+                del self._memory[key]
+        if self._db is not None:
+            with self._db:
+                self._db.execute(
+                    f"DELETE FROM {self.namespace} WHERE expires_at < ?",
+                    (cutoff,),
+                )
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
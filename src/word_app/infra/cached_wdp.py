@@ -0,0 +1,189 @@
+import asyncio
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, Callable, Collection
+
+from word_app.data.models import (
+    Definitions,
+    Etymologies,
+    Examples,
+    FrequencyGraph,
+    Phrases,
+    Syllables,
+    Thesaurus,
+    Word,
+)
+from word_app.infra.cache import TieredCache
+from word_app.lib._shr.retry import request_deadline
+from word_app.lib._shr.schedule import Priority, request_priority
+from word_app.services.wdp.base import (
+    LAZY_SECTIONS,
+    AbstractWordDetailProvider,
+    DeferredSection,
+    DetailSection,
+    SectionUpdate,
+    SectionValue,
+)
+
+_DAY = 24 * 60 * 60.0
+
+_REFRESH_BUDGET: float = 30.0
+"""Seconds a background refresh's requests have, retries included."""
+
+SECTION_TTLS: dict[DetailSection, float] = {
+    DetailSection.DEFINITIONS: 30 * _DAY,
+    DetailSection.ETYMOLOGIES: 90 * _DAY,
+    DetailSection.EXAMPLES: 7 * _DAY,
+    DetailSection.FREQUENCY_GRAPH: 90 * _DAY,
+    DetailSection.PHRASES: 30 * _DAY,
+    DetailSection.SYLLABLES: 90 * _DAY,
+    DetailSection.THESAURUS: 30 * _DAY,
+}
+"""Seconds each section is fresh for. Frequency and syllables hardly ever
+change, examples are sampled from a corpus that grows."""
+
+_SECTION_MODELS: dict[DetailSection, type[SectionValue]] = {
+    DetailSection.DEFINITIONS: Definitions,
+    DetailSection.ETYMOLOGIES: Etymologies,
+    DetailSection.EXAMPLES: Examples,
+    DetailSection.FREQUENCY_GRAPH: FrequencyGraph,
+    DetailSection.PHRASES: Phrases,
+    DetailSection.SYLLABLES: Syllables,
+    DetailSection.THESAURUS: Thesaurus,
+}
+
+
+class DetailsOffline(Exception):
+    """A section isn't cached and the provider is offline."""
+
+
+class CachedDetailProvider(AbstractWordDetailProvider):
+    """Caches another provider's details, section by section.
+
+    Fresh sections are answered from the cache. Expired ones are answered
+    too, stale, while a refresh runs in the background for the next time the
+    word is shown. Only sections not cached at all wait on the provider.
+    Offline, nothing is requested and uncached sections fail with
+    `DetailsOffline`.
+    """
+
+    def __init__(self, *_, **kwargs) -> None:
+        try:
+            provider: AbstractWordDetailProvider = kwargs["provider"]
+            cache: TieredCache = kwargs["cache"]
+        except KeyError as e:
+            raise ValueError(
+                "Missing initialization argument for "
+                f"'{self.__class__.__name__}'."
+            ) from e
+
+        self.offline: bool = kwargs.get("offline", False)
+        self._provider = provider
+        self._cache = cache
+        self._ttls: dict[DetailSection, float] = kwargs.get(
+            "ttls", SECTION_TTLS
+        )
+        self._refreshing: dict[tuple[str, DetailSection], asyncio.Task] = {}
+
+    @staticmethod
+    def _cache_key(word: str, section: DetailSection) -> str:
+        return f"{section.value}:{word}"
+
+    def _store(self, word: str, update: SectionUpdate) -> None:
+        if update.error is not None or update.value is None:
+            return
+        self._cache.set(
+            self._cache_key(word, update.section),
+            update.value.model_dump(mode="json"),
+            ttl=self._ttls.get(update.section, self._cache.ttl),
+        )
+
+    async def _refresh(
+        self, word: str, sections: Collection[DetailSection]
+    ) -> None:
+        try:
+            # Not kept to the deadline of whatever it was started from.
+            with (
+                request_deadline(_REFRESH_BUDGET, inherit=False),
+                request_priority(Priority.WARMUP),
+            ):
+                async with aclosing(
+                    self._provider.stream_details_for_word(word, sections)
+                ) as updates:
+                    async for update in updates:
+                        self._store(word, update)
+        finally:
+            for section in sections:
+                self._refreshing.pop((word, section), None)
+
+    def _refresh_in_background(
+        self, word: str, sections: Collection[DetailSection]
+    ) -> None:
+        # Only the sections of the word not already being refreshed.
+        sections = [s for s in sections if (word, s) not in self._refreshing]
+        if not sections:
+            return
+        task = asyncio.create_task(self._refresh(word, sections))
+        for section in sections:
+            self._refreshing[word, section] = task
+
+    async def clean(self) -> None:
+        for task in set(self._refreshing.values()):
+            task.cancel()
+        self._cache.close()
+        await self._provider.clean()
+
+    async def get_details_for_word(
+        self, word: str, on_failure: Callable[[Exception], None] | None = None
+    ) -> Word | None:
+        values: dict[str, SectionValue | None] = {}
+        async with aclosing(self.stream_details_for_word(word)) as updates:
+            async for update in updates:
+                if update.error is not None:
+                    if on_failure is None:
+                        raise update.error
+                    return on_failure(update.error)
+                values[update.section.value] = update.value
+        return Word.model_validate({"word": word} | values)
+
+    def lazy_details_for_word(
+        self, word: str, deferred: Collection[DetailSection] = LAZY_SECTIONS
+    ) -> tuple[AsyncIterator[SectionUpdate], list[DeferredSection]]:
+        # Cached sections cost nothing, there's no point deferring them.
+        uncached = [
+            section
+            for section in deferred
+            if self._cache.peek(self._cache_key(word, section)) is None
+        ]
+        return super().lazy_details_for_word(word, uncached)
+
+    async def stream_details_for_word(
+        self, word: str, sections: Collection[DetailSection] | None = None
+    ) -> AsyncGenerator[SectionUpdate, None]:
+        wanted = self._provider.SECTIONS if sections is None else sections
+        missing: list[DetailSection] = []
+        stale: list[DetailSection] = []
+
+        for section in self._provider.SECTIONS.intersection(wanted):
+            entry = self._cache.lookup(self._cache_key(word, section))
+            if entry is None:
+                missing.append(section)
+                continue
+            value = _SECTION_MODELS[section].model_validate(entry.value)
+            yield SectionUpdate(section=section, value=value)
+            if entry.is_expired:
+                stale.append(section)
+
+        if self.offline:
+            for section in missing:
+                yield SectionUpdate(section=section, error=DetailsOffline())
+            return
+
+        if stale:
+            self._refresh_in_background(word, stale)
+        if missing:
+            async with aclosing(
+                self._provider.stream_details_for_word(word, missing)
+            ) as updates:
+                async for update in updates:
+                    self._store(word, update)
+                    yield update
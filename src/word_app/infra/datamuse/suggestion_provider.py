@@ -1,77 +1,58 @@
 import asyncio
-from typing import Callable
-
-from cachetools import FIFOCache
-from textual.fuzzy import Matcher
+from typing import AsyncGenerator, Awaitable, Callable, TypeAlias
 
 from word_app.app.tui._models import Hit, Hits
-from word_app.app.tui.screens.quick_search.suggestion_provider import (
-    Provider,
-)
-from word_app.app.tui.screens.word_detail import WordDetailScreen
 from word_app.data.vo import (
     SearchResultType,
     SearchTermType,
 )
-from word_app.infra.factories import http_client_factory
-from word_app.lex import LEX
-from word_app.lib.datamuse._models import DatamuseModel, Suggestion, Word
+from word_app.infra.cache import TieredCache
+from word_app.infra.suggestions import (
+    WordSearchProvider,
+    to_spelled_like_pattern,
+)
+from word_app.lib.datamuse._models import DatamuseModel
 from word_app.lib.datamuse.client import DEFAULT_API_CONF, DatamuseApiClient
 from word_app.lib.datamuse.exceptions import DatamuseError
-from word_app.lib.wordnik.exceptions import Unauthorized
 from word_app.services.search.base import ParseResult
 from word_app.services.search.parsers import RegexSearchTermParser
 
+FetchResult: TypeAlias = tuple[SearchResultType, list[DatamuseModel]]
+"""The result type and Datamuse objects returned by a single fetcher."""
 
-def _min_max_normalize(
-    value: int | float, min: int | float, max: int | float
-) -> float:
-    """https://en.wikipedia.org/wiki/Feature_scaling"""
-    try:
-        return (value - min) / (max - min)
-    except ZeroDivisionError:
-        return 0.0
+Fetcher: TypeAlias = Callable[[str], Awaitable[FetchResult]]
 
 
-class DatamuseSearchProvider(Provider):
+class DatamuseSearchProvider(WordSearchProvider):
     _API_LIMIT: int = 10
-    _CACHE_MAX_SIZE: int = 50
     _MIN_CHARACTERS: int = 3
+    _REFINABLE: frozenset[SearchResultType] = frozenset(
+        {SearchResultType.SUGGESTION}
+    )
+    """Result types whose hits for a query all start with that query."""
     _SCORE_THRESHHOLD: float = 0.01
 
     def __init__(self, *args, **kwargs) -> None:
+        client = kwargs.pop("client", None)
+        cache = kwargs.pop("cache", None)
         super().__init__(*args, **kwargs)
-        self.client: DatamuseApiClient = kwargs.get(
-            "client",
-            DatamuseApiClient(
-                client=http_client_factory(),
+        if client is None:
+            # Share the application's pooled connection to Datamuse, and
+            # its circuit breaker. Searches are waited on as the user
+            # types, so slow requests are hedged.
+            http_clients = self.app.ctx.deps.http_clients  # type: ignore
+            client = DatamuseApiClient(
+                client=http_clients.client(DEFAULT_API_CONF.root),
                 conf=DEFAULT_API_CONF,
-            ),
-        )
-        self._cache: FIFOCache
-
-    def _action(self, word: str):
-        async def __action():
-            def _on_failure(e: Exception) -> None:
-                if type(e) is Unauthorized:
-                    self.screen.app.notify(
-                        LEX.screen.quick_search.failure_auth,
-                        title=LEX.ui.label.error,
-                        timeout=self.screen.app.NOTIFICATION_TIMEOUT,
-                        severity="error",
-                    )
-                else:
-                    raise e
-                return None
-
-            if details := (
-                await self.app.ctx.deps.detail_provider.get_details_for_word(
-                    word, _on_failure
-                )
-            ):
-                self.app.push_screen(WordDetailScreen(word=details))
-
-        return __action
+                breaker=http_clients.breaker(
+                    DEFAULT_API_CONF.root, DatamuseApiClient.circuit_breaker
+                ),
+                hedger=http_clients.hedger(DEFAULT_API_CONF.root),
+            )
+        self.client: DatamuseApiClient = client
+        if cache is None:
+            cache = self.app.ctx.deps.search_cache  # type: ignore
+        self._cache: TieredCache = cache
 
     def _clean_hits(self, hits: list[Hit]) -> list[Hit]:
         """Clean up a list of hits.
@@ -92,42 +73,10 @@ class DatamuseSearchProvider(Provider):
             reverse=True,
         )
 
-    def _make_hit(
-        self,
-        dm: DatamuseModel,
-        sug_type: SearchResultType,
-        matcher: Matcher,
-        highest_score: int | float,
-        lowest_score: int | float,
-    ) -> Hit:
-        score = _min_max_normalize(dm.score, lowest_score, highest_score)
-
-        return Hit(
-            score=score,
-            match_display=matcher.highlight(dm.word),
-            action=self._action(dm.word),
-            text=dm.word,
-            help=f"{sug_type.display} ({round(score, 4)})",
-        )
-
-    def _make_hits(
-        self, query: str, objs: list[DatamuseModel], str: SearchResultType
+    def _datamuse_hits(
+        self, query: str, objs: list[DatamuseModel], srt: SearchResultType
     ) -> list[Hit]:
-        if not objs:
-            return []
-        matcher = self.matcher(query)
-        highest_score = max(objs, key=lambda o: o.score).score
-        lowest_score = min(objs, key=lambda o: o.score).score
-        return [
-            self._make_hit(
-                o,
-                str,
-                matcher,
-                highest_score,
-                lowest_score,
-            )
-            for o in objs
-        ]
+        return self._make_hits(query, [(o.word, o.score) for o in objs], srt)
 
     def _parse_query(self, query: str) -> ParseResult:
         query = query.strip().lower()
@@ -140,112 +89,213 @@ class DatamuseSearchProvider(Provider):
             return ParseResult(type=SearchTermType.UNKNOWN, text=query)
         return result
 
-    async def _fetch(self, query: str, *fetchers: Callable) -> list[list[Hit]]:
-        objs: list[
-            tuple[SearchResultType, list[DatamuseModel]]
-        ] = await asyncio.gather(*[fetcher(query) for fetcher in fetchers])
+    @staticmethod
+    def _cache_key(parse_result: ParseResult) -> str:
+        return f"{parse_result.type.name}:{parse_result.text}"
 
-        results: list[list[Hit]] = []
+    @staticmethod
+    def _dump_results(results: list[FetchResult]) -> list:
+        """Fetch results to a JSON-compat structure for the cache."""
+        return [
+            [srt.value, [[o.word, o.score] for o in objs]]
+            for srt, objs in results
+        ]
 
-        for srt, obj in objs:
-            results.append(self._make_hits(query, obj, srt))
+    @staticmethod
+    def _load_results(raw: list) -> list[FetchResult]:
+        """Fetch results from their cached structure."""
+        return [
+            (
+                SearchResultType(srt),
+                [DatamuseModel(word=word, score=score) for word, score in objs],
+            )
+            for srt, objs in raw
+        ]
 
-        return results
+    async def _fetch(
+        self, query: str, *fetchers: Fetcher
+    ) -> AsyncGenerator[FetchResult | None, None]:
+        """Run fetchers concurrently, yielding results as each one finishes.
 
-    async def _fetch_means_like(
-        self, query: str
-    ) -> tuple[SearchResultType, list[Word]]:
-        words: list[Word] = []
+        Yields:
+            A fetcher's results, or None if that fetcher failed.
+        """
+        tasks = [asyncio.ensure_future(fetcher(query)) for fetcher in fetchers]
         try:
-            async for suggestion in self.client.get_words(
-                means_like=query, limit=self._API_LIMIT
-            ):
-                words.append(suggestion)
-        except DatamuseError:
-            pass
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except DatamuseError:
+                    yield None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _fetchers_for(
+        self, type: SearchTermType
+    ) -> dict[SearchResultType, Fetcher]:
+        fetchers: dict[SearchTermType, dict[SearchResultType, Fetcher]] = {
+            SearchTermType.SUGGEST_SOUNDS_LIKE: {
+                SearchResultType.SUGGESTION: self._fetch_suggestions,
+                SearchResultType.SOUNDS_LIKE: self._fetch_sounds_like,
+            },
+            SearchTermType.SUGGEST_MEANS_LIKE: {
+                SearchResultType.SUGGESTION: self._fetch_suggestions,
+                SearchResultType.MEANS_LIKE: self._fetch_means_like,
+            },
+            SearchTermType.SPELLED_LIKE: {
+                SearchResultType.SPELLED_LIKE: self._fetch_spelled_like,
+            },
+        }
+        return fetchers.get(type, {})
+
+    async def _fetch_means_like(self, query: str) -> FetchResult:
+        words: list[DatamuseModel] = []
+        async for suggestion in self.client.get_words(
+            means_like=query, limit=self._API_LIMIT
+        ):
+            words.append(suggestion)
 
         return SearchResultType.MEANS_LIKE, words
 
-    async def _fetch_sounds_like(
-        self, query: str
-    ) -> tuple[SearchResultType, list[Word]]:
-        words: list[Word] = []
-        try:
-            async for suggestion in self.client.get_words(
-                sounds_like=query, limit=self._API_LIMIT
-            ):
-                words.append(suggestion)
-        except DatamuseError:
-            pass
+    async def _fetch_sounds_like(self, query: str) -> FetchResult:
+        words: list[DatamuseModel] = []
+        async for suggestion in self.client.get_words(
+            sounds_like=query, limit=self._API_LIMIT
+        ):
+            words.append(suggestion)
 
         return SearchResultType.SOUNDS_LIKE, words
 
-    async def _fetch_spelled_like(
-        self, query: str
-    ) -> tuple[SearchResultType, list[Word]]:
-        query = query.replace("*", "#").replace("?", "*").replace("#", "?")
-        words: list[Word] = []
-
-        try:
-            async for suggestion in self.client.get_words(spelled_like=query):
-                words.append(suggestion)
-        except DatamuseError:
-            pass
+    async def _fetch_spelled_like(self, query: str) -> FetchResult:
+        # Spellings are answered offline, see `LexiconSearchProvider`, so
+        # this only tops them up with the most relevant words Datamuse knows.
+        words: list[DatamuseModel] = []
+        async for suggestion in self.client.get_words(
+            spelled_like=to_spelled_like_pattern(query), limit=self._API_LIMIT
+        ):
+            words.append(suggestion)
 
         return SearchResultType.SPELLED_LIKE, words
 
-    async def _fetch_suggestions(
-        self, query: str
-    ) -> tuple[SearchResultType, list[Suggestion]]:
-        suggestions: list[Suggestion] = []
-
-        try:
-            async for suggestion in self.client.get_suggestions(
-                query, limit=self._API_LIMIT
-            ):
-                suggestions.append(suggestion)
-        except DatamuseError:
-            pass
+    async def _fetch_suggestions(self, query: str) -> FetchResult:
+        suggestions: list[DatamuseModel] = []
+        async for suggestion in self.client.get_suggestions(
+            query, limit=self._API_LIMIT
+        ):
+            suggestions.append(suggestion)
 
         return SearchResultType.SUGGESTION, suggestions
 
+    def _refine(
+        self, parse_result: ParseResult
+    ) -> tuple[list[FetchResult], set[SearchResultType]] | None:
+        """Answer a query from the cached results of a shorter prefix.
+
+        Only refinable result types are kept, narrowed down to the objects
+        starting with the query.
+
+        Returns:
+            The refined results and the result types known to be complete,
+            because the prefix got fewer results than the API limit. None if
+            no prefix of the query is cached.
+        """
+        text = parse_result.text
+        for end in range(len(text) - 1, self._MIN_CHARACTERS - 1, -1):
+            prefix = ParseResult(type=parse_result.type, text=text[:end])
+            if (cached := self._cache.get(self._cache_key(prefix))) is None:
+                continue
+
+            results: list[FetchResult] = []
+            complete: set[SearchResultType] = set()
+            for srt, objs in self._load_results(cached):
+                if srt not in self._REFINABLE:
+                    continue
+                results.append(
+                    (srt, [o for o in objs if o.word.startswith(text)])
+                )
+                if len(objs) < self._API_LIMIT:
+                    complete.add(srt)
+            return results, complete
+        return None
+
+    def _merge_hits(
+        self, best: dict[str | None, Hit], hits: list[Hit]
+    ) -> list[Hit]:
+        """Incremental version of `_clean_hits`.
+
+        Args:
+            best: The best hit yielded so far for each text, updated in place.
+            hits: Newly arrived hits.
+
+        Returns:
+            The hits which are new or beat the score of the one already known.
+        """
+        merged: list[Hit] = []
+        for hit in self._clean_hits(hits):
+            current = best.get(hit.text, None)
+            if current is None or hit.score > current.score:
+                best[hit.text] = hit
+                merged.append(hit)
+        return merged
+
+    def _to_hits(self, query: str, results: list[FetchResult]) -> list[Hit]:
+        return self._clean_hits(
+            sum(
+                [
+                    self._datamuse_hits(query, objs, srt)
+                    for srt, objs in results
+                ],
+                [],
+            )
+        )
+
     async def search(self, query: str) -> Hits:
         parse_result = self._parse_query(query)
         if parse_result.type is SearchTermType.UNKNOWN:
             return
 
-        if cached_hits := self._cache.get(parse_result.text, None):
-            for ch in cached_hits:
-                yield ch
-
-        results: list[list[Hit]] = []
-        if parse_result.type is SearchTermType.SUGGEST_SOUNDS_LIKE:
-            results = await self._fetch(
-                parse_result.text,
-                self._fetch_suggestions,
-                self._fetch_sounds_like,
-            )
-        elif parse_result.type is SearchTermType.SUGGEST_MEANS_LIKE:
-            results = await self._fetch(
-                parse_result.text,
-                self._fetch_suggestions,
-                self._fetch_means_like,
-            )
-        elif parse_result.type is SearchTermType.SPELLED_LIKE:
-            results = await self._fetch(
-                parse_result.text, self._fetch_spelled_like
-            )
+        key = self._cache_key(parse_result)
+        if (cached := self._cache.get(key)) is not None:
+            for hit in self._to_hits(
+                parse_result.text, self._load_results(cached)
+            ):
+                yield hit
+            return
 
-        hits: list[Hit] = self._clean_hits(sum(results, []))
-        self._cache[parse_result.text] = hits
-        for hit in hits:
-            yield hit
+        fetchers = self._fetchers_for(parse_result.type)
+        results: list[FetchResult] = []
+        best: dict[str | None, Hit] = {}
 
-    async def shutdown(self) -> None:
-        for _ in range(len(self._cache)):
-            self._cache.popitem()
-        del self._cache
-        await self.client.clean()
+        # Show what a shorter, cached, prefix already tells us straight away,
+        # then only go to the network for what it can't answer.
+        if (refinement := self._refine(parse_result)) is not None:
+            refined, complete = refinement
+            for hit in self._merge_hits(
+                best, self._to_hits(parse_result.text, refined)
+            ):
+                yield hit
+            results = [(srt, objs) for srt, objs in refined if srt in complete]
+            fetchers = {
+                srt: fetcher
+                for srt, fetcher in fetchers.items()
+                if srt not in complete
+            }
+
+        # Stream each fetcher's hits as soon as it's done, rather than waiting
+        # on the slowest endpoint.
+        all_fetched = True
+        async for result in self._fetch(parse_result.text, *fetchers.values()):
+            if result is None:
+                all_fetched = False
+                continue
+            results.append(result)
+            srt, objs = result
+            for hit in self._merge_hits(
+                best, self._datamuse_hits(parse_result.text, objs, srt)
+            ):
+                yield hit
 
-    async def startup(self) -> None:
-        self._cache = FIFOCache(maxsize=self._CACHE_MAX_SIZE)
+        # Don't remember partial results from a failed fetcher.
+        if all_fetched:
+            self._cache.set(key, self._dump_results(results))
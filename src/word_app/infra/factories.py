@@ -1,18 +1,197 @@
+import asyncio
+from pathlib import Path
+from typing import Callable
+
 import httpx
-from httpx_retries import Retry, RetryTransport
+from httpx_retries import Retry
+
+from word_app.lib._shr.breaker import CircuitBreaker
+from word_app.lib._shr.hedge import Hedger
+from word_app.lib._shr.limit import (
+    RateLimit,
+    RateLimiter,
+    RateLimitTransport,
+    UsageLedger,
+)
+from word_app.lib._shr.retry import DeadlineRetryTransport, RetryStats
+from word_app.lib._shr.schedule import (
+    Priority,
+    RequestScheduler,
+    ScheduledTransport,
+    request_priority,
+)
+
+_KEEPALIVE_EXPIRY: float = 120.0
+"""Seconds an idle pooled connection is kept open."""
+
+_MAX_CONNECTIONS: int = 10
+"""Maximum number of concurrent connections per pooled client."""
+
+_PRECONNECT_TIMEOUT: float = 2.0
+"""Timeout, in seconds, of the request used to warm up a pooled client."""
 
 
 def http_client_factory(
-    retry_total: int = 5, retry_backoff_factor: float = 0.5
+    retry_total: int = 5,
+    retry_backoff_factor: float = 0.5,
+    retry_stats: RetryStats | None = None,
+    limiter: RateLimiter | None = None,
+    scheduler: RequestScheduler | None = None,
 ) -> httpx.AsyncClient:
     """Create an HTTPX AsyncClient.
 
+    Requests made under `request_deadline` are only retried while their
+    deadline allows.
+
     Args:
         retry_total: The number of times to retry when a request failure
             occurs.
         retry_backoff_factor: Backoff factor to determine length of time
             between retry attempts.
+        retry_stats: Counters to record each retry decision in.
+        limiter: Rate limiter every attempt at a request waits on.
+        scheduler: Scheduler every attempt at a request waits its turn with.
     """
+    limits = httpx.Limits(
+        max_connections=_MAX_CONNECTIONS,
+        max_keepalive_connections=_MAX_CONNECTIONS,
+        keepalive_expiry=_KEEPALIVE_EXPIRY,
+    )
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        limits=limits
+    )
+    if limiter is not None:
+        transport = RateLimitTransport(transport, limiter)
+    if scheduler is not None:
+        transport = ScheduledTransport(transport, scheduler)
     return httpx.AsyncClient(
-        transport=RetryTransport(retry=Retry(total=5, backoff_factor=0.5))
+        transport=DeadlineRetryTransport(
+            transport=transport,
+            retry=Retry(total=retry_total, backoff_factor=retry_backoff_factor),
+            on_decision=retry_stats.record if retry_stats else None,
+        ),
     )
+
+
+class HttpClientRegistry:
+    """Application scoped pool of HTTPX clients, one per host.
+
+    Clients are created on first request for a host and live until `aclose`
+    is called, so every API client talking to the same host shares a single
+    pool of keep-alive connections.
+
+    Requests to a host with a `RateLimit` in `limits` are kept within it,
+    and counted against its daily quota in a ledger saved to `usage_path`.
+    Requests to every host wait their turn with one `RequestScheduler`, by
+    the priority they're made with.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit] | None = None,
+        usage_path: Path | None = None,
+    ) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._ledger = UsageLedger(usage_path)
+        self._limiters = {
+            self._origin(url): RateLimiter(
+                httpx.URL(url).host, limit, self._ledger
+            )
+            for url, limit in (limits or {}).items()
+        }
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._hedgers: dict[str, Hedger] = {}
+        self.scheduler = RequestScheduler()
+        """Runs the requests of every pooled client, most needed first."""
+        self.retry_stats = RetryStats()
+        """Retry decisions made on requests by every pooled client."""
+        self.on_trip: Callable[[CircuitBreaker, Exception], None] | None = None
+        """Called when any host's circuit breaker opens."""
+
+    def _tripped(self, breaker: CircuitBreaker, failure: Exception) -> None:
+        if self.on_trip is not None:
+            self.on_trip(breaker, failure)
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        u = httpx.URL(url)
+        return f"{u.scheme}://{u.netloc.decode('ascii')}"
+
+    async def _preconnect(self, origin: str, client: httpx.AsyncClient) -> None:
+        try:
+            with request_priority(Priority.WARMUP):
+                await client.head(origin, timeout=_PRECONNECT_TIMEOUT)
+        except httpx.HTTPError:
+            pass
+
+    @property
+    def origins(self) -> list[str]:
+        """Origins, 'scheme://host[:port]', with a pooled client."""
+        return list(self._clients.keys())
+
+    def client(self, url: str) -> httpx.AsyncClient:
+        """Get the pooled client for the host of a URL."""
+        origin = self._origin(url)
+        if (client := self._clients.get(origin, None)) is None:
+            client = http_client_factory(
+                retry_stats=self.retry_stats,
+                limiter=self._limiters.get(origin, None),
+                scheduler=self.scheduler,
+            )
+            self._clients[origin] = client
+        return client
+
+    def breaker(
+        self, url: str, make: Callable[[str], CircuitBreaker]
+    ) -> CircuitBreaker:
+        """Get the circuit breaker for the host of a URL, so every API
+        client talking to the host stops together when it's failing.
+
+        Args:
+            url: A URL of the host.
+            make: Makes the breaker from the host, on first request.
+        """
+        origin = self._origin(url)
+        if (breaker := self._breakers.get(origin, None)) is None:
+            breaker = make(httpx.URL(url).host)
+            breaker.on_trip = self._tripped
+            self._breakers[origin] = breaker
+        return breaker
+
+    @property
+    def limiters(self) -> dict[str, RateLimiter]:
+        """Rate limiter of each origin with limits."""
+        return dict(self._limiters)
+
+    @property
+    def hedgers(self) -> dict[str, Hedger]:
+        """Hedger of each origin with one."""
+        return dict(self._hedgers)
+
+    def hedger(self, url: str) -> Hedger:
+        """Get the hedger for the host of a URL, so its budget caps the
+        duplicate requests sent to the host by every API client."""
+        origin = self._origin(url)
+        if (hedger := self._hedgers.get(origin, None)) is None:
+            hedger = Hedger()
+            self._hedgers[origin] = hedger
+        return hedger
+
+    async def connect(self) -> None:
+        """Open a connection to every known host ahead of the first request.
+
+        Failures are ignored, the connection is simply made on first use.
+        """
+        await asyncio.gather(
+            *[
+                self._preconnect(origin, client)
+                for origin, client in self._clients.items()
+            ]
+        )
+
+    async def aclose(self) -> None:
+        """Close every pooled client, and save the day's usage."""
+        self._ledger.save()
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*[client.aclose() for client in clients])
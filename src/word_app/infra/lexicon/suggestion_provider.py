@@ -0,0 +1,85 @@
+import asyncio
+
+from word_app.app.tui._models import Hits
+from word_app.data.vo import SearchResultType, SearchTermType
+from word_app.infra.suggestions import (
+    WordSearchProvider,
+    to_spelled_like_pattern,
+)
+from word_app.lib.lexicon.autocomplete import PrefixIndex, default_prefix_index
+from word_app.lib.lexicon.phonetic import (
+    PhoneticIndex,
+    default_phonetic_index,
+)
+from word_app.lib.lexicon.wildcard import (
+    WildcardIndex,
+    default_wildcard_index,
+)
+from word_app.services.search.parsers import RegexSearchTermParser
+
+
+class LexiconSearchProvider(WordSearchProvider):
+    """Offline suggestions from the bundled word list.
+
+    Answers in microseconds, without the network, so its hits show up before
+    those of remote providers, which merge in afterwards.
+    """
+
+    _LIMIT: int = 10
+    _SOUNDS_LIKE_MIN_CHARACTERS: int = 3
+    _SPELLED_LIKE_LIMIT: int = 100
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._phonetic_index: PhoneticIndex | None = None
+        self._prefix_index: PrefixIndex | None = None
+        self._wildcard_index: WildcardIndex | None = None
+
+    async def startup(self) -> None:
+        # Built once per process, a few hundred milliseconds each, off the UI
+        # thread.
+        (
+            self._phonetic_index,
+            self._prefix_index,
+            self._wildcard_index,
+        ) = await asyncio.gather(
+            asyncio.to_thread(default_phonetic_index),
+            asyncio.to_thread(default_prefix_index),
+            asyncio.to_thread(default_wildcard_index),
+        )
+
+    def _lookup(
+        self, type: SearchTermType, text: str
+    ) -> list[tuple[SearchResultType, list[tuple[str, int]]]]:
+        if (
+            self._phonetic_index is None
+            or self._prefix_index is None
+            or self._wildcard_index is None
+        ):
+            return []
+
+        results: list[tuple[SearchResultType, list[tuple[str, int]]]] = []
+        if type is SearchTermType.SPELLED_LIKE:
+            words = self._wildcard_index.match(
+                to_spelled_like_pattern(text), self._SPELLED_LIKE_LIMIT
+            )
+            results.append((SearchResultType.SPELLED_LIKE, words))
+        if type in (
+            SearchTermType.SUGGEST_SOUNDS_LIKE,
+            SearchTermType.SUGGEST_MEANS_LIKE,
+        ):
+            words = self._prefix_index.complete(text, self._LIMIT)
+            results.append((SearchResultType.SUGGESTION, words))
+        if (
+            type is SearchTermType.SUGGEST_SOUNDS_LIKE
+            and len(text) >= self._SOUNDS_LIKE_MIN_CHARACTERS
+        ):
+            words = self._phonetic_index.match(text, self._LIMIT)
+            results.append((SearchResultType.SOUNDS_LIKE, words))
+        return results
+
+    async def search(self, query: str) -> Hits:
+        parse_result = RegexSearchTermParser().parse(query.strip())
+        for srt, words in self._lookup(parse_result.type, parse_result.text):
+            for hit in self._make_hits(parse_result.text, words, srt):
+                yield hit
@@ -0,0 +1,60 @@
+from typing import Sequence
+
+from word_app.app.tui._models import Hit
+from word_app.app.tui.screens.quick_search.suggestion_provider import (
+    Provider,
+)
+from word_app.data.vo import SearchResultType
+
+
+def min_max_normalize(
+    value: int | float, min: int | float, max: int | float
+) -> float:
+    """https://en.wikipedia.org/wiki/Feature_scaling"""
+    try:
+        return (value - min) / (max - min)
+    except ZeroDivisionError:
+        return 0.0
+
+
+def to_spelled_like_pattern(query: str) -> str:
+    """Swap the app's wildcards, `*` one letter and `?` any number of them,
+    for Datamuse's, the other way around."""
+    return query.replace("*", "#").replace("?", "*").replace("#", "?")
+
+
+class WordSearchProvider(Provider):
+    """Base for providers suggesting words, each opening the word's details
+    when selected."""
+
+    def _action(self, word: str):
+        async def __action():
+            self.app.history.visit(word)
+
+        return __action
+
+    def _make_hits(
+        self,
+        query: str,
+        words: Sequence[tuple[str, float]],
+        srt: SearchResultType,
+    ) -> list[Hit]:
+        """Hits for scored words, their scores normalized between 0 and 1."""
+        if not words:
+            return []
+        matcher = self.matcher(query)
+        highest_score = max(score for _, score in words)
+        lowest_score = min(score for _, score in words)
+        hits: list[Hit] = []
+        for word, score in words:
+            normalized = min_max_normalize(score, lowest_score, highest_score)
+            hits.append(
+                Hit(
+                    score=normalized,
+                    match_display=matcher.highlight(word),
+                    action=self._action(word),
+                    text=word,
+                    help=f"{srt.display} ({round(normalized, 4)})",
+                )
+            )
+        return hits
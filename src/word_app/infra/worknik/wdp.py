@@ -1,5 +1,5 @@
 import asyncio
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator, Awaitable, Callable, Collection
 
 from word_app.data.models import (
     Definition,
@@ -28,10 +28,26 @@ from word_app.lib.wordnik.endpoints import (
 )
 from word_app.lib.wordnik.models import FrequencySummary
 from word_app.lib.wordnik.vo import AmericanHeritage, RelationshipType
-from word_app.services.wdp.base import AbstractWordDetailProvider
+from word_app.services.wdp.base import (
+    AbstractWordDetailProvider,
+    DetailSection,
+    SectionUpdate,
+    SectionValue,
+)
 
 
 class MultisourceDetailProvider(AbstractWordDetailProvider):
+    SECTIONS = frozenset(
+        {
+            DetailSection.DEFINITIONS,
+            DetailSection.EXAMPLES,
+            DetailSection.FREQUENCY_GRAPH,
+            DetailSection.PHRASES,
+            DetailSection.SYLLABLES,
+            DetailSection.THESAURUS,
+        }
+    )
+
     def __init__(self, *_, **kwargs) -> None:
         try:
             wordnik_client: WordnikApiClient = kwargs["wordnik_client"]
@@ -166,6 +182,18 @@ class MultisourceDetailProvider(AbstractWordDetailProvider):
     async def clean(self) -> None:
         await self._wordnik_client.clean()
 
+    def _loaders(
+        self, word: str
+    ) -> dict[DetailSection, Callable[[], Awaitable[SectionValue]]]:
+        return {
+            DetailSection.DEFINITIONS: lambda: self._definitions(word),
+            DetailSection.THESAURUS: lambda: self._thesaurus(word),
+            DetailSection.EXAMPLES: lambda: self._examples(word),
+            DetailSection.PHRASES: lambda: self._phrases(word),
+            DetailSection.SYLLABLES: lambda: self._syllables(word),
+            DetailSection.FREQUENCY_GRAPH: lambda: self._frequency(word),
+        }
+
     async def get_details_for_word(
         self, word: str, on_failure: Callable[[Exception], None] | None = None
     ) -> Word | None:
@@ -176,31 +204,45 @@ class MultisourceDetailProvider(AbstractWordDetailProvider):
 
             on_failure = _on_failure
 
+        loaders = self._loaders(word)
         try:
-            objs: tuple[
-                Definitions,
-                Thesaurus,
-                Examples,
-                Phrases,
-                Syllables,
-                FrequencyGraph,
-            ] = await asyncio.gather(
-                self._definitions(word),
-                self._thesaurus(word),
-                self._examples(word),
-                self._phrases(word),
-                self._syllables(word),
-                self._frequency(word),
+            values = await asyncio.gather(
+                *(load() for load in loaders.values())
             )
         except Exception as e:
             return on_failure(e)
         else:
-            return Word(
-                word=word,
-                definitions=objs[0],
-                thesaurus=objs[1],
-                examples=objs[2],
-                phrases=objs[3],
-                syllables=objs[4],
-                frequency_graph=objs[5],
+            return Word.model_validate(
+                {"word": word}
+                | {
+                    section.value: value
+                    for section, value in zip(loaders, values)
+                }
             )
+
+    async def stream_details_for_word(
+        self, word: str, sections: Collection[DetailSection] | None = None
+    ) -> AsyncGenerator[SectionUpdate, None]:
+        """Yield each section as its Wordnik request completes, fastest
+        first. A failed request fails only its own section."""
+
+        async def _load(
+            section: DetailSection, load: Callable[[], Awaitable[SectionValue]]
+        ) -> SectionUpdate:
+            try:
+                return SectionUpdate(section=section, value=await load())
+            except Exception as e:
+                return SectionUpdate(section=section, error=e)
+
+        tasks = [
+            asyncio.ensure_future(_load(section, load))
+            for section, load in self._loaders(word).items()
+            if sections is None or section in sections
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer may stop early, e.g. its screen was closed.
+            for task in tasks:
+                task.cancel()
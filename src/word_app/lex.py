@@ -78,6 +78,8 @@ class Lexicon:
                 thes_desc: str = _("screen.word_details.sidebar.thes_desc")
 
             already_here: str = _("screen.word_details.already_here")
+            loading: str = _("screen.word_details.loading")
+            section_failed: str = _("screen.word_details.section_failed")
 
     @frozen
     class service:
@@ -134,6 +136,10 @@ class FormattableLexicon:
             attribution: str = _("screen.word_details.attribution")
             frequency_tooltip: str = _("screen.word.frequency_tooltip")
 
+    @frozen
+    class service:
+        unavailable: str = _("service.unavailable")
+
 
 LEX = Lexicon()
 LEX_FMT = FormattableLexicon()
@@ -0,0 +1,174 @@
+from enum import StrEnum
+from http import HTTPStatus
+from time import monotonic
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+
+class CircuitOpen(Exception):
+    """Raised instead of making a request while a source's circuit is open."""
+
+    def __init__(self, source: str, retry_in: float) -> None:
+        super().__init__(
+            f"'{source}' is unavailable, retry in {retry_in:.0f}s."
+        )
+        self.source = source
+        self.retry_in = retry_in
+        """Seconds until a request is let through to probe the source."""
+
+
+class NotSent(httpx.RequestError):
+    """Base of errors raised on our side of the wire, for a request that was
+    never sent. They say nothing about the source."""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    """Requests are made."""
+    OPEN = "open"
+    """Requests fail straight away."""
+    HALF_OPEN = "half_open"
+    """A single request is probing whether the source is back."""
+
+
+def is_outage(exc: BaseException) -> bool:
+    """Whether a request failed because of its source rather than what was
+    asked, e.g. a word that isn't found.
+
+    Checks the exception, and the one it was raised from.
+    """
+    for e in (exc, exc.__cause__):
+        if isinstance(e, httpx.HTTPStatusError):
+            status = e.response.status_code
+            return (
+                status >= HTTPStatus.INTERNAL_SERVER_ERROR
+                or status == HTTPStatus.TOO_MANY_REQUESTS
+            )
+        if isinstance(e, httpx.TransportError):
+            return True
+    return False
+
+
+def _not_sent(exc: BaseException) -> bool:
+    """Whether the exception, or the one it was raised from, is `NotSent`."""
+    return isinstance(exc, NotSent) or isinstance(exc.__cause__, NotSent)
+
+
+class CircuitBreaker:
+    """Stop sending requests to a source that keeps failing.
+
+    `threshold` consecutive failures, or a single failure of a `trip_on`
+    type, open the circuit: requests then fail straight away with `error`
+    for `cooldown` seconds. After that, one request is let through to
+    probe the source, others still failing straight away. The probe
+    succeeding closes the circuit, failing opens it again.
+
+    Only failures `is_failure` says are the source's count. Requests never
+    sent, failed with `NotSent`, count as neither a failure nor a success.
+    `on_trip` is called with the failure each time the circuit opens from
+    closed.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        threshold: int = 3,
+        cooldown: float = 30.0,
+        trip_on: tuple[type[Exception], ...] = (),
+        is_failure: Callable[[Exception], bool] = is_outage,
+        error: type[CircuitOpen] = CircuitOpen,
+        on_trip: Callable[["CircuitBreaker", Exception], None] | None = None,
+    ) -> None:
+        self.source = source
+        self.threshold = max(threshold, 1)
+        self.cooldown = cooldown
+        self.on_trip = on_trip
+        self._trip_on = trip_on
+        self._is_failure = is_failure
+        self._error = error
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+        self.trips: int = 0
+        """Number of times the circuit opened from closed."""
+
+        self.fast_failed: int = 0
+        """Number of requests failed without being made."""
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def _open(self, failure: Exception) -> None:
+        tripped = self._state is CircuitState.CLOSED
+        self._state = CircuitState.OPEN
+        self._opened_at = monotonic()
+        self._failures = 0
+        if tripped:
+            self.trips += 1
+            if self.on_trip is not None:
+                self.on_trip(self, failure)
+
+    def _admit(self) -> None:
+        """Let a request through, or fail it straight away."""
+        if self._state is CircuitState.CLOSED:
+            return
+        retry_in = self._opened_at + self.cooldown - monotonic()
+        if self._state is CircuitState.OPEN and retry_in <= 0:
+            self._state = CircuitState.HALF_OPEN
+            return
+        self.fast_failed += 1
+        raise self._error(self.source, max(retry_in, 0.0))
+
+    def _release_probe(self) -> None:
+        """Let the next request probe instead."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._state = CircuitState.OPEN
+            self._opened_at = monotonic() - self.cooldown
+
+    def _succeeded(self) -> None:
+        self._failures = 0
+        if self._state is CircuitState.HALF_OPEN:
+            self._state = CircuitState.CLOSED
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Make a request, unless the circuit is open.
+
+        Args:
+            request: Callable creating the awaitable which does the request.
+
+        Raises:
+            CircuitOpen: As `error`, if the request wasn't made.
+        """
+        self._admit()
+        probing = self._state is CircuitState.HALF_OPEN
+        try:
+            result = await request()
+        except Exception as e:
+            if _not_sent(e):
+                if probing:
+                    self._release_probe()
+            elif isinstance(e, self._trip_on):
+                self._open(e)
+            elif not self._is_failure(e):
+                self._succeeded()
+            elif probing:
+                self._open(e)
+            else:
+                self._failures += 1
+                if self._failures >= self.threshold:
+                    self._open(e)
+            raise
+        except BaseException:
+            # A cancelled probe says nothing, let the next request probe.
+            if probing:
+                self._release_probe()
+            raise
+        self._succeeded()
+        return result
@@ -0,0 +1,70 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _InFlight(Generic[T]):
+    task: asyncio.Future[T]
+    waiters: int = 0
+
+
+class RequestCoalescer(Generic[T]):
+    """Single-flight coalescing of identical, concurrent requests.
+
+    The first caller for a key starts the request, every caller that arrives
+    with the same key while it is still running awaits the same result. The
+    request is only cancelled once every caller waiting on it is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, _InFlight[T]] = {}
+
+        self.sent: int = 0
+        """Number of requests actually started."""
+
+        self.saved: int = 0
+        """Number of requests answered by joining one already in flight."""
+
+        self.cancelled: int = 0
+        """Number of started requests cancelled, as nobody wanted them."""
+
+    def _forget(self, key: Hashable, entry: _InFlight[T]) -> None:
+        if self._in_flight.get(key, None) is entry:
+            del self._in_flight[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently running."""
+        return len(self._in_flight)
+
+    async def run(
+        self, key: Hashable, request: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a request, or join the identical one already running.
+
+        Args:
+            key: Identity of the request. Callers using equal keys share a
+                single request.
+            request: Callable creating the awaitable which does the request.
+        """
+        if (entry := self._in_flight.get(key, None)) is None:
+            entry = _InFlight(task=asyncio.ensure_future(request()))
+            self._in_flight[key] = entry
+            entry.task.add_done_callback(lambda _: self._forget(key, entry))
+            self.sent += 1
+        else:
+            self.saved += 1
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            if entry.waiters == 1 and not entry.task.done():
+                entry.task.cancel()
+                self.cancelled += 1
+            raise
+        finally:
+            entry.waiters -= 1
@@ -0,0 +1,146 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """Counters for the requests run by a hedger."""
+
+    requests: int = 0
+    """Requests run."""
+
+    hedged: int = 0
+    """Requests a duplicate was sent for, as the first was slow."""
+
+    wins: int = 0
+    """Hedged requests answered first by the duplicate."""
+
+    over_budget: int = 0
+    """Slow requests not hedged, as the budget was spent."""
+
+    @property
+    def win_rate(self) -> float:
+        """Share of the hedged requests the duplicate answered first."""
+        return self.wins / self.hedged if self.hedged else 0.0
+
+
+class LatencyWindow:
+    """The latencies of the last `size` requests, for percentiles."""
+
+    def __init__(self, size: int) -> None:
+        self._latencies: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def add(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """The latency `q`, between 0 and 1, of the requests are as fast as,
+        by nearest rank."""
+        ordered = sorted(self._latencies)
+        if not ordered:
+            return 0.0
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class Hedger:
+    """Send a duplicate of a request that's slower than usual, and take
+    whichever answers first.
+
+    A request not answered by the `quantile` of the latest `window`
+    latencies of its kind is sent again, once there are `min_samples` of
+    them. Duplicates are capped at `budget` of the requests run, so they
+    add at most that much load. Only answered requests count towards
+    either, not failed or cancelled ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        quantile: float = 0.9,
+        window: int = 100,
+        min_samples: int = 10,
+        budget: float = 0.1,
+    ) -> None:
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.budget = budget
+        self.stats = HedgeStats()
+        self._window = window
+        self._latencies: dict[Hashable, LatencyWindow] = {}
+
+    def latencies(self, kind: Hashable) -> LatencyWindow:
+        """Latest latencies of a kind of request."""
+        if (latencies := self._latencies.get(kind, None)) is None:
+            latencies = LatencyWindow(self._window)
+            self._latencies[kind] = latencies
+        return latencies
+
+    def report(self) -> str:
+        """The stats, and the latency percentiles of each kind of request."""
+        lines = [f"{self.stats}, win rate {self.stats.win_rate:.0%}"]
+        for kind, latencies in self._latencies.items():
+            ms = [
+                f"p{q * 100:.0f} {latencies.percentile(q) * 1_000:.0f}ms"
+                for q in (0.5, 0.9, 0.99)
+            ]
+            lines.append(f"{kind}: {', '.join(ms)}")
+        return "; ".join(lines)
+
+    async def run(
+        self, kind: Hashable, request: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a request, hedging it if it's slow.
+
+        Args:
+            kind: What the request's latency is compared to the latest of,
+                e.g. its endpoint.
+            request: Callable creating the awaitable which does the request.
+        """
+        latencies = self.latencies(kind)
+        self.stats.requests += 1
+        started = monotonic()
+        first = asyncio.ensure_future(request())
+        tasks = [first]
+        try:
+            if len(latencies) >= self.min_samples:
+                delay = latencies.percentile(self.quantile)
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    if self.stats.hedged < self.budget * self.stats.requests:
+                        self.stats.hedged += 1
+                        tasks.append(asyncio.ensure_future(request()))
+                    else:
+                        self.stats.over_budget += 1
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.stats.wins += 1
+                        # The first attempt's latency or, if the duplicate
+                        # answered first, as much of it as was waited for,
+                        # so the slow ones stay in the window.
+                        latencies.add(monotonic() - started)
+                        return task.result()
+            # Every attempt failed, the first failure is the one to raise.
+            return first.result()
+        except asyncio.CancelledError:
+            # Cut short, e.g. by the next keystroke, it says nothing of how
+            # long requests take and isn't one to budget duplicates by.
+            self.stats.requests -= 1
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from time import monotonic
+
+import httpx
+
+from word_app.lib._shr.breaker import NotSent
+from word_app.lib._shr.retry import remaining_budget
+from word_app.lib._shr.schedule import Priority, current_priority
+
+
+class RateLimited(NotSent):
+    """Raised instead of sending a request the host's limits can't afford."""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Client side limits on the requests sent to a host."""
+
+    rate: float
+    """Requests a second, sustained."""
+    burst: int
+    """Requests that can be sent at once, after a quiet spell."""
+    daily_quota: int | None = None
+    """Requests a day, None for no limit."""
+    reserve: float = 0.25
+    """Share of the burst, and of the daily quota, kept for requests the user
+    is waiting on."""
+    max_wait: float = 5.0
+    """Longest a request the user is waiting on, without a deadline, is
+    queued."""
+
+
+class TokenBucket:
+    """Tokens refilled at `rate` a second, up to `burst`."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+
+    @property
+    def tokens(self) -> float:
+        now = monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        return self._tokens
+
+    def wait_for(self, tokens: float = 1.0) -> float:
+        """Seconds until there'll be `tokens`."""
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def take(self, tokens: float = 1.0) -> None:
+        self._tokens = self.tokens - tokens
+
+
+class UsageLedger:
+    """Requests sent each day to each host, kept in a JSON file.
+
+    Counts are written every `flush_every` requests, and on `save`.
+    """
+
+    def __init__(self, path: Path | None, flush_every: int = 20) -> None:
+        self._path = path
+        self._flush_every = flush_every
+        self._unsaved = 0
+        self._day = date.today().isoformat()
+        self._counts: dict[str, int] = {}
+        if path is not None and path.exists():
+            try:
+                saved = json.loads(path.read_text())
+            except (OSError, ValueError):
+                saved = {}
+            if saved.get("day", None) == self._day:
+                self._counts = dict(saved.get("requests", {}))
+
+    def _roll_over(self) -> None:
+        if (today := date.today().isoformat()) != self._day:
+            self._day = today
+            self._counts.clear()
+
+    def used(self, host: str) -> int:
+        """Requests sent to a host today."""
+        self._roll_over()
+        return self._counts.get(host, 0)
+
+    def count(self, host: str) -> None:
+        self._roll_over()
+        self._counts[host] = self._counts.get(host, 0) + 1
+        self._unsaved += 1
+        if self._unsaved >= self._flush_every:
+            self.save()
+
+    def save(self) -> None:
+        self._unsaved = 0
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(
+                json.dumps({"day": self._day, "requests": self._counts})
+            )
+        except OSError:
+            pass
+
+
+_RATE_LIMIT_HEADER = re.compile(r"x-ratelimit-remaining-(\w+)")
+
+_PERIODS: dict[str, float] = {
+    "second": 1.0,
+    "minute": 60.0,
+    "hour": 60 * 60.0,
+    "day": 24 * 60 * 60.0,
+}
+
+
+@dataclass
+class LimitStats:
+    """Counters for the requests a rate limiter let through or not."""
+
+    sent: int = 0
+    """Requests sent straight away."""
+
+    queued: int = 0
+    """Requests sent after waiting for the limits to allow them."""
+
+    shed: int = 0
+    """Requests failed with `RateLimited` rather than sent."""
+
+
+class RateLimiter:
+    """Keep the requests sent to a host within its limits.
+
+    A request takes a token from a bucket. Requests the user is waiting on
+    wait for one, for as long as their deadline allows, background ones are
+    shed once the bucket or the day's quota is down to their reserve. The host's
+    own word on its limits, `X-RateLimit-Remaining-<period>` and
+    `Retry-After` headers, holds every request back until it says they'd be
+    let through.
+    """
+
+    def __init__(
+        self, host: str, limit: RateLimit, ledger: UsageLedger
+    ) -> None:
+        self.host = host
+        self.limit = limit
+        self.stats = LimitStats()
+        self._bucket = TokenBucket(limit.rate, limit.burst)
+        self._ledger = ledger
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def used_today(self) -> int:
+        return self._ledger.used(self.host)
+
+    def _shed(self, request: httpx.Request, why: str) -> RateLimited:
+        self.stats.shed += 1
+        return RateLimited(f"'{self.host}' {why}.", request=request)
+
+    def _over_quota(self, priority: Priority) -> bool:
+        if (quota := self.limit.daily_quota) is None:
+            return False
+        if priority.background:
+            quota = int(quota * (1 - self.limit.reserve))
+        return self.used_today >= quota
+
+    async def acquire(self, request: httpx.Request) -> None:
+        """Wait until a request can be sent.
+
+        Raises:
+            RateLimited: If it's not to be sent.
+        """
+        priority = current_priority()
+        if self._over_quota(priority):
+            raise self._shed(request, "is over today's quota")
+        if priority.background and (
+            self._blocked_until > monotonic()
+            or self._bucket.tokens < self.limit.burst * self.limit.reserve + 1
+        ):
+            raise self._shed(request, "has no room for background requests")
+
+        # Queued in turn, each waiting for its own token.
+        async with self._lock:
+            wait = max(
+                self._blocked_until - monotonic(), self._bucket.wait_for()
+            )
+            if wait > 0:
+                allowed = remaining_budget()
+                if allowed is None:
+                    allowed = self.limit.max_wait
+                if wait > allowed:
+                    raise self._shed(request, f"is limited for {wait:.1f}s")
+                self.stats.queued += 1
+                await asyncio.sleep(wait)
+            else:
+                self.stats.sent += 1
+            self._bucket.take()
+        self._ledger.count(self.host)
+
+    def observe(self, response: httpx.Response) -> None:
+        """Hold requests back for as long as the host says it's limiting."""
+        block = 0.0
+        if retry_after := response.headers.get("Retry-After", "").strip():
+            if retry_after.isdigit():
+                block = float(retry_after)
+        for name, value in response.headers.items():
+            if match := _RATE_LIMIT_HEADER.fullmatch(name.lower()):
+                period = _PERIODS.get(match.group(1), None)
+                if period is not None and value.strip() == "0":
+                    block = max(block, period)
+        if block:
+            self._blocked_until = max(self._blocked_until, monotonic() + block)
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """Send each request once its host's `RateLimiter` allows."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        await self._limiter.acquire(request)
+        response = await self._transport.handle_async_request(request)
+        self._limiter.observe(response)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
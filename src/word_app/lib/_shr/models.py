@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field, fields
-from typing import Any
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, TypeAlias
 
 
 @dataclass
@@ -26,6 +27,24 @@ class EnumParam(Param):
         return {self.name: ",".join([v.value for v in self.value])}
 
 
+ParamsGetter: TypeAlias = Callable[["Endpoint"], tuple[Param, ...]]
+"""Gets every Param field of an endpoint, in field order."""
+
+
+def _compile_params_getter(endpoint: "Endpoint") -> ParamsGetter:
+    names = [
+        f.name
+        for f in fields(endpoint)
+        if isinstance(getattr(endpoint, f.name), Param)
+    ]
+    if not names:
+        return lambda _: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda ep: (getter(ep),)
+    return attrgetter(*names)
+
+
 @dataclass
 class Endpoint:
     """Endpoint container.
@@ -33,6 +52,9 @@ class Endpoint:
     Contains query params, endpoint configuration information.
     """
 
+    _params_getters: ClassVar[dict[type["Endpoint"], ParamsGetter]] = {}
+    """Compiled getter of the Param fields of each Endpoint class."""
+
     _endpoint: str = field(default="")
 
     @property
@@ -42,11 +64,18 @@ class Endpoint:
 
     @property
     def params(self) -> dict:
-        """Convert all Param type fields into a JSON-compat dictionary."""
+        """Convert all Param type fields into a JSON-compat dictionary.
+
+        Which fields are Params is worked out once per class, on first use,
+        rather than by going over every field on each request.
+        """
+        cls = type(self)
+        if (getter := self._params_getters.get(cls, None)) is None:
+            getter = _compile_params_getter(self)
+            self._params_getters[cls] = getter
+
         params: dict = {}
-        for _field in fields(self):
-            value = getattr(self, _field.name)
-            if issubclass(value.__class__, Param):  # type: ignore
-                if _ := value.value:
-                    params |= value.as_dict
+        for param in getter(self):
+            if param.value:
+                params |= param.as_dict
         return params
@@ -0,0 +1,206 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+from time import monotonic
+from typing import Callable, Iterator
+
+import httpx
+from httpx_retries import Retry
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+"""Monotonic time by which requests made in the context must be answered."""
+
+_MIN_ATTEMPT: float = 0.05
+"""Seconds an attempt is given at least, a retry that would leave less isn't
+made."""
+
+
+@contextmanager
+def request_deadline(budget: float, inherit: bool = True) -> Iterator[None]:
+    """Give requests made within, and in tasks started within, `budget`
+    seconds overall, retries included.
+
+    Args:
+        budget: Seconds from now the requests must be answered by.
+        inherit: Keep to the enclosing deadline if it's sooner. Background
+            work started from interactive work shouldn't be.
+    """
+    deadline = monotonic() + budget
+    if inherit and (enclosing := _deadline.get()) is not None:
+        deadline = min(deadline, enclosing)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_budget() -> float | None:
+    """Seconds left of the current deadline, None without one."""
+    if (deadline := _deadline.get()) is None:
+        return None
+    return deadline - monotonic()
+
+
+class RetryOutcome(StrEnum):
+    RETRIED = "retried"
+    EXHAUSTED = "exhausted"
+    """Every retry allowed was made."""
+    OVER_DEADLINE = "over_deadline"
+    """The wait before retrying would've run past the deadline."""
+
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """Whether a failed attempt at a request was retried, and why."""
+
+    host: str
+    attempt: int
+    """Attempts made, the failed one included."""
+    cause: str
+    """The status code or the exception the attempt failed with."""
+    outcome: RetryOutcome
+    wait: float
+    """Seconds waited before retrying, or that would've been."""
+    remaining: float | None
+    """Seconds left of the deadline when deciding, None without one."""
+
+
+@dataclass
+class RetryStats:
+    """Counters for the retry decisions made on requests."""
+
+    retried: int = 0
+    """Failed attempts retried."""
+
+    exhausted: int = 0
+    """Requests failed after every retry allowed."""
+
+    over_deadline: int = 0
+    """Requests failed rather than retried past their deadline."""
+
+    def record(self, decision: RetryDecision) -> None:
+        match decision.outcome:
+            case RetryOutcome.RETRIED:
+                self.retried += 1
+            case RetryOutcome.EXHAUSTED:
+                self.exhausted += 1
+            case RetryOutcome.OVER_DEADLINE:
+                self.over_deadline += 1
+
+
+class DeadlineRetryTransport(httpx.AsyncBaseTransport):
+    """Retry failed requests as `retry` allows, within their deadline.
+
+    A request made under `request_deadline` has each attempt's timeouts cut
+    to what's left of the deadline, and is only retried if the wait before
+    the retry leaves time for it. Without a deadline, it's retried as
+    `retry` allows. Each decision is passed to `on_decision`.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retry: Retry,
+        on_decision: Callable[[RetryDecision], None] | None = None,
+    ) -> None:
+        self._transport = transport
+        self._retry = retry
+        self._on_decision = on_decision
+
+    @staticmethod
+    def _wait(retry: Retry, failure: httpx.Response | Exception) -> float:
+        """Seconds to wait before the next attempt, as the server asks or
+        by `retry`'s backoff."""
+        if isinstance(failure, httpx.Response) and (
+            retry_after := failure.headers.get("Retry-After", "").strip()
+        ):
+            try:
+                return min(
+                    retry.parse_retry_after(retry_after),
+                    retry.max_backoff_wait,
+                )
+            except ValueError:
+                pass
+        return retry.backoff_strategy()
+
+    @staticmethod
+    def _cut_timeouts(request: httpx.Request, remaining: float) -> None:
+        timeouts = request.extensions.get("timeout", {})
+        request.extensions["timeout"] = {
+            kind: max(_MIN_ATTEMPT, remaining)
+            if seconds is None
+            else max(_MIN_ATTEMPT, min(seconds, remaining))
+            for kind, seconds in timeouts.items()
+        }
+
+    def _decide(
+        self,
+        request: httpx.Request,
+        retry: Retry,
+        failure: httpx.Response | Exception,
+    ) -> tuple[RetryOutcome, float]:
+        wait = 0.0
+        remaining = remaining_budget()
+        if retry.is_exhausted():
+            outcome = RetryOutcome.EXHAUSTED
+        else:
+            wait = self._wait(retry.increment(), failure)
+            if remaining is not None and remaining - wait < _MIN_ATTEMPT:
+                outcome = RetryOutcome.OVER_DEADLINE
+            else:
+                outcome = RetryOutcome.RETRIED
+        if self._on_decision is not None:
+            cause = (
+                str(failure.status_code)
+                if isinstance(failure, httpx.Response)
+                else type(failure).__name__
+            )
+            self._on_decision(
+                RetryDecision(
+                    host=request.url.host,
+                    attempt=retry.attempts_made + 1,
+                    cause=cause,
+                    outcome=outcome,
+                    wait=wait,
+                    remaining=remaining,
+                )
+            )
+        return outcome, wait
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        retry = self._retry
+        if not retry.is_retryable_method(request.method):
+            return await self._transport.handle_async_request(request)
+
+        while True:
+            if (remaining := remaining_budget()) is not None:
+                self._cut_timeouts(request, remaining)
+            failure: httpx.Response | Exception
+            try:
+                response = await self._transport.handle_async_request(request)
+            except Exception as e:
+                if not retry.is_retryable_exception(e):
+                    raise
+                failure = e
+            else:
+                if not retry.is_retryable_status_code(response.status_code):
+                    return response
+                failure = response
+
+            outcome, wait = self._decide(request, retry, failure)
+            if outcome is not RetryOutcome.RETRIED:
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            if isinstance(failure, httpx.Response):
+                await failure.aclose()
+            retry = retry.increment()
+            await asyncio.sleep(wait)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
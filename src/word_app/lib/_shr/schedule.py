@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from itertools import count
+from time import monotonic
+from typing import Awaitable, Callable, Iterator, TypeVar
+
+import httpx
+
+from word_app.lib._shr.breaker import NotSent
+from word_app.lib._shr.retry import remaining_budget
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """How much a request is needed, higher sooner."""
+
+    WARMUP = 0
+    """Warming up connections and the cache."""
+    SPECULATIVE = 1
+    """Fetching what the user might look at next."""
+    VISIBLE = 2
+    """Loading what's on screen."""
+    INTERACTIVE = 3
+    """Answering what the user's typing."""
+
+    @property
+    def background(self) -> bool:
+        """Whether the user isn't waiting on it."""
+        return self < Priority.VISIBLE
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Give requests made within, and in tasks started within, a priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+class Unscheduled(NotSent):
+    """Raised when a request's deadline passes while it waits its turn."""
+
+
+@dataclass
+class ClassStats:
+    """Counters for the requests of a priority run by a scheduler."""
+
+    queued: int = 0
+    """Requests waiting now."""
+
+    max_queued: int = 0
+    """Most requests waiting at once."""
+
+    started: int = 0
+    """Requests started."""
+
+    waited: float = 0.0
+    """Seconds requests waited to start, in total."""
+
+    max_wait: float = 0.0
+    """Longest a request waited to start."""
+
+    expired: int = 0
+    """Requests whose deadline passed before they could start."""
+
+    @property
+    def mean_wait(self) -> float:
+        return self.waited / self.started if self.started else 0.0
+
+
+class RequestScheduler:
+    """Run requests to each host a few at a time, the most needed first.
+
+    At most `per_host` requests run to a host at once, background ones
+    leaving `reserved` of those free for the requests the user is waiting
+    on. Others wait their turn by priority, then by arrival, so a new
+    search goes ahead of every prefetch already waiting. A request made
+    under `request_deadline` only waits while its deadline allows.
+    """
+
+    def __init__(self, per_host: int = 6, reserved: int = 1) -> None:
+        self.per_host = max(per_host, 1)
+        self.reserved = min(reserved, self.per_host - 1)
+        self.stats: dict[Priority, ClassStats] = {
+            priority: ClassStats() for priority in Priority
+        }
+        self._running: defaultdict[str, int] = defaultdict(int)
+        self._queues: defaultdict[
+            str, list[tuple[int, int, Priority, asyncio.Future[None]]]
+        ] = defaultdict(list)
+        self._arrivals = count()
+
+    def _can_start(self, host: str, priority: Priority) -> bool:
+        limit = self.per_host
+        if priority.background:
+            limit -= self.reserved
+        return self._running[host] < limit
+
+    def _wake(self, host: str) -> None:
+        """Start whoever's next, while there's room for them.
+
+        Run whenever a request finishes, so nobody left waiting could start.
+        """
+        queue = self._queues[host]
+        while queue:
+            _, _, priority, waiter = queue[0]
+            if waiter.done():
+                heapq.heappop(queue)
+            elif self._can_start(host, priority):
+                heapq.heappop(queue)
+                self._running[host] += 1
+                waiter.set_result(None)
+            else:
+                # Whoever's after them can't start either.
+                return
+
+    def _release(self, host: str) -> None:
+        self._running[host] -= 1
+        self._wake(host)
+
+    def queued(self, host: str) -> int:
+        """Requests to a host waiting now."""
+        return sum(not w.done() for *_, w in self._queues[host])
+
+    async def _wait_turn(self, host: str, priority: Priority) -> None:
+        stats = self.stats[priority]
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queues[host],
+            (-priority, next(self._arrivals), priority, waiter),
+        )
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Started just as it was cancelled, its place goes to the next.
+            if waiter.done() and not waiter.cancelled():
+                self._release(host)
+            raise
+        finally:
+            stats.queued -= 1
+
+    async def run(self, host: str, request: Callable[[], Awaitable[T]]) -> T:
+        """Run a request to a host when its turn comes, by the priority it's
+        made with.
+
+        Args:
+            host: The host the request is sent to.
+            request: Callable creating the awaitable which does the request.
+
+        Raises:
+            TimeoutError: If its deadline passes before its turn comes.
+        """
+        priority = current_priority()
+        arrived = monotonic()
+        stats = self.stats[priority]
+        # Nobody waiting could start now, see `_wake`, and a request allowed
+        # to start is allowed by every priority above it. So one that can
+        # start isn't jumping anyone of its priority or higher.
+        if not self._can_start(host, priority):
+            try:
+                async with asyncio.timeout(remaining_budget()):
+                    await self._wait_turn(host, priority)
+            except TimeoutError:
+                stats.expired += 1
+                raise
+        else:
+            self._running[host] += 1
+        waited = monotonic() - arrived
+        stats.started += 1
+        stats.waited += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        try:
+            return await request()
+        finally:
+            self._release(host)
+
+
+class ScheduledTransport(httpx.AsyncBaseTransport):
+    """Send each request when its turn comes with a `RequestScheduler`."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, scheduler: RequestScheduler
+    ) -> None:
+        self._transport = transport
+        self._scheduler = scheduler
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        try:
+            return await self._scheduler.run(
+                request.url.host,
+                lambda: self._transport.handle_async_request(request),
+            )
+        except TimeoutError as e:
+            raise Unscheduled(
+                f"'{request.url.host}' had no turn for the request in time.",
+                request=request,
+            ) from e
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -3,6 +3,9 @@ from typing import AsyncGenerator
 
 import httpx
 
+from word_app.lib._shr.breaker import CircuitBreaker
+from word_app.lib._shr.coalesce import RequestCoalescer
+from word_app.lib._shr.hedge import Hedger
 from word_app.lib._shr.utils import make_value_error
 from word_app.lib.datamuse._models import Suggestion, Word
 from word_app.lib.datamuse._transformer import DatamuseTransformer
@@ -11,7 +14,10 @@ from word_app.lib.datamuse.endpoints import (
     SuggestionsEndpoint,
     WordsEndpoint,
 )
-from word_app.lib.datamuse.exceptions import FailedToRefetchResult
+from word_app.lib.datamuse.exceptions import (
+    FailedToRefetchResult,
+    Unavailable,
+)
 
 
 @dataclass(frozen=True, eq=True)
@@ -49,30 +55,62 @@ class DatamuseApiClient:
         *,
         client: httpx.AsyncClient,
         conf: DatamuseApiConf = DEFAULT_API_CONF,
+        breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
     ) -> None:
         self.client = client
         self.conf = conf
         self.transformer = DatamuseTransformer()
+        self.coalescer: RequestCoalescer[httpx.Response] = RequestCoalescer()
+        self.breaker = breaker or self.circuit_breaker(
+            httpx.URL(conf.root).host
+        )
+        self.hedger = hedger
+
+    @staticmethod
+    def circuit_breaker(source: str) -> CircuitBreaker:
+        """Make a circuit breaker for requests to Datamuse, to share
+        between clients."""
+        return CircuitBreaker(source, error=Unavailable)
 
     async def _request(self, *, endpoint: DatamuseEndpoint) -> httpx.Response:
-        """Helper to make the actual HTTP request."""
+        """Helper to make the actual HTTP request.
+
+        Identical requests made while one is already in flight share its
+        response. While Datamuse keeps failing, requests fail straight away
+        with `Unavailable`. With a hedger, a request slower than usual for
+        its endpoint is sent again and the first answer taken.
+        """
         location = self.conf.full_path(endpoint)
 
         kwargs: dict[str, float | dict | None] = {"timeout": self.conf.timeout}
         kwargs["params"] = endpoint.params
 
-        try:
-            resp = await self.client.get(
-                location,
-                **kwargs,  # type: ignore
-            )
-            resp.raise_for_status()
-            return resp
-        except (httpx.RequestError, httpx.HTTPError) as exc:
-            raise FailedToRefetchResult() from exc
+        async def send() -> httpx.Response:
+            try:
+                resp = await self.client.get(
+                    location,
+                    **kwargs,  # type: ignore
+                )
+                resp.raise_for_status()
+                return resp
+            except (httpx.RequestError, httpx.HTTPError) as exc:
+                raise FailedToRefetchResult() from exc
+
+        async def hedged() -> httpx.Response:
+            if self.hedger is None:
+                return await send()
+            return await self.hedger.run(endpoint.endpoint, send)
+
+        key = str(httpx.URL(location, params=kwargs["params"]))
+        return await self.coalescer.run(key, lambda: self.breaker.run(hedged))
 
     async def clean(self) -> None:
-        """Clean up operations after done."""
+        """Clean up operations after done.
+
+        Closes the underlying HTTPX client, don't call when the client is
+        shared through an application's HttpClientRegistry.
+        """
         await self.client.aclose()
 
     async def get_suggestions(
@@ -1,6 +1,13 @@
+from word_app.lib._shr.breaker import CircuitOpen
+
+
 class DatamuseError(Exception):
     """Base class for all Datamuse library exceptions."""
 
 
 class FailedToRefetchResult(DatamuseError):
     pass
+
+
+class Unavailable(DatamuseError, CircuitOpen):
+    """Raised instead of requesting while Datamuse keeps failing."""
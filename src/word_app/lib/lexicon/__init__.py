@@ -0,0 +1 @@
+"""Offline word lookups over a bundled, frequency weighted, word list."""
@@ -0,0 +1,92 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from functools import cache
+
+from word_app.lib.lexicon.wordlist import WordList, default_wordlist
+
+
+class PrefixIndex:
+    """Top-k prefix completion over a word list.
+
+    A flattened trie: words are kept sorted, so the completions of any prefix
+    are a contiguous range, found with two binary searches. A sparse table of
+    range maxima over the weights then gives the heaviest word of any range in
+    constant time, so the top k of a range come out of a heap in O(k log k),
+    however many words share the prefix.
+    """
+
+    def __init__(self, wordlist: WordList) -> None:
+        order = sorted(range(len(wordlist)), key=wordlist.words.__getitem__)
+        self._words: list[str] = [wordlist.words[i] for i in order]
+        self._weights = array("i", (wordlist.weights[i] for i in order))
+        self._table: list[array] = self._build_table()
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _build_table(self) -> list[array]:
+        """Row j holds, for each i, the index of the heaviest of the 2**j
+        words starting at i."""
+        w = self._weights
+        table = [array("i", range(len(w)))]
+        span = 1
+        while span * 2 <= len(w):
+            prev = table[-1]
+            table.append(
+                array(
+                    "i",
+                    [
+                        a if w[a] >= w[b] else b
+                        for a, b in zip(prev, prev[span:])
+                    ],
+                )
+            )
+            span *= 2
+        return table
+
+    def _heaviest(self, lo: int, hi: int) -> int:
+        """Index of the heaviest word in [lo, hi)."""
+        row = (hi - lo).bit_length() - 1
+        a = self._table[row][lo]
+        b = self._table[row][hi - (1 << row)]
+        return a if self._weights[a] >= self._weights[b] else b
+
+    def range(self, prefix: str) -> tuple[int, int]:
+        """Indexes, [lo, hi), of the sorted words starting with a prefix."""
+        lo = bisect_left(self._words, prefix)
+        if not prefix:
+            return lo, len(self._words)
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return lo, bisect_left(self._words, upper, lo)
+
+    def complete(self, prefix: str, k: int = 10) -> list[tuple[str, int]]:
+        """The k heaviest words starting with a prefix.
+
+        Returns:
+            Words and their weights, heaviest first.
+        """
+        lo, hi = self.range(prefix)
+        if lo >= hi or k < 1:
+            return []
+
+        def _candidate(lo: int, hi: int) -> tuple[int, int, int, int]:
+            i = self._heaviest(lo, hi)
+            return -self._weights[i], i, lo, hi
+
+        found: list[tuple[str, int]] = []
+        heap = [_candidate(lo, hi)]
+        while heap and len(found) < k:
+            weight, i, lo, hi = heapq.heappop(heap)
+            found.append((self._words[i], -weight))
+            if lo < i:
+                heapq.heappush(heap, _candidate(lo, i))
+            if i + 1 < hi:
+                heapq.heappush(heap, _candidate(i + 1, hi))
+        return found
+
+
+@cache
+def default_prefix_index() -> PrefixIndex:
+    """Prefix index of the bundled word list, built once."""
+    return PrefixIndex(default_wordlist())
@@ -0,0 +1,187 @@
+from array import array
+from collections import defaultdict
+from functools import cache
+
+from word_app.lib.lexicon.wordlist import WordList, default_wordlist
+
+_VOWELS = frozenset("aeiou")
+_FRONT_VOWELS = frozenset("eiy")
+_INITIAL_SILENT = ("ae", "gn", "kn", "pn", "wr")
+
+
+def metaphone(word: str) -> str:
+    """Lawrence Philips' original Metaphone key of a word.
+
+    Words sounding alike share a key, e.g. 'knight' and 'night' are both
+    'NT'. The key is made of consonant sounds, '0' standing for 'th', and the
+    leading vowel, if any.
+    """
+    w = "".join(c for c in word.lower() if c.isalpha())
+    if not w:
+        return ""
+    if w.startswith(_INITIAL_SILENT):
+        w = w[1:]
+    elif w[0] == "x":
+        w = "s" + w[1:]
+    elif w.startswith("wh"):
+        w = "w" + w[2:]
+
+    def at(i: int) -> str:
+        return w[i] if 0 <= i < len(w) else ""
+
+    key: list[str] = []
+    for i, c in enumerate(w):
+        prev, next = at(i - 1), at(i + 1)
+        if c == prev and c != "c":
+            continue
+        if c in _VOWELS:
+            if i == 0:
+                key.append(c.upper())
+        elif c == "b":
+            if not (prev == "m" and i == len(w) - 1):
+                key.append("B")
+        elif c == "c":
+            if next == "i" and at(i + 2) == "a" or next == "h":
+                key.append("K" if prev == "s" else "X")
+            elif next in _FRONT_VOWELS:
+                if prev != "s":
+                    key.append("S")
+            else:
+                key.append("K")
+        elif c == "d":
+            if next == "g" and at(i + 2) in _FRONT_VOWELS:
+                key.append("J")
+            else:
+                key.append("T")
+        elif c == "g":
+            if next == "h" and not (i + 2 >= len(w) or at(i + 2) in _VOWELS):
+                continue
+            if next == "n" and (
+                i + 2 == len(w) or w[i + 2 :] == "ed" and i + 4 == len(w)
+            ):
+                continue
+            if prev == "d" and next in _FRONT_VOWELS:
+                continue
+            if next in _FRONT_VOWELS and prev != "g":
+                key.append("J")
+            else:
+                key.append("K")
+        elif c == "h":
+            if prev and prev in "cgpst":
+                continue
+            if prev in _VOWELS and next not in _VOWELS:
+                continue
+            key.append("H")
+        elif c == "k":
+            if prev != "c":
+                key.append("K")
+        elif c == "p":
+            key.append("F" if next == "h" else "P")
+        elif c == "q":
+            key.append("K")
+        elif c == "s":
+            if next == "h" or next == "i" and at(i + 2) in ("o", "a"):
+                key.append("X")
+            else:
+                key.append("S")
+        elif c == "t":
+            if next == "i" and at(i + 2) in ("o", "a"):
+                key.append("X")
+            elif next == "h":
+                key.append("0")
+            elif not (next == "c" and at(i + 2) == "h"):
+                key.append("T")
+        elif c == "v":
+            key.append("F")
+        elif c in "wy":
+            if next in _VOWELS:
+                key.append(c.upper())
+        elif c == "x":
+            key.append("KS")
+        elif c == "z":
+            key.append("S")
+        else:
+            key.append(c.upper())
+    return "".join(key)
+
+
+def _deletes(key: str) -> set[str]:
+    """Every key one deleted character away."""
+    return {key[:i] + key[i + 1 :] for i in range(len(key))}
+
+
+class PhoneticIndex:
+    """Sounds-like lookups over a word list.
+
+    Words are grouped by Metaphone key. When too few words share the query's
+    key, keys about an edit away are tried too, found through an index of the
+    keys with a character deleted (symmetric delete), rather than by working
+    out the edit distance to every key.
+    """
+
+    _DISTANCE_PENALTY: int = 1_000
+    """Score taken off per edit between keys. More than any weight, so words
+    sounding the same always rank above ones sounding a bit different."""
+
+    def __init__(self, wordlist: WordList) -> None:
+        self._words: tuple[str, ...] = wordlist.words
+        self._weights: tuple[int, ...] = wordlist.weights
+
+        keys = wordlist.metaphones or tuple(map(metaphone, self._words))
+        ids: defaultdict[str, list[int]] = defaultdict(list)
+        for i, key in enumerate(keys):
+            ids[key].append(i)
+        self._ids: dict[str, array] = {
+            key: array("i", key_ids) for key, key_ids in ids.items() if key
+        }
+
+        neighbours: defaultdict[str, list[str]] = defaultdict(list)
+        for key in self._ids:
+            for deleted in _deletes(key):
+                neighbours[deleted].append(key)
+        self._neighbours: dict[str, tuple[str, ...]] = {
+            deleted: tuple(keys) for deleted, keys in neighbours.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def _near_keys(self, key: str) -> set[str]:
+        """Keys a deletion, insertion or substitution away, and the ones
+        sharing a key a character shorter, e.g. 'JFN' for 'JRF'."""
+        near = set(self._neighbours.get(key, ()))
+        for deleted in _deletes(key):
+            if deleted in self._ids:
+                near.add(deleted)
+            near.update(self._neighbours.get(deleted, ()))
+        near.discard(key)
+        return near
+
+    def match(self, word: str, limit: int = 10) -> list[tuple[str, int]]:
+        """Words sounding like a word, best first.
+
+        Returns:
+            Up to `limit` words and their scores, their frequency weights less
+            a penalty for every edit between their key and the word's.
+        """
+        if not (key := metaphone(word)):
+            return []
+
+        found = [
+            (self._words[i], self._weights[i]) for i in self._ids.get(key, ())
+        ]
+        if len(found) < limit:
+            penalty = self._DISTANCE_PENALTY
+            for near in self._near_keys(key):
+                found.extend(
+                    (self._words[i], self._weights[i] - penalty)
+                    for i in self._ids[near]
+                )
+        found.sort(key=lambda pair: pair[1], reverse=True)
+        return found[:limit]
+
+
+@cache
+def default_phonetic_index() -> PhoneticIndex:
+    """Phonetic index of the bundled word list, built once."""
+    return PhoneticIndex(default_wordlist())
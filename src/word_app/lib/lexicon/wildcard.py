@@ -0,0 +1,131 @@
+import re
+from collections import defaultdict
+from functools import cache
+from typing import Iterator
+
+from word_app.lib.lexicon.wordlist import WordList, default_wordlist
+
+SINGLE: str = "?"
+"""Wildcard matching exactly one letter."""
+
+ANY: str = "*"
+"""Wildcard matching any number of letters, including none."""
+
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+def _bitset(ids: list[int], size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+class WildcardIndex:
+    """Spelled-like lookups, e.g. 'b?n*a', over a word list.
+
+    Patterns use Datamuse's syntax, `?` is any one letter and `*` any number
+    of them. Words are indexed by length and by the letter at each position,
+    counted from both the start and the end. Postings are bitsets over word
+    ids, ids being frequency ranks, so constraints intersect with a few
+    bitwise ands and matches come out most frequent first. Only a pattern
+    with more than one `*` has to check its candidates against a regex.
+    """
+
+    def __init__(self, wordlist: WordList) -> None:
+        self._words: tuple[str, ...] = wordlist.words
+        self._weights: tuple[int, ...] = wordlist.weights
+        size = len(self._words)
+
+        lengths: defaultdict[int, list[int]] = defaultdict(list)
+        letters: defaultdict[tuple[int, str], list[int]] = defaultdict(list)
+        for i, word in enumerate(self._words):
+            lengths[len(word)].append(i)
+            for position, letter in enumerate(word):
+                letters[(position, letter)].append(i)
+                letters[(position - len(word), letter)].append(i)
+
+        self._length: dict[int, int] = {
+            length: _bitset(ids, size) for length, ids in lengths.items()
+        }
+        self._min_length: dict[int, int] = {}
+        at_least = 0
+        for length in range(max(lengths, default=0), -1, -1):
+            at_least |= self._length.get(length, 0)
+            self._min_length[length] = at_least
+        self._letter: dict[tuple[int, str], int] = {
+            key: _bitset(ids, size) for key, ids in letters.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @staticmethod
+    def _ids(bitset: int) -> Iterator[int]:
+        """Ids set in a bitset, in increasing order."""
+        raw = bitset.to_bytes((bitset.bit_length() + 7) // 8, "little")
+        for m in _NONZERO.finditer(raw):
+            byte, offset = m[0][0], m.start() * 8
+            while byte:
+                lowest = byte & -byte
+                yield offset + lowest.bit_length() - 1
+                byte ^= lowest
+
+    def _candidates(self, pattern: str) -> int:
+        """Bitset of words meeting the pattern's length and letter
+        constraints. Exact matches unless the pattern has several `*`."""
+        if ANY not in pattern:
+            head, tail = pattern, ""
+            candidates = self._length.get(len(pattern), 0)
+        else:
+            head, _, tail = pattern.partition(ANY)
+            tail = tail.rpartition(ANY)[2]
+            candidates = self._min_length.get(
+                len(pattern) - pattern.count(ANY), 0
+            )
+
+        constraints = [(i, c) for i, c in enumerate(head) if c != SINGLE]
+        constraints += [
+            (i - len(tail), c) for i, c in enumerate(tail) if c != SINGLE
+        ]
+        # Rarest letter first, so the candidates empty out quickly.
+        postings = sorted(
+            (self._letter.get(key, 0) for key in constraints),
+            key=int.bit_count,
+        )
+        for posting in postings:
+            if not candidates:
+                break
+            candidates &= posting
+        return candidates
+
+    def match(self, pattern: str, limit: int = 100) -> list[tuple[str, int]]:
+        """Words matching a pattern, most frequent first.
+
+        Returns:
+            Up to `limit` words and their weights.
+        """
+        pattern = pattern.strip().lower()
+        candidates = self._candidates(pattern)
+        check = None
+        if pattern.count(ANY) > 1:
+            check = re.compile(
+                "".join(
+                    "." if c == SINGLE else ".*" if c == ANY else re.escape(c)
+                    for c in pattern
+                )
+            ).fullmatch
+
+        found: list[tuple[str, int]] = []
+        for i in self._ids(candidates):
+            if len(found) >= limit:
+                break
+            if check is None or check(self._words[i]):
+                found.append((self._words[i], self._weights[i]))
+        return found
+
+
+@cache
+def default_wildcard_index() -> WildcardIndex:
+    """Wildcard index of the bundled word list, built once."""
+    return WildcardIndex(default_wordlist())
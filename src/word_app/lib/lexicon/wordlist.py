@@ -0,0 +1,48 @@
+import gzip
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+DEFAULT_WORDLIST: Path = Path(__file__).parent / "data" / "en.tsv.gz"
+"""Bundled English word list, see `data/README.md`."""
+
+
+@dataclass(frozen=True)
+class WordList:
+    """Words, most frequent first, with their frequency weights.
+
+    Weights are Zipf frequencies scaled to integers: 100 times the base-10
+    logarithm of a word's occurrences per billion words.
+    """
+
+    words: tuple[str, ...]
+    weights: tuple[int, ...]
+    metaphones: tuple[str, ...] = ()
+    """Precomputed `phonetic.metaphone` keys of the words, if any."""
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @classmethod
+    def load(cls, path: Path) -> "WordList":
+        """Load a gzipped, tab separated, 'word<TAB>weight<TAB>metaphone'
+        file."""
+        words: list[str] = []
+        weights: list[int] = []
+        metaphones: list[str] = []
+        for line in gzip.decompress(path.read_bytes()).decode().splitlines():
+            word, weight, key = line.split("\t")
+            words.append(word)
+            weights.append(int(weight))
+            metaphones.append(key)
+        return cls(
+            words=tuple(words),
+            weights=tuple(weights),
+            metaphones=tuple(metaphones),
+        )
+
+
+@cache
+def default_wordlist() -> WordList:
+    """The bundled word list, loaded once."""
+    return WordList.load(DEFAULT_WORDLIST)
@@ -6,7 +6,8 @@ There be dragons ahead.
 # mypy: disable-error-code="name-defined"
 import datetime
 import re
-from typing import Self
+from functools import cache
+from typing import Any, Callable, Self, TypeAlias
 
 from word_app.lib.wordnik.models import (  # noqa
     Bigram,
@@ -28,65 +29,125 @@ from word_app.lib.wordnik.models import (  # noqa
     TextPron,
 )
 
+Decoder: TypeAlias = Callable[[Any], Any]
+"""Turns a deserialized JSON value into an object of a given type."""
+
+_LIST = re.compile(r"list\[(.*)\]")
+
+_MODELS: dict[str, type] = {
+    model.__name__: model
+    for model in (
+        Bigram,
+        Citation,
+        ContentProvider,
+        Definition,
+        Example,
+        ExampleSearchResults,
+        ExampleUsage,
+        Facet,
+        Frequency,
+        FrequencySummary,
+        Label,
+        Note,
+        Related,
+        ScoredWord,
+        Sentence,
+        Syllable,
+        TextPron,
+    )
+}
+
+_NATIVES: dict[str, type] = {
+    "bool": bool,
+    "dict": dict,
+    "float": float,
+    "int": int,
+    "list": list,
+    "str": str,
+}
+
+
+def _unknown(type_name: str) -> Decoder:
+    def decode(obj: Any) -> Any:
+        raise NameError(f"name '{type_name}' is not defined")
+
+    return decode
+
+
+def _list_of(decode_item: Decoder) -> Decoder:
+    def decode(obj: Any) -> list:
+        return [decode_item(item) for item in obj]
+
+    return decode
+
+
+def _compile_model(model: type) -> Decoder:
+    """Specialized decoder for a model class, from its `swaggerTypes`.
+
+    Decodes exactly like the Wordnik library's `deserialize`, quirks
+    included: empty or null lists become `[]`, and attributes typed as
+    another model are decoded as the model they belong to.
+    """
+    attrs: list[tuple[str, Decoder]] = []
+
+    def decode(obj: Any) -> Any:
+        instance = model()
+        for attr, decode_attr in attrs:
+            if attr in obj:
+                setattr(instance, attr, decode_attr(obj[attr]))
+        return instance
+
+    for attr, attr_type in model().swaggerTypes.items():
+        if attr_type in ("str", "int", "float", "bool"):
+            attrs.append((attr, _NATIVES[attr_type]))
+        elif attr_type == "datetime":
+            attrs.append(
+                (
+                    attr,
+                    lambda value: datetime.datetime.strptime(
+                        value[:-5], "%Y-%m-%dT%H:%M:%S"
+                    ),
+                )
+            )
+        elif match := _LIST.match(attr_type):
+            decode_items = _list_of(_decoder(match.group(1)))
+            attrs.append(
+                (attr, lambda value, d=decode_items: d(value) if value else [])
+            )
+        else:
+            attrs.append((attr, decode))
 
-def _deserialize(obj, objClass):
-    """Copied from Worknik's Python3 library.
+    return decode
 
-    https://github.com/wordnik/wordnik-python3/blob/b4ae1e8007bf4e5eff43ab22d46911b5f0e7faf2/wordnik/swagger.py#L29
 
-    This method is a complete mess. At somepoint I should rewrite it.
+@cache
+def _decoder(type_name: str) -> Decoder:
+    """Compiled decoder for a type name, e.g. 'list[Definition]'.
+
+    Built on first use and cached, rather than parsing type names and
+    walking `swaggerTypes` for every field of every object.
     """
+    if match := _LIST.match(type_name):
+        return _list_of(_decoder(match.group(1)))
+    if (native := _NATIVES.get(type_name, None)) is not None:
+        return native
+    if type_name == "datetime":
+        return lambda obj: datetime.datetime.strptime(
+            obj[:-5], "%Y-%m-%dT%H:%M:%S.%f"
+        )
+    if (model := _MODELS.get(type_name, None)) is not None:
+        return _compile_model(model)
+    return _unknown(type_name)
 
-    # Have to accept objClass as string or actual type. Type could be a
-    # native Python type, or one of the model classes.
-    if type(objClass) is str:
-        if "list[" in objClass:
-            match = re.match(r"list\[(.*)\]", objClass)
-            subClass = match.group(1)
-            return [_deserialize(subObj, subClass) for subObj in obj]
-
-        objClass = eval(objClass)
-
-    if objClass in [int, float, dict, list, str, bool]:
-        return objClass(obj)
-    elif objClass == datetime:
-        # Server will always return a time stamp in UTC, but with
-        # trailing +0000 indicating no offset from UTC. So don't process
-        # last 5 characters.
-        return datetime.datetime.strptime(obj[:-5], "%Y-%m-%dT%H:%M:%S.%f")
-
-    instance = objClass()
-
-    for attr, attrType in instance.swaggerTypes.items():
-        if attr in obj:
-            value = obj[attr]
-            if attrType in ["str", "int", "float", "bool"]:
-                attrType = eval(attrType)
-                try:
-                    value = attrType(value)
-                except UnicodeEncodeError:
-                    value = value.encode("utf-8")
-                setattr(instance, attr, value)
-            elif attrType == "datetime":
-                setattr(
-                    instance,
-                    attr,
-                    datetime.datetime.strptime(value[:-5], "%Y-%m-%dT%H:%M:%S"),
-                )
-            elif "list[" in attrType:
-                match = re.match("list\[(.*)\]", attrType)
-                subClass = match.group(1)
-                subValues = []
-                if not value:
-                    setattr(instance, attr, None)
-                else:
-                    for subValue in value:
-                        subValues.append(_deserialize(subValue, subClass))
-                setattr(instance, attr, subValues)
-            else:
-                setattr(instance, attr, _deserialize(value, objClass))
-
-    return instance
+
+def _deserialize(obj: Any, type_name: str) -> Any:
+    """Deserialize a JSON value into the Wordnik type with the given name.
+
+    Based on the Wordnik Python3 library's `ApiClient.deserialize`.
+
+    https://github.com/wordnik/wordnik-python3/blob/b4ae1e8007bf4e5eff43ab22d46911b5f0e7faf2/wordnik/swagger.py#L29
+    """
+    return _decoder(type_name)(obj)
 
 
 class WordnikTransformer:
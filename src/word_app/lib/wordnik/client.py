@@ -1,10 +1,11 @@
-from copy import deepcopy
 from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any, AsyncGenerator
 
 import httpx
 
+from word_app.lib._shr.breaker import CircuitBreaker
+from word_app.lib._shr.coalesce import RequestCoalescer
 from word_app.lib._shr.utils import make_value_error
 from word_app.lib.wordnik._transformer import WordnikTransformer
 from word_app.lib.wordnik.endpoints import (
@@ -19,6 +20,7 @@ from word_app.lib.wordnik.endpoints import (
 from word_app.lib.wordnik.exceptions import (
     FailedToRefetchResult,
     Unauthorized,
+    Unavailable,
 )
 from word_app.lib.wordnik.models import (
     Bigram,
@@ -55,12 +57,30 @@ def DEFAULT_API_CONF(*, api_key: str) -> WordnikApiConf:
 
 class WordnikApiClient:
     def __init__(
-        self, *, conf: WordnikApiConf, client: httpx.AsyncClient
+        self,
+        *,
+        conf: WordnikApiConf,
+        client: httpx.AsyncClient,
+        breaker: CircuitBreaker | None = None,
     ) -> None:
         self.conf = conf
         self.client = client
         self.transformer = WordnikTransformer()
+        self.coalescer: RequestCoalescer[httpx.Response] = RequestCoalescer()
+        self.breaker = breaker or self.circuit_breaker(
+            httpx.URL(conf.root).host
+        )
         self._cookie: str | None = None
+        # Bound once, rather than set on a copy of every requested endpoint.
+        self._auth_params = WordnikEndpoint.ApiKey(value=conf.api_key).as_dict
+
+    @staticmethod
+    def circuit_breaker(source: str) -> CircuitBreaker:
+        """Make a circuit breaker for requests to Wordnik, to share between
+        clients. A bad API key fails every request, so trips it at once."""
+        return CircuitBreaker(
+            source, error=Unavailable, trip_on=(Unauthorized,)
+        )
 
     def _headers(self) -> dict[str, str]:
         headers = {
@@ -73,29 +93,37 @@ class WordnikApiClient:
     async def _request(
         self, word: str, endpoint: WordnikEndpoint
     ) -> httpx.Response:
-        ep = deepcopy(endpoint)
-        ep.api_key.value = self.conf.api_key
-        location = self.conf.full_path(word, ep)
+        location = self.conf.full_path(word, endpoint)
         headers = self._headers()
         kwargs: dict[str, Any] = {
             "timeout": self.conf.timeout,
             "headers": headers,
         }
-        kwargs["params"] = ep.params
-
-        try:
-            resp = await self.client.get(location, **kwargs)
-            resp.raise_for_status()
-            return resp
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == HTTPStatus.UNAUTHORIZED:
-                raise Unauthorized() from exc
-            raise FailedToRefetchResult() from exc
-        except (httpx.RequestError, httpx.HTTPError) as exc:
-            raise FailedToRefetchResult() from exc
+        kwargs["params"] = endpoint.params | self._auth_params
+
+        async def send() -> httpx.Response:
+            try:
+                resp = await self.client.get(location, **kwargs)
+                resp.raise_for_status()
+                return resp
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == HTTPStatus.UNAUTHORIZED:
+                    raise Unauthorized() from exc
+                raise FailedToRefetchResult() from exc
+            except (httpx.RequestError, httpx.HTTPError) as exc:
+                raise FailedToRefetchResult() from exc
+
+        # Concurrent lookups of the same word and endpoint share a response,
+        # and while Wordnik keeps failing they fail with `Unavailable`.
+        key = str(httpx.URL(location, params=kwargs["params"]))
+        return await self.coalescer.run(key, lambda: self.breaker.run(send))
 
     async def clean(self) -> None:
-        """Clean up operations after done."""
+        """Clean up operations after done.
+
+        Closes the underlying HTTPX client, don't call when the client is
+        shared through an application's HttpClientRegistry.
+        """
         await self.client.aclose()
 
     async def get_definitions(
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cache
 from typing import TypeAlias
 
 from word_app.lib._shr.models import Endpoint, EnumParam, Param
@@ -7,6 +8,12 @@ from word_app.lib.wordnik.vo import PartOfSpeech as POSEnum
 from word_app.lib.wordnik.vo import RelationshipType as RTEnum
 
 
+@cache
+def _path_template(endpoint: str, type: str, purpose: str) -> str:
+    """Endpoint path, with only the word left to fill in."""
+    return endpoint.format(type=type, purpose=purpose, word="{word}")
+
+
 @dataclass
 class _Limit(Param):
     name: str = field(default="limit")
@@ -50,10 +57,8 @@ class WordnikEndpoint(Endpoint):
 
     @property
     def endpoint(self) -> str:
-        return self._endpoint.format(
-            type=self._endpoint_type,
-            purpose=self._endpoint_purpose,
-            word="{word}",
+        return _path_template(
+            self._endpoint, self._endpoint_type, self._endpoint_purpose
         )
 
     def endpoint_fmt(self, word: str) -> str:
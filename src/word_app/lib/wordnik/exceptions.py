@@ -1,3 +1,6 @@
+from word_app.lib._shr.breaker import CircuitOpen
+
+
 class WordnikError(Exception):
     """Base class for all Wordnik library exceptions."""
 
@@ -8,3 +11,7 @@ class FailedToRefetchResult(WordnikError):
 
 class Unauthorized(WordnikError):
     """Raised when we fail to auth with Wordnik."""
+
+
+class Unavailable(WordnikError, CircuitOpen):
+    """Raised instead of requesting while Wordnik keeps failing."""
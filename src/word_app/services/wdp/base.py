@@ -1,10 +1,80 @@
 from abc import ABC, abstractmethod
-from typing import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import partial
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Collection,
+)
 
-from word_app.data.models import Word
+from word_app.data.models import (
+    Definitions,
+    Etymologies,
+    Examples,
+    FrequencyGraph,
+    Phrases,
+    Syllables,
+    Thesaurus,
+    Word,
+)
+
+SectionValue = (
+    Definitions
+    | Etymologies
+    | Examples
+    | FrequencyGraph
+    | Phrases
+    | Syllables
+    | Thesaurus
+)
+
+
+class DetailSection(StrEnum):
+    """Sections of a word's details, valued by the `Word` field they fill."""
+
+    DEFINITIONS = "definitions"
+    ETYMOLOGIES = "etymologies"
+    EXAMPLES = "examples"
+    FREQUENCY_GRAPH = "frequency_graph"
+    PHRASES = "phrases"
+    SYLLABLES = "syllables"
+    THESAURUS = "thesaurus"
+
+
+@dataclass(frozen=True)
+class SectionUpdate:
+    """A section of a word's details, loaded or failed."""
+
+    section: DetailSection
+    value: SectionValue | None = None
+    error: Exception | None = None
+
+
+LAZY_SECTIONS: frozenset[DetailSection] = frozenset(
+    {
+        DetailSection.EXAMPLES,
+        DetailSection.PHRASES,
+        DetailSection.THESAURUS,
+    }
+)
+"""Sections costly to load and often never looked at."""
+
+
+@dataclass(frozen=True)
+class DeferredSection:
+    """A section of a word's details left to load until it's asked for."""
+
+    section: DetailSection
+    load: Callable[[], AsyncIterator[SectionUpdate]]
 
 
 class AbstractWordDetailProvider(ABC):
+    SECTIONS: ClassVar[frozenset[DetailSection]] = frozenset(DetailSection)
+    """Sections the provider loads, others are never yielded."""
+
     def __init__(self, *args, **kwargs) -> None:
         pass
 
@@ -13,3 +83,58 @@ class AbstractWordDetailProvider(ABC):
         self, word: str, on_failure: Callable[[Exception], None] | None = None
     ) -> Word | None:
         pass
+
+    async def clean(self) -> None:
+        """Release whatever the provider holds on to."""
+        pass
+
+    def lazy_details_for_word(
+        self, word: str, deferred: Collection[DetailSection] = LAZY_SECTIONS
+    ) -> tuple[AsyncIterator[SectionUpdate], list[DeferredSection]]:
+        """Stream a word's details, but for the deferred sections.
+
+        Returns:
+            Updates for the other sections, and a handle to load each of the
+            deferred ones.
+        """
+        deferred = self.SECTIONS.intersection(deferred)
+        return (
+            self.stream_details_for_word(word, self.SECTIONS - deferred),
+            [
+                DeferredSection(
+                    section=section,
+                    load=partial(
+                        self.stream_details_for_word, word, (section,)
+                    ),
+                )
+                for section in deferred
+            ],
+        )
+
+    async def stream_details_for_word(
+        self, word: str, sections: Collection[DetailSection] | None = None
+    ) -> AsyncGenerator[SectionUpdate, None]:
+        """Yield each section of a word's details as it loads.
+
+        Args:
+            word: The word to load.
+            sections: Sections to load, every one in `SECTIONS` if not
+                provided.
+
+        This default waits on `get_details_for_word`, providers loading
+        sections separately should override it.
+        """
+        wanted = self.SECTIONS if sections is None else sections
+        wanted = self.SECTIONS.intersection(wanted)
+        try:
+            details = await self.get_details_for_word(word)
+        except Exception as e:
+            for section in wanted:
+                yield SectionUpdate(section=section, error=e)
+            return
+        if details is None:
+            return
+        for section in wanted:
+            yield SectionUpdate(
+                section=section, value=getattr(details, section.value)
+            )
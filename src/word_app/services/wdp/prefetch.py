@@ -0,0 +1,148 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AsyncGenerator, AsyncIterator
+
+from word_app.lib._shr.retry import request_deadline
+from word_app.lib._shr.schedule import Priority, request_priority
+from word_app.services.wdp.base import (
+    LAZY_SECTIONS,
+    AbstractWordDetailProvider,
+    SectionUpdate,
+)
+
+
+@dataclass
+class PrefetchStats:
+    """Counters for the details fetched ahead of a word being shown."""
+
+    started: int = 0
+    """Prefetches started, after dwelling."""
+
+    cancelled: int = 0
+    """Prefetches stopped by attention moving on before they completed."""
+
+    completed: int = 0
+    """Prefetches that ran to completion."""
+
+    hits: int = 0
+    """Words shown with their prefetch completed, so shown at once."""
+
+    partial: int = 0
+    """Words shown with their prefetch still running, waited on."""
+
+    misses: int = 0
+    """Words shown without a prefetch."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the words shown that were prefetched in full."""
+        shown = self.hits + self.partial + self.misses
+        return self.hits / shown if shown else 0.0
+
+
+class DetailPrefetcher:
+    """Fetch a word's details while the user looks at it, before they ask.
+
+    The word being attended to, e.g. a highlighted suggestion or a hovered
+    word, is fetched once attention has dwelt on it for `dwell` seconds. One
+    word is fetched at a time, at the lowest priority: attention moving on
+    cancels it, and lazy sections are left to be loaded when looked at. The
+    details land in the provider's cache, so the provider should be a
+    caching one.
+    """
+
+    _BUDGET: float = 10.0
+    """Seconds a prefetch's requests have, retries included."""
+
+    _DONE_LIMIT: int = 100
+    """Words remembered as prefetched."""
+
+    def __init__(
+        self, provider: AbstractWordDetailProvider, dwell: float = 0.3
+    ) -> None:
+        self.dwell = dwell
+        self.stats = PrefetchStats()
+
+        self._provider = provider
+        self._sections = provider.SECTIONS - LAZY_SECTIONS
+        self._done: OrderedDict[str, None] = OrderedDict()
+        self._word: str | None = None
+        self._task: asyncio.Task | None = None
+        self._fetching = False
+
+    async def _prefetch(self, word: str) -> None:
+        await asyncio.sleep(self.dwell)
+        self._fetching = True
+        self.stats.started += 1
+        try:
+            # Failures are left for the word to report when it's shown.
+            with (
+                request_deadline(self._BUDGET, inherit=False),
+                request_priority(Priority.SPECULATIVE),
+            ):
+                async for _ in self._provider.stream_details_for_word(
+                    word, self._sections
+                ):
+                    pass
+        except Exception:
+            return
+        self.stats.completed += 1
+        self._done[word] = None
+        while len(self._done) > self._DONE_LIMIT:
+            self._done.popitem(last=False)
+
+    def _detach(self) -> asyncio.Task | None:
+        task, self._task, self._word = self._task, None, None
+        self._fetching = False
+        return task
+
+    def attend(self, word: str | None) -> None:
+        """Move the user's attention to a word, or off every word.
+
+        Whatever was being fetched for another word is cancelled.
+        """
+        if word == self._word:
+            return
+        fetching = self._fetching
+        if (task := self._detach()) is not None and not task.done():
+            task.cancel()
+            self.stats.cancelled += fetching
+        if word is None or word in self._done:
+            return
+        self._word = word
+        self._task = asyncio.create_task(self._prefetch(word))
+
+    def claim(
+        self, word: str, updates: AsyncIterator[SectionUpdate]
+    ) -> AsyncIterator[SectionUpdate]:
+        """Note a word's being shown, counting whether it was prefetched.
+
+        Args:
+            word: The word being shown.
+            updates: The word's updates from the provider.
+
+        Returns:
+            The updates, which wait on the word's prefetch first if it's
+            running, rather than requesting the same sections again.
+        """
+        fetching = self._fetching and word == self._word
+        task = self._detach() if word == self._word else None
+        if word in self._done:
+            self.stats.hits += 1
+        elif fetching and task is not None and not task.done():
+            self.stats.partial += 1
+            return self._after(task, updates)
+        else:
+            if task is not None:
+                task.cancel()
+            self.stats.misses += 1
+        return updates
+
+    @staticmethod
+    async def _after(
+        task: asyncio.Task, updates: AsyncIterator[SectionUpdate]
+    ) -> AsyncGenerator[SectionUpdate, None]:
+        await asyncio.wait({task})
+        async for update in updates:
+            yield update
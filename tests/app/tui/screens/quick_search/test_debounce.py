@@ -0,0 +1,36 @@
+import pytest
+
+from word_app.app.tui.screens.quick_search.debounce import AdaptiveDebouncer
+
+
+def _type(debouncer: AdaptiveDebouncer, gap: float, count: int) -> None:
+    for i in range(count):
+        debouncer.keystroke(now=i * gap)
+
+
+def test__AdaptiveDebouncer__delay__no_delay_before_typing_speed_known():
+    debouncer = AdaptiveDebouncer()
+    debouncer.keystroke(now=0.0)
+    assert debouncer.delay == 0.0
+
+
+def test__AdaptiveDebouncer__delay__waits_out_fast_typing():
+    debouncer = AdaptiveDebouncer(initial_latency=0.2, slack=1.25)
+    _type(debouncer, 0.08, 5)
+    assert debouncer.delay == pytest.approx(0.1)
+
+
+def test__AdaptiveDebouncer__delay__no_delay_when_searches_beat_typing():
+    debouncer = AdaptiveDebouncer(initial_latency=0.2)
+    _type(debouncer, 0.08, 5)
+    for _ in range(20):
+        debouncer.search_completed(0.01)
+    assert debouncer.delay == 0.0
+
+
+def test__AdaptiveDebouncer__delay__capped_and_ignores_pauses():
+    debouncer = AdaptiveDebouncer(initial_latency=5.0, max_delay=0.35)
+    _type(debouncer, 0.5, 3)
+    debouncer.keystroke(now=60.0)
+    assert debouncer.typing_interval == pytest.approx(0.5)
+    assert debouncer.delay == 0.35
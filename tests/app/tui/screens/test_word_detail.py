@@ -0,0 +1,81 @@
+import asyncio
+
+from textual.app import App
+from textual.widgets import Collapsible
+
+from word_app.app.tui.screens.word_detail import WordDetailScreen
+from word_app.app.tui.widgets import ClickableSentence
+from word_app.data import vo
+from word_app.data.models import (
+    Definition,
+    Definitions,
+    Example,
+    Examples,
+    Word,
+)
+
+
+def _word(definitions: int) -> Word:
+    return Word(
+        word="cat",
+        definitions=Definitions(
+            definitions=[
+                Definition(type=vo.Noun, text=f"Definition {i}.")
+                for i in range(definitions)
+            ]
+        ),
+        examples=Examples(
+            examples=[
+                Example(type=vo.Sentence, text="A cat sat.")
+                for _ in range(definitions)
+            ]
+        ),
+    )
+
+
+def _mounted(screen: WordDetailScreen, id: str) -> int:
+    return len(screen.query_one(f"#{id}", Collapsible).query(ClickableSentence))
+
+
+def test__WordDetailScreen__mount__long_lists_mounted_in_chunks():
+    screen = WordDetailScreen(word=_word(100))
+
+    async def main() -> tuple[int, int, str]:
+        app: App[None] = App()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await app.push_screen(screen)
+            first = _mounted(screen, "section-definition")
+            while screen._unmounted:
+                await pilot.pause(0.05)
+            rows = screen.query(".collapsible--definition")
+            return (
+                first,
+                _mounted(screen, "section-definition"),
+                str(rows.last().query_one("Label").render()),
+            )
+
+    first, mounted, last_number = asyncio.run(main())
+    assert first < 100
+    assert mounted == 100
+    assert last_number == "100."
+
+
+def test__WordDetailScreen__on_key__jump_mounts_the_lists_above():
+    screen = WordDetailScreen(word=_word(100))
+
+    async def main() -> tuple[int, int]:
+        app: App[None] = App()
+        async with app.run_test(size=(80, 24)) as pilot:
+            await app.push_screen(screen)
+            await pilot.press("5")
+            await pilot.pause()
+            await pilot.wait_for_scheduled_animations()
+            examples = screen.query_one("#section-example", Collapsible)
+            content = screen.query_one(".word-detail--content")
+            return _mounted(screen, "section-definition"), (
+                examples.virtual_region.y - int(content.scroll_y)
+            )
+
+    mounted, examples_top = asyncio.run(main())
+    assert mounted == 100
+    assert examples_top == 0
@@ -0,0 +1,96 @@
+import asyncio
+
+from textual.app import App
+from textual.widget import Widget
+
+from tests.fakes import FakeDetailProvider
+from word_app.app.tui.history import WordHistory
+from word_app.app.tui.screens.word_detail import WordDetailScreen
+from word_app.app.tui.widgets import Sidebar
+from word_app.data import vo
+from word_app.data.models import Definition, Definitions
+from word_app.services.wdp.base import DetailSection
+
+
+class _HistoryApp(App[None]):
+    def __init__(self, reuse: bool = False) -> None:
+        super().__init__()
+        self.provider = FakeDetailProvider(
+            {
+                DetailSection.DEFINITIONS: Definitions(
+                    definitions=[Definition(type=vo.Noun, text="A pet.")]
+                )
+            }
+        )
+        self.history = WordHistory(self, self.provider, hot=2, reuse=reuse)
+
+
+def test__WordHistory__back__rebuilds_dropped_screens_from_their_details():
+    app = _HistoryApp()
+
+    async def main() -> tuple[list[str], list[str], bool, bool, int]:
+        async with app.run_test() as pilot:
+            screens: dict[str, WordDetailScreen] = {}
+            for word in ["cat", "dog", "cow"]:
+                app.history.visit(word)
+                await pilot.pause()
+                assert isinstance(app.screen, WordDetailScreen)
+                screens[word] = app.screen
+
+            shown = []
+            for _ in range(2):
+                await pilot.press("escape")
+                await pilot.pause()
+                assert isinstance(app.screen, WordDetailScreen)
+                shown.append(app.screen.word.word)
+            dog_kept = screens["dog"].is_attached
+            cat_rebuilt = app.screen is not screens["cat"] and bool(
+                app.screen.word.definitions.has_value
+            )
+
+            await pilot.press("escape")
+            await pilot.pause()
+            depth = len(app.screen_stack)
+            return shown, app.provider.calls, dog_kept, cat_rebuilt, depth
+
+    shown, calls, dog_kept, cat_rebuilt, depth = asyncio.run(main())
+    assert shown == ["dog", "cat"]
+    assert calls == ["cat", "dog", "cow"]
+    assert dog_kept
+    assert cat_rebuilt
+    # Back out of the words, to the default screen.
+    assert depth == 1
+
+
+def test__WordHistory__visit__reuses_the_screen_and_unchanged_sections():
+    app = _HistoryApp(reuse=True)
+
+    async def main() -> tuple[list[Widget], list[Widget], list[str]]:
+        async with app.run_test() as pilot:
+            shown: list[list[Widget]] = []
+            for word in ["cat", "dog"]:
+                app.history.visit(word)
+                await pilot.pause()
+                shown.append(
+                    [
+                        app.screen,
+                        app.screen.query_one(Sidebar),
+                        app.screen.query_one("#section-information"),
+                        app.screen.query_one("#section-definition"),
+                    ]
+                )
+            await pilot.press("escape")
+            await pilot.pause()
+            assert isinstance(app.screen, WordDetailScreen)
+            assert app.screen.word.word == "cat"
+            return shown[0], shown[1], app.provider.calls
+
+    cat, dog, calls = asyncio.run(main())
+    screen, sidebar, information, definitions = range(4)
+    assert dog[screen] is cat[screen]
+    assert dog[sidebar] is cat[sidebar]
+    # Shows the word, unlike the definitions, the same for both.
+    assert dog[information] is not cat[information]
+    assert dog[definitions] is cat[definitions]
+    assert not dog[definitions].has_class("-stale")
+    assert calls == ["cat", "dog"]
@@ -0,0 +1,102 @@
+import asyncio
+
+from rich.cells import cell_len
+from textual.app import App, ComposeResult
+from textual.widget import Widget
+
+from word_app.app.tui.widgets import (
+    ClickableGrid,
+    ClickableSentence,
+    ClickableText,
+)
+
+
+class _ClickableApp(App[None]):
+    def __init__(self, widget: Widget) -> None:
+        super().__init__()
+        self.widget = widget
+        self.clicked: list[str] = []
+
+    def compose(self) -> ComposeResult:
+        yield self.widget
+
+    def on_clickable_text_text_clicked(
+        self, event: ClickableText.TextClicked
+    ) -> None:
+        self.clicked.append(event.word)
+
+
+def test__ClickableGrid__click__hit_tests_by_position():
+    grid = ClickableGrid(
+        [
+            ("synonym", ["cat", "kitty", "puss"]),
+            ("antonym", []),
+            ("form", ["cats"]),
+        ]
+    )
+    app = _ClickableApp(grid)
+
+    async def main() -> int:
+        # 2 indent + 2 columns of 5 + 3, 'kitty' being the longest word.
+        async with app.run_test(size=(18, 20)) as pilot:
+            await pilot.click(ClickableGrid, offset=(2, 1))
+            await pilot.click(ClickableGrid, offset=(14, 1))
+            await pilot.click(ClickableGrid, offset=(5, 1))
+            await pilot.click(ClickableGrid, offset=(2, 2))
+            await pilot.click(ClickableGrid, offset=(2, 6))
+            await pilot.click(ClickableGrid, offset=(0, 0))
+            await pilot.pause()
+            return grid.size.height
+
+    # Header, 2 rows, blank, rule, blank, header, row.
+    assert asyncio.run(main()) == 8
+    assert app.clicked == ["cat", "kitty", "puss"]
+
+
+def test__ClickableSentence__click__hit_tests_wrapped_words():
+    sentence = ClickableSentence(
+        'A "quoted" [b]word[/b], don\'t 42 well-known.'
+    )
+    app = _ClickableApp(sentence)
+
+    async def main() -> None:
+        sentence.styles.width = 12
+        async with app.run_test(size=(20, 10)) as pilot:
+            for y in range(4):
+                for x in range(12):
+                    await pilot.click(ClickableSentence, offset=(x, y))
+            await pilot.pause()
+
+    asyncio.run(main())
+    clicked = [
+        w for i, w in enumerate(app.clicked) if app.clicked[i - 1 : i] != [w]
+    ]
+    assert clicked == ["A", "quoted", "b", "word", "b", "don't", "well-known"]
+
+
+def test__ClickableSentence__layout__breaks_long_wide_tokens_by_cells():
+    sentence = ClickableSentence("ab 漢字漢字漢字")
+    assert sentence._layout(4) == 4
+    lines = [sentence._line_span(y) for y in range(4)]
+    assert [sentence.text[s:e] for s, e in lines] == [
+        "ab ",
+        "漢字",
+        "漢字",
+        "漢字",
+    ]
+
+
+def test__ClickableGrid__click__measures_wide_words_by_cells():
+    grid = ClickableGrid([("synonym", ["漢字漢字", "cat", "dog"])])
+    app = _ClickableApp(grid)
+
+    async def main() -> list[int]:
+        # 2 indent + 3 columns of 8 cells + 3, on one row under the header.
+        async with app.run_test(size=(35, 10)) as pilot:
+            for x in (9, 10, 13, 24):
+                await pilot.click(ClickableGrid, offset=(x, 1))
+            await pilot.pause()
+            return [cell_len(s.text) for s in grid._render_line(1, 35)]
+
+    assert asyncio.run(main()) == [2, 8, 3, 3, 8, 3, 8]
+    assert app.clicked == ["漢字漢字", "cat", "dog"]
@@ -0,0 +1,53 @@
+import asyncio
+from typing import AsyncGenerator, Collection, Mapping
+
+from word_app.data.models import Word
+from word_app.services.wdp.base import (
+    AbstractWordDetailProvider,
+    DetailSection,
+    SectionUpdate,
+    SectionValue,
+)
+
+
+class FakeDetailProvider(AbstractWordDetailProvider):
+    """Gives every word the same details, recording what's streamed.
+
+    Args:
+        values: The value of each section the provider loads, every section
+            empty if not provided.
+        gate: Streams wait for it to be set, if provided.
+    """
+
+    def __init__(
+        self,
+        values: Mapping[DetailSection, SectionValue | None] | None = None,
+        gate: asyncio.Event | None = None,
+    ) -> None:
+        if values is None:
+            values = dict.fromkeys(DetailSection)
+        self.values = dict(values)
+        self.SECTIONS = frozenset(self.values)  # type: ignore[misc]
+        self.gate = gate
+        self.streamed: list[tuple[str, frozenset[DetailSection]]] = []
+
+    @property
+    def calls(self) -> list[str]:
+        """Words streamed, in turn."""
+        return [word for word, _ in self.streamed]
+
+    async def get_details_for_word(self, word, on_failure=None) -> Word:
+        return Word.model_validate(
+            {"word": word}
+            | {s.value: v for s, v in self.values.items() if v is not None}
+        )
+
+    async def stream_details_for_word(
+        self, word: str, sections: Collection[DetailSection] | None = None
+    ) -> AsyncGenerator[SectionUpdate, None]:
+        wanted = self.SECTIONS if sections is None else sections
+        self.streamed.append((word, self.SECTIONS.intersection(wanted)))
+        if self.gate is not None:
+            await self.gate.wait()
+        async for update in super().stream_details_for_word(word, sections):
+            yield update
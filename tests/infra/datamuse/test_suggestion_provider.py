@@ -0,0 +1,113 @@
+import asyncio
+
+from word_app.data.vo import SearchResultType
+from word_app.infra.cache import TieredCache
+from word_app.infra.datamuse.suggestion_provider import DatamuseSearchProvider
+from word_app.lib.datamuse._models import Suggestion, Word
+
+
+class _FakeDatamuse:
+    """Answers each kind of request with fixed words, after a delay."""
+
+    def __init__(
+        self,
+        suggestions: list[tuple[str, int]] | None = None,
+        words: list[tuple[str, int]] | None = None,
+        words_delay: float = 0.0,
+    ) -> None:
+        self.suggestions = suggestions or []
+        self.words = words or []
+        self.words_delay = words_delay
+        self.requests: list[str] = []
+
+    async def get_suggestions(self, value, *, limit=0):
+        self.requests.append("sug")
+        for word, score in self.suggestions:
+            yield Suggestion(word=word, score=score)
+
+    async def get_words(self, *, limit=0, **likes):
+        self.requests.append("words")
+        await asyncio.sleep(self.words_delay)
+        for word, score in self.words:
+            yield Word(word=word, score=score)
+
+
+def _provider(client: _FakeDatamuse, cache: TieredCache):
+    return DatamuseSearchProvider(None, client=client, cache=cache)
+
+
+def _cache_prefix(
+    provider: DatamuseSearchProvider, prefix: str, words: list[str]
+) -> None:
+    key = provider._cache_key(provider._parse_query(prefix))
+    scored = [[word, 100 - i] for i, word in enumerate(words)]
+    provider._cache.set(
+        key,
+        [
+            [SearchResultType.SUGGESTION.value, scored],
+            [SearchResultType.SOUNDS_LIKE.value, [["kat", 10]]],
+        ],
+    )
+
+
+def _search(provider: DatamuseSearchProvider, query: str):
+    async def main():
+        return [hit async for hit in provider.search(query)]
+
+    return asyncio.run(main())
+
+
+def test__DatamuseSearchProvider__search__narrows_a_cached_prefix():
+    client = _FakeDatamuse(words=[("catalyst", 10), ("cataract", 0)])
+    provider = _provider(client, TieredCache(namespace="search"))
+    _cache_prefix(provider, "cat", ["cat", "catalog", "catapult", "cattle"])
+
+    texts = [hit.text for hit in _search(provider, "cata")]
+
+    # Only suggestions are narrowed down, sounds like is fetched again.
+    assert texts == ["catalog", "catalyst"]
+    # Fewer than the API limit, the prefix's suggestions were all there is.
+    assert client.requests == ["words"]
+
+
+def test__DatamuseSearchProvider__search__refetches_a_full_prefix():
+    client = _FakeDatamuse(suggestions=[("catamaran", 10), ("catacomb", 0)])
+    provider = _provider(client, TieredCache(namespace="search"))
+    full = [f"cata{chr(ord('a') + i)}" for i in range(provider._API_LIMIT)]
+    _cache_prefix(provider, "cat", full)
+
+    hits = _search(provider, "cata")
+
+    assert hits[0].text == "cataa"
+    assert sorted(client.requests) == ["sug", "words"]
+    assert "catamaran" in [hit.text for hit in hits]
+
+
+def test__DatamuseSearchProvider__search__fetches_without_cached_prefix():
+    client = _FakeDatamuse(suggestions=[("dog", 10), ("doge", 5)])
+    provider = _provider(client, TieredCache(namespace="search"))
+    _cache_prefix(provider, "cat", ["cat", "catalog"])
+
+    assert provider._refine(provider._parse_query("doge")) is None
+    hits = _search(provider, "dog")
+
+    assert [hit.text for hit in hits] == ["dog"]
+    assert sorted(client.requests) == ["sug", "words"]
+
+
+def test__DatamuseSearchProvider__search__streams_better_hits_over_earlier():
+    client = _FakeDatamuse(
+        suggestions=[("bank", 100), ("banker", 60), ("bankrupt", 0)],
+        # Slower, outscoring an earlier hit and repeating another.
+        words=[("banker", 100), ("bank", 50), ("bunk", 0)],
+        words_delay=0.05,
+    )
+    provider = _provider(client, TieredCache(namespace="search"))
+
+    hits = _search(provider, "bank")
+
+    assert [(hit.text, hit.score) for hit in hits] == [
+        ("bank", 1.0),
+        ("banker", 0.6),
+        ("banker", 1.0),
+    ]
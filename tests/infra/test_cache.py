@@ -0,0 +1,55 @@
+from word_app.infra.cache import TieredCache
+
+
+def test__TieredCache__get__survives_new_instance(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = TieredCache(namespace="search", path=path)
+    cache.set("SPELLED_LIKE:b?n", [["autocomplete", [["bun", 10]]]])
+    cache.close()
+
+    cache = TieredCache(namespace="search", path=path)
+    assert cache.get("SPELLED_LIKE:b?n") == [["autocomplete", [["bun", 10]]]]
+    assert cache.get("SPELLED_LIKE:b?n") is not None
+    stats = cache.stats
+    assert (stats.disk_hits, stats.memory_hits, stats.misses) == (1, 1, 0)
+    assert (stats.memory_size, stats.disk_size) == (1, 1)
+    assert stats.hit_rate == 1.0
+
+
+def test__TieredCache__get__expired_is_miss_but_lookup_is_stale():
+    cache = TieredCache(namespace="search", keep_stale=60.0)
+    cache.set("key", "value", ttl=-1.0)
+
+    assert cache.get("key") is None
+    entry = cache.lookup("key")
+    assert entry is not None and entry.is_expired
+    assert entry.value == "value"
+
+
+def test__TieredCache__purge__drops_entries_past_keep_stale(tmp_path):
+    cache = TieredCache(namespace="search", path=tmp_path / "c.sqlite3")
+    cache.set("key", "value", ttl=-1.0)
+    cache.purge()
+
+    assert cache.lookup("key") is None
+    assert cache.stats.disk_size == 0
+
+
+def test__TieredCache__get__counts_expired_as_miss_and_drops_it():
+    cache = TieredCache(namespace="search", ttl=-1.0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    stats = cache.stats
+    assert (stats.memory_hits, stats.disk_hits, stats.misses) == (0, 0, 1)
+    assert stats.memory_size == 0
+
+
+def test__TieredCache__peek__leaves_stats_alone():
+    cache = TieredCache(namespace="search")
+    cache.set("key", "value")
+
+    assert cache.peek("key") is not None
+    assert cache.peek("other") is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses) == (0, 0)
@@ -0,0 +1,105 @@
+import asyncio
+
+from tests.fakes import FakeDetailProvider
+from word_app.data.models import Syllable, Syllables
+from word_app.infra.cache import TieredCache
+from word_app.infra.cached_wdp import CachedDetailProvider, DetailsOffline
+from word_app.services.wdp.base import (
+    AbstractWordDetailProvider,
+    DetailSection,
+    SectionUpdate,
+)
+
+
+def _syllables() -> FakeDetailProvider:
+    return FakeDetailProvider(
+        {DetailSection.SYLLABLES: Syllables(syllables=[Syllable(text="cat")])}
+    )
+
+
+def _stream(provider: AbstractWordDetailProvider) -> list[SectionUpdate]:
+    async def main() -> list[SectionUpdate]:
+        updates = [u async for u in provider.stream_details_for_word("cat")]
+        # Let background refreshes finish.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return updates
+
+    return asyncio.run(main())
+
+
+def test__CachedDetailProvider__stream_details_for_word__cached(tmp_path):
+    inner = _syllables()
+    path = tmp_path / "cache.sqlite3"
+    provider = CachedDetailProvider(
+        provider=inner, cache=TieredCache(namespace="details", path=path)
+    )
+    (update,) = _stream(provider)
+    assert update.value == Syllables(syllables=[Syllable(text="cat")])
+    assert len(inner.calls) == 1
+
+    provider = CachedDetailProvider(
+        provider=inner, cache=TieredCache(namespace="details", path=path)
+    )
+    assert _stream(provider) == [update]
+    assert len(inner.calls) == 1
+
+
+def test__CachedDetailProvider__stream_details_for_word__stale_then_refresh():
+    inner = _syllables()
+    cache = TieredCache(namespace="details", keep_stale=60.0)
+    provider = CachedDetailProvider(
+        provider=inner, cache=cache, ttls={DetailSection.SYLLABLES: -1.0}
+    )
+    _stream(provider)
+    (update,) = _stream(provider)
+    assert update.value is not None
+    assert len(inner.calls) == 2
+
+
+def test__CachedDetailProvider__stream_details_for_word__offline():
+    inner = _syllables()
+    provider = CachedDetailProvider(
+        provider=inner, cache=TieredCache(namespace="details"), offline=True
+    )
+    (update,) = _stream(provider)
+    assert isinstance(update.error, DetailsOffline)
+    assert len(inner.calls) == 0
+
+
+def test__CachedDetailProvider__lazy_details_for_word__defers_uncached():
+    inner = _syllables()
+    provider = CachedDetailProvider(
+        provider=inner, cache=TieredCache(namespace="details")
+    )
+    lazy = [DetailSection.SYLLABLES]
+    _, deferred = provider.lazy_details_for_word("cat", lazy)
+    assert [d.section for d in deferred] == lazy
+
+    _stream(provider)
+    _, deferred = provider.lazy_details_for_word("cat", lazy)
+    assert deferred == []
+
+
+def test__CachedDetailProvider__refresh_in_background__per_section():
+    inner = FakeDetailProvider(
+        {DetailSection.SYLLABLES: None, DetailSection.PHRASES: None}
+    )
+    provider = CachedDetailProvider(
+        provider=inner, cache=TieredCache(namespace="details")
+    )
+
+    async def main() -> None:
+        provider._refresh_in_background("cat", [DetailSection.SYLLABLES])
+        # Syllables are already being refreshed, phrases aren't.
+        provider._refresh_in_background(
+            "cat", [DetailSection.SYLLABLES, DetailSection.PHRASES]
+        )
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert inner.streamed == [
+        ("cat", {DetailSection.SYLLABLES}),
+        ("cat", {DetailSection.PHRASES}),
+    ]
+    assert provider._refreshing == {}
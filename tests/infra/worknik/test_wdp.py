@@ -0,0 +1,41 @@
+import asyncio
+
+import httpx
+
+from word_app.infra.worknik.transformers import WnToWaTransformer
+from word_app.infra.worknik.wdp import MultisourceDetailProvider
+from word_app.lib.wordnik.client import DEFAULT_API_CONF, WordnikApiClient
+from word_app.lib.wordnik.exceptions import FailedToRefetchResult
+from word_app.services.wdp.base import DetailSection, SectionUpdate
+
+
+def test__MultisourceDetailProvider__stream_details_for_word():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/frequency"):
+            return httpx.Response(500)
+        if request.url.path.endswith("/examples"):
+            return httpx.Response(200, json={"examples": []})
+        return httpx.Response(200, json=[])
+
+    provider = MultisourceDetailProvider(
+        wordnik_client=WordnikApiClient(
+            conf=DEFAULT_API_CONF(api_key="secret"),
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ),
+        wordnik_transformer=WnToWaTransformer(),
+    )
+
+    async def main() -> list[SectionUpdate]:
+        updates = [u async for u in provider.stream_details_for_word("cat")]
+        await provider.clean()
+        return updates
+
+    updates = {u.section: u for u in asyncio.run(main())}
+    assert set(updates) == set(DetailSection) - {DetailSection.ETYMOLOGIES}
+    failed = updates.pop(DetailSection.FREQUENCY_GRAPH)
+    assert failed.value is None
+    assert isinstance(failed.error, FailedToRefetchResult)
+    for update in updates.values():
+        assert update.error is None
+        assert update.value is not None
+        assert not update.value.has_value
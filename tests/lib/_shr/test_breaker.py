@@ -0,0 +1,133 @@
+import asyncio
+
+import httpx
+import pytest
+
+from word_app.lib._shr.breaker import (
+    CircuitBreaker,
+    CircuitOpen,
+    CircuitState,
+    NotSent,
+)
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.wordnik.com/v4")
+    return httpx.HTTPStatusError(
+        "", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+class _Denied(Exception):
+    pass
+
+
+def test__CircuitBreaker__run__opens_after_consecutive_failures():
+    trips: list[Exception] = []
+    calls = 0
+
+    async def request() -> None:
+        nonlocal calls
+        calls += 1
+        raise _status_error(503)
+
+    async def main(breaker: CircuitBreaker) -> None:
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.run(request)
+        for _ in range(5):
+            with pytest.raises(CircuitOpen):
+                await breaker.run(request)
+
+    breaker = CircuitBreaker(
+        "api.wordnik.com", threshold=3, on_trip=lambda _, e: trips.append(e)
+    )
+    asyncio.run(main(breaker))
+    assert calls == 3
+    assert breaker.state is CircuitState.OPEN
+    assert (breaker.trips, breaker.fast_failed) == (1, 5)
+    assert len(trips) == 1
+
+
+def test__CircuitBreaker__run__only_source_failures_count():
+    async def not_found() -> None:
+        raise _status_error(404)
+
+    async def main(breaker: CircuitBreaker) -> None:
+        for _ in range(5):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.run(not_found)
+
+    breaker = CircuitBreaker("api.wordnik.com", threshold=3)
+    asyncio.run(main(breaker))
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test__CircuitBreaker__run__probes_once_after_cooldown():
+    answers: list[Exception | None] = [_Denied(), None]
+    calls = 0
+
+    async def request() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if error := answers.pop(0):
+            raise error
+        return "ok"
+
+    async def main(breaker: CircuitBreaker) -> list[str | BaseException]:
+        with pytest.raises(_Denied):
+            await breaker.run(request)
+        assert breaker.state is CircuitState.OPEN
+        await asyncio.sleep(0.02)
+        # The first through probes, the others fail while it's running.
+        return await asyncio.gather(
+            *[breaker.run(request) for _ in range(3)], return_exceptions=True
+        )
+
+    breaker = CircuitBreaker(
+        "api.wordnik.com", cooldown=0.01, trip_on=(_Denied,)
+    )
+    results = asyncio.run(main(breaker))
+    assert calls == 2
+    assert results[0] == "ok"
+    assert all(isinstance(r, CircuitOpen) for r in results[1:])
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.trips == 1
+
+
+def test__CircuitBreaker__run__requests_never_sent_say_nothing():
+    request = httpx.Request("GET", "https://api.wordnik.com/v4")
+    answers: list[Exception] = []
+
+    async def send() -> None:
+        error = answers.pop(0)
+        if isinstance(error, NotSent):
+            # As the API clients wrap it.
+            raise RuntimeError("Failed") from error
+        raise error
+
+    async def main(breaker: CircuitBreaker) -> None:
+        answers.extend([_status_error(503)] * 2)
+        answers.append(NotSent("Shed.", request=request))
+        answers.append(_status_error(503))
+        for _ in range(4):
+            with pytest.raises(Exception):
+                await breaker.run(send)
+        assert breaker.state is CircuitState.OPEN
+
+        await asyncio.sleep(0.02)
+        answers.append(NotSent("Shed.", request=request))
+        with pytest.raises(RuntimeError):
+            await breaker.run(send)
+        # Not probed, so the next request probes instead.
+        assert breaker.state is CircuitState.OPEN
+        answers.append(_status_error(503))
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.run(send)
+        assert breaker.fast_failed == 0
+
+    breaker = CircuitBreaker("api.wordnik.com", threshold=3, cooldown=0.01)
+    asyncio.run(main(breaker))
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.trips == 1
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from word_app.lib._shr.coalesce import RequestCoalescer
+
+
+def test__RequestCoalescer__run__shares_in_flight_request():
+    calls = 0
+
+    async def request() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "body"
+
+    async def main() -> list[str]:
+        coalescer: RequestCoalescer[str] = RequestCoalescer()
+        results = await asyncio.gather(
+            *[coalescer.run("key", request) for _ in range(5)]
+        )
+        assert (coalescer.sent, coalescer.saved) == (1, 4)
+        assert coalescer.in_flight == 0
+        return results
+
+    assert asyncio.run(main()) == ["body"] * 5
+    assert calls == 1
+
+
+def test__RequestCoalescer__run__distinct_keys_not_shared():
+    async def main() -> RequestCoalescer[int]:
+        coalescer: RequestCoalescer[int] = RequestCoalescer()
+
+        async def request() -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        await asyncio.gather(
+            coalescer.run("a", request), coalescer.run("b", request)
+        )
+        return coalescer
+
+    coalescer = asyncio.run(main())
+    assert (coalescer.sent, coalescer.saved) == (2, 0)
+
+
+def test__RequestCoalescer__run__cancels_when_all_waiters_cancel():
+    cancelled = False
+
+    async def request() -> None:
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def main() -> None:
+        coalescer: RequestCoalescer[None] = RequestCoalescer()
+        first = asyncio.create_task(coalescer.run("key", request))
+        second = asyncio.create_task(coalescer.run("key", request))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not cancelled
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await asyncio.sleep(0)
+        assert coalescer.cancelled == 1
+
+    asyncio.run(main())
+    assert cancelled
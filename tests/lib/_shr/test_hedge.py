@@ -0,0 +1,73 @@
+import asyncio
+from time import monotonic
+
+from word_app.lib._shr.hedge import Hedger, HedgeStats
+
+
+def _requests(latencies: list[float]):
+    """A request answering after each latency in turn, with its number."""
+    sent = 0
+
+    async def request() -> int:
+        nonlocal sent
+        sent += 1
+        number = sent
+        await asyncio.sleep(latencies[number - 1])
+        return number
+
+    return request
+
+
+def test__Hedger__run__duplicate_answers_a_slow_request():
+    hedger = Hedger(min_samples=10)
+    # Ten to learn from, then a slow one hedged by a fast one.
+    request = _requests([0.01] * 10 + [1.0, 0.01])
+
+    async def main() -> tuple[int, float]:
+        for _ in range(10):
+            await hedger.run("sug", request)
+        start = monotonic()
+        answer = await hedger.run("sug", request)
+        return answer, monotonic() - start
+
+    answer, seconds = asyncio.run(main())
+    assert answer == 12
+    assert seconds < 0.5
+    assert hedger.stats == HedgeStats(requests=11, hedged=1, wins=1)
+    assert hedger.stats.win_rate == 1.0
+    assert "sug: p50" in hedger.report()
+
+
+def test__Hedger__run__budget_caps_duplicates():
+    hedger = Hedger(min_samples=2, budget=0.0)
+    request = _requests([0.01, 0.01, 0.1])
+
+    async def main() -> int:
+        for _ in range(2):
+            await hedger.run("sug", request)
+        return await hedger.run("sug", request)
+
+    assert asyncio.run(main()) == 3
+    assert hedger.stats == HedgeStats(requests=3, over_budget=1)
+
+
+def test__Hedger__run__cancelled_runs_leave_latencies_and_budget():
+    hedger = Hedger(min_samples=10)
+    request = _requests([0.02] * 10 + [1.0] * 30 + [0.02])
+
+    async def main() -> None:
+        for _ in range(10):
+            await hedger.run("sug", request)
+        p90 = hedger.latencies("sug").percentile(0.9)
+        # Cut short by the next keystroke, each of them.
+        for _ in range(30):
+            run = asyncio.ensure_future(hedger.run("sug", request))
+            await asyncio.sleep(0.001)
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+        assert len(hedger.latencies("sug")) == 10
+        assert hedger.latencies("sug").percentile(0.9) == p90
+        assert await hedger.run("sug", request) == 41
+
+    asyncio.run(main())
+    assert hedger.stats == HedgeStats(requests=11)
@@ -0,0 +1,75 @@
+import asyncio
+
+import httpx
+import pytest
+
+from word_app.lib._shr.limit import (
+    RateLimit,
+    RateLimited,
+    RateLimiter,
+    UsageLedger,
+)
+from word_app.lib._shr.retry import request_deadline
+from word_app.lib._shr.schedule import Priority, request_priority
+
+_REQUEST = httpx.Request("GET", "https://api.wordnik.com/v4/word.json")
+
+
+def _limiter(limit: RateLimit, ledger: UsageLedger | None = None):
+    return RateLimiter(
+        "api.wordnik.com", limit, ledger or UsageLedger(path=None)
+    )
+
+
+def test__RateLimiter__acquire__sheds_background_and_queues_the_rest():
+    limiter = _limiter(RateLimit(rate=100.0, burst=4, reserve=0.5))
+
+    async def main() -> None:
+        for _ in range(3):
+            await limiter.acquire(_REQUEST)
+        with request_priority(Priority.SPECULATIVE):
+            with pytest.raises(RateLimited):
+                await limiter.acquire(_REQUEST)
+        for _ in range(3):
+            await limiter.acquire(_REQUEST)
+
+    asyncio.run(main())
+    assert limiter.stats.shed == 1
+    assert limiter.stats.queued >= 2
+    assert limiter.used_today == 6
+
+
+def test__RateLimiter__observe__holds_back_for_the_hosts_limits():
+    limiter = _limiter(RateLimit(rate=100.0, burst=4))
+    limiter.observe(
+        httpx.Response(200, headers={"X-RateLimit-Remaining-Minute": "0"})
+    )
+
+    async def main() -> None:
+        with request_deadline(0.5):
+            await limiter.acquire(_REQUEST)
+
+    with pytest.raises(RateLimited):
+        asyncio.run(main())
+
+
+def test__RateLimiter__acquire__keeps_to_the_daily_quota_across_runs(
+    tmp_path,
+):
+    path = tmp_path / "usage.json"
+    limit = RateLimit(rate=100.0, burst=10, daily_quota=3)
+    first = UsageLedger(path)
+    limiter = _limiter(limit, first)
+
+    async def acquire(limiter: RateLimiter, times: int) -> None:
+        for _ in range(times):
+            await limiter.acquire(_REQUEST)
+
+    asyncio.run(acquire(limiter, 2))
+    first.save()
+
+    again = _limiter(limit, UsageLedger(path))
+    assert again.used_today == 2
+    asyncio.run(acquire(again, 1))
+    with pytest.raises(RateLimited):
+        asyncio.run(acquire(again, 1))
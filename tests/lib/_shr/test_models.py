@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+
+from word_app.lib._shr.models import Endpoint, Param
+
+
+@dataclass
+class _Endpoint(Endpoint):
+    @dataclass
+    class Word(Param):
+        name: str = field(default="word")
+
+    @dataclass
+    class Limit(Param):
+        name: str = field(default="limit")
+        value: int = field(default=10)
+
+    _endpoint: str = "words"
+    word: Word = field(default_factory=Word)
+    not_a_param: str = "ignored"
+    limit: Limit = field(default_factory=Limit)
+
+
+@dataclass
+class _Bare(Endpoint):
+    _endpoint: str = "bare"
+
+
+def test__Endpoint__params():
+    assert _Endpoint().params == {"limit": 10}
+    params = _Endpoint(word=_Endpoint.Word(value="cat")).params
+    assert list(params.items()) == [("word", "cat"), ("limit", 10)]
+    assert _Endpoint(limit=_Endpoint.Limit(value=0)).params == {}
+    assert _Bare().params == {}
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+from httpx_retries import Retry
+
+from word_app.lib._shr.retry import (
+    DeadlineRetryTransport,
+    RetryDecision,
+    RetryOutcome,
+    RetryStats,
+    remaining_budget,
+    request_deadline,
+)
+
+
+def _client(
+    statuses: list[int], retry: Retry, decisions: list[RetryDecision]
+) -> tuple[httpx.AsyncClient, list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(statuses[min(len(requests), len(statuses)) - 1])
+
+    transport = DeadlineRetryTransport(
+        transport=httpx.MockTransport(handler),
+        retry=retry,
+        on_decision=decisions.append,
+    )
+    return httpx.AsyncClient(transport=transport), requests
+
+
+def test__DeadlineRetryTransport__retries_without_a_deadline():
+    decisions: list[RetryDecision] = []
+    client, requests = _client([503, 503, 200], Retry(total=5), decisions)
+
+    response = asyncio.run(client.get("https://api.datamuse.com/words"))
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert [d.outcome for d in decisions] == [RetryOutcome.RETRIED] * 2
+    assert [d.attempt for d in decisions] == [1, 2]
+    assert decisions[0].cause == "503"
+    assert decisions[0].host == "api.datamuse.com"
+    assert decisions[0].remaining is None
+
+
+def test__DeadlineRetryTransport__gives_up_rather_than_wait_past_deadline():
+    decisions: list[RetryDecision] = []
+    retry = Retry(total=5, backoff_factor=0.5, backoff_jitter=0)
+    client, requests = _client([503], retry, decisions)
+    stats = RetryStats()
+
+    async def main() -> httpx.Response:
+        with request_deadline(0.5):
+            return await client.get(
+                "https://api.datamuse.com/words", timeout=5.0
+            )
+
+    response = asyncio.run(main())
+    for decision in decisions:
+        stats.record(decision)
+    assert response.status_code == 503
+    # A second attempt would've waited a second, past the deadline.
+    assert len(requests) == 1
+    assert [d.outcome for d in decisions] == [RetryOutcome.OVER_DEADLINE]
+    assert decisions[0].wait == 1.0
+    assert stats == RetryStats(over_deadline=1)
+    # The attempt made was given no longer than the deadline left.
+    assert requests[0].extensions["timeout"]["read"] <= 0.5
+
+
+def test__request_deadline__keeps_to_the_enclosing_deadline():
+    with request_deadline(1.0):
+        with request_deadline(10.0):
+            inner = remaining_budget()
+            with request_deadline(10.0, inherit=False):
+                detached = remaining_budget()
+    assert inner is not None and inner <= 1.0
+    assert detached is not None and detached > 9.0
+    assert remaining_budget() is None
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from word_app.lib._shr.retry import request_deadline
+from word_app.lib._shr.schedule import (
+    Priority,
+    RequestScheduler,
+    request_priority,
+)
+
+_HOST = "api.datamuse.com"
+
+
+def test__RequestScheduler__run__new_search_goes_ahead_of_queued_prefetches():
+    scheduler = RequestScheduler(per_host=1, reserved=0)
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def request(name: str) -> None:
+        started.append(name)
+        if name == "loading":
+            await release.wait()
+
+    async def run(name: str, priority: Priority) -> None:
+        with request_priority(priority):
+            await scheduler.run(_HOST, lambda: request(name))
+
+    async def main() -> None:
+        tasks = [asyncio.create_task(run("loading", Priority.VISIBLE))]
+        await asyncio.sleep(0)
+        for name in ("prefetch-1", "prefetch-2"):
+            tasks.append(asyncio.create_task(run(name, Priority.SPECULATIVE)))
+        tasks.append(asyncio.create_task(run("warmup", Priority.WARMUP)))
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(run("search", Priority.INTERACTIVE)))
+        await asyncio.sleep(0)
+        assert scheduler.queued(_HOST) == 4
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert started == [
+        "loading",
+        "search",
+        "prefetch-1",
+        "prefetch-2",
+        "warmup",
+    ]
+    stats = scheduler.stats
+    assert stats[Priority.SPECULATIVE].max_queued == 2
+    assert stats[Priority.SPECULATIVE].queued == 0
+    assert stats[Priority.INTERACTIVE].started == 1
+    assert stats[Priority.INTERACTIVE].mean_wait > 0
+
+
+def test__RequestScheduler__run__keeps_a_slot_free_of_background_requests():
+    scheduler = RequestScheduler(per_host=2, reserved=1)
+    release = asyncio.Event()
+
+    async def main() -> float:
+        with request_priority(Priority.SPECULATIVE):
+            prefetch = asyncio.create_task(scheduler.run(_HOST, release.wait))
+            queued = asyncio.create_task(scheduler.run(_HOST, release.wait))
+        await asyncio.sleep(0)
+        # The second prefetch waits, the search takes the reserved slot.
+        await scheduler.run(_HOST, lambda: asyncio.sleep(0))
+        waited = scheduler.stats[Priority.INTERACTIVE].max_wait
+        release.set()
+        await asyncio.gather(prefetch, queued)
+        return waited
+
+    assert asyncio.run(main()) < 0.05
+    assert scheduler.stats[Priority.SPECULATIVE].max_queued == 1
+
+
+def test__RequestScheduler__run__waits_only_while_the_deadline_allows():
+    scheduler = RequestScheduler(per_host=1)
+    release = asyncio.Event()
+
+    async def main() -> None:
+        running = asyncio.create_task(scheduler.run(_HOST, release.wait))
+        await asyncio.sleep(0)
+        with request_deadline(0.05):
+            with pytest.raises(TimeoutError):
+                await scheduler.run(_HOST, lambda: asyncio.sleep(0))
+        release.set()
+        await running
+        # The expired request gave up its place.
+        await scheduler.run(_HOST, lambda: asyncio.sleep(0))
+
+    asyncio.run(main())
+    assert scheduler.stats[Priority.INTERACTIVE].expired == 1
+    assert scheduler.stats[Priority.INTERACTIVE].started == 2
@@ -0,0 +1,35 @@
+import random
+import string
+
+from word_app.lib.lexicon.autocomplete import PrefixIndex
+from word_app.lib.lexicon.wordlist import WordList, default_wordlist
+
+
+def test__PrefixIndex__complete__matches_brute_force():
+    rand = random.Random(7)
+    words = sorted(
+        {"".join(rand.choices("abc", k=rand.randint(1, 6))) for _ in range(300)}
+    )
+    weights = [rand.randint(0, 50) for _ in words]
+    index = PrefixIndex(WordList(words=tuple(words), weights=tuple(weights)))
+
+    for prefix in ["", "a", "ab", "cab", "ccc", "d"]:
+        expected = sorted(
+            [(w, wt) for w, wt in zip(words, weights) if w.startswith(prefix)],
+            key=lambda pair: pair[1],
+            reverse=True,
+        )[:5]
+        found = index.complete(prefix, 5)
+        assert [wt for _, wt in found] == [wt for _, wt in expected]
+        assert all(w.startswith(prefix) for w, _ in found)
+        assert len({w for w, _ in found}) == len(found)
+
+
+def test__PrefixIndex__complete__bundled_wordlist():
+    wordlist = default_wordlist()
+    index = PrefixIndex(wordlist)
+
+    assert len(index) == len(wordlist)
+    assert index.complete("th", 1) == [("the", wordlist.weights[0])]
+    assert index.complete("{", 3) == []
+    assert all(c in string.ascii_lowercase for c in "".join(wordlist.words))
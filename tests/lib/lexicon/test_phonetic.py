@@ -0,0 +1,35 @@
+from word_app.lib.lexicon.phonetic import PhoneticIndex, metaphone
+from word_app.lib.lexicon.wordlist import WordList, default_wordlist
+
+
+def test__metaphone():
+    assert metaphone("knight") == metaphone("night") == "NT"
+    assert metaphone("phone") == metaphone("fone") == "FN"
+    assert metaphone("thumb") == "0M"
+    assert metaphone("character") == "XRKTR"
+    assert metaphone("school") == "SKL"
+    assert metaphone("science") == "SNS"
+    assert metaphone("laugh") == "LK"
+    assert metaphone("nation") == "NXN"
+    assert metaphone("1") == ""
+
+
+def test__metaphone__matches_bundled_keys():
+    wordlist = default_wordlist()
+
+    assert len(wordlist.metaphones) == len(wordlist)
+    assert list(map(metaphone, wordlist.words)) == list(wordlist.metaphones)
+
+
+def test__PhoneticIndex__match__same_key_before_near_keys():
+    wordlist = WordList(
+        words=("give", "given", "giraffe", "graph"),
+        weights=(470, 440, 330, 300),
+    )
+    index = PhoneticIndex(wordlist)
+
+    found = index.match("jirafe", 3)
+    assert [w for w, _ in found] == ["giraffe", "give", "given"]
+    assert found[0][1] > found[1][1] > found[2][1]
+    assert index.match("giraffe", 1) == [("giraffe", 330)]
+    assert index.match("") == []
@@ -0,0 +1,28 @@
+import fnmatch
+import re
+
+from word_app.lib.lexicon.wildcard import WildcardIndex
+from word_app.lib.lexicon.wordlist import WordList, default_wordlist
+
+
+def test__WildcardIndex__match__matches_brute_force():
+    wordlist = default_wordlist()
+    index = WildcardIndex(wordlist)
+
+    for pattern in ["b?n*a", "t??o", "*ing", "t*t", "s*e*s", "*", "a", "q1*"]:
+        regex = re.compile(fnmatch.translate(pattern))
+        expected = [w for w in wordlist.words if regex.match(w)][:50]
+        assert [w for w, _ in index.match(pattern, 50)] == expected
+
+
+def test__WildcardIndex__match__most_frequent_first():
+    wordlist = WordList(
+        words=("bat", "bet", "bit", "bust"), weights=(40, 30, 20, 10)
+    )
+    index = WildcardIndex(wordlist)
+
+    assert index.match("b?t") == [("bat", 40), ("bet", 30), ("bit", 20)]
+    assert index.match("b*t", 2) == [("bat", 40), ("bet", 30)]
+    assert index.match("*s*") == [("bust", 10)]
+    assert index.match("b??") == [("bat", 40), ("bet", 30), ("bit", 20)]
+    assert index.match("????") == [("bust", 10)]
@@ -0,0 +1,32 @@
+import asyncio
+
+import httpx
+
+from word_app.lib.wordnik.client import DEFAULT_API_CONF, WordnikApiClient
+from word_app.lib.wordnik.endpoints import HyphenationEndpoint
+
+
+def test__WordnikApiClient__request__binds_api_key():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    endpoint = HyphenationEndpoint()
+    client = WordnikApiClient(
+        conf=DEFAULT_API_CONF(api_key="secret"),
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def main() -> None:
+        async for _ in client.get_hyphenation(word="cat", endpoint=endpoint):
+            pass
+        await client.clean()
+
+    asyncio.run(main())
+    (request,) = requests
+    assert request.url.path == "/v4/word.json/cat/hyphenation"
+    assert request.url.params["api_key"] == "secret"
+    assert request.url.params["limit"] == "500"
+    assert endpoint.api_key.value == ""
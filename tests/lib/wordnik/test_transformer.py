@@ -0,0 +1,54 @@
+from wordnik.swagger import ApiClient
+
+from word_app.lib.wordnik._transformer import _deserialize
+
+_DEFINITIONS = [
+    {
+        "word": "cat",
+        "text": "A small carnivorous mammal.",
+        "score": "1.5",
+        "sequence": 1,
+        "citations": [{"cite": "The cat sat.", "source": "Anon"}],
+        "labels": [],
+        "notes": None,
+        "relatedWords": [{"relationshipType": "synonym", "words": ["puss"]}],
+        "textProns": [{"raw": "kat", "seq": 0}],
+        "unknown": "ignored",
+    },
+    {"word": "cat", "partOfSpeech": "verb"},
+]
+
+_EXAMPLES = {
+    "facets": [],
+    "examples": [
+        {
+            "text": "A cat.",
+            "year": 2001,
+            "provider": {"id": 7, "name": "ignored"},
+            "sentence": {"display": "A cat."},
+        }
+    ],
+}
+
+
+def _as_dict(obj):
+    if isinstance(obj, list):
+        return [_as_dict(o) for o in obj]
+    if hasattr(obj, "__dict__"):
+        return {k: _as_dict(v) for k, v in vars(obj).items()}
+    return obj
+
+
+def test___deserialize__same_objects_as_wordnik():
+    wordnik = ApiClient(apiKey="")
+
+    for obj, type_name in [
+        (_DEFINITIONS, "list[Definition]"),
+        (_EXAMPLES, "ExampleSearchResults"),
+        ({"frequency": [{"year": "1990", "count": 3}]}, "FrequencySummary"),
+        ([{"gram1": "cat", "gram2": "flap", "wlmi": 9}], "list[Bigram]"),
+    ]:
+        decoded = _deserialize(obj, type_name)
+        expected = wordnik.deserialize(obj, type_name)
+        assert type(decoded) is type(expected)
+        assert _as_dict(decoded) == _as_dict(expected)
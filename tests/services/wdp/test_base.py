@@ -0,0 +1,20 @@
+import asyncio
+
+from tests.fakes import FakeDetailProvider
+from word_app.services.wdp.base import LAZY_SECTIONS, DetailSection
+
+
+def test__AbstractWordDetailProvider__lazy_details_for_word():
+    updates, deferred = FakeDetailProvider().lazy_details_for_word("cat")
+
+    async def main() -> tuple[set, set]:
+        eager = {u.section async for u in updates}
+        loaded = set()
+        for handle in deferred:
+            loaded |= {u.section async for u in handle.load()}
+        return eager, loaded
+
+    eager, loaded = asyncio.run(main())
+    assert eager == set(DetailSection) - LAZY_SECTIONS
+    assert {handle.section for handle in deferred} == LAZY_SECTIONS
+    assert loaded == LAZY_SECTIONS
@@ -0,0 +1,62 @@
+import asyncio
+
+from tests.fakes import FakeDetailProvider
+from word_app.services.wdp.base import DetailSection, SectionUpdate
+from word_app.services.wdp.prefetch import DetailPrefetcher, PrefetchStats
+
+
+def test__DetailPrefetcher__attend__cancels_when_attention_moves_on():
+    async def main() -> tuple[list[str], PrefetchStats]:
+        provider = FakeDetailProvider(
+            {DetailSection.DEFINITIONS: None}, gate=asyncio.Event()
+        )
+        prefetcher = DetailPrefetcher(provider, dwell=0.01)
+        prefetcher.attend("cat")
+        await asyncio.sleep(0.05)
+        prefetcher.attend("dog")
+        # Moved on again before dwelling, so never fetched.
+        prefetcher.attend("cow")
+        await asyncio.sleep(0.05)
+        prefetcher.attend(None)
+        await asyncio.sleep(0)
+        return provider.calls, prefetcher.stats
+
+    calls, stats = asyncio.run(main())
+    assert calls == ["cat", "cow"]
+    assert stats.started == 2
+    assert stats.cancelled == 2
+    assert stats.completed == 0
+
+
+def test__DetailPrefetcher__claim__counts_and_shares_prefetches():
+    async def main() -> tuple[list[str], list[SectionUpdate], PrefetchStats]:
+        provider = FakeDetailProvider(
+            {DetailSection.DEFINITIONS: None}, gate=asyncio.Event()
+        )
+        prefetcher = DetailPrefetcher(provider, dwell=0)
+        provider.gate.set()
+        prefetcher.attend("cat")
+        await asyncio.sleep(0.01)
+        prefetcher.claim("cat", provider.stream_details_for_word("cat"))
+        prefetcher.claim("dog", provider.stream_details_for_word("dog"))
+
+        provider.gate.clear()
+        prefetcher.attend("cow")
+        await asyncio.sleep(0.01)
+        updates = prefetcher.claim(
+            "cow", provider.stream_details_for_word("cow")
+        )
+        # Attention moving on doesn't stop a claimed prefetch.
+        prefetcher.attend(None)
+        provider.gate.set()
+        shown = [update async for update in updates]
+        return provider.calls, shown, prefetcher.stats
+
+    calls, shown, stats = asyncio.run(main())
+    # The claims' own streams only start once iterated.
+    assert calls == ["cat", "cow", "cow"]
+    assert len(shown) == 1
+    assert (stats.hits, stats.partial, stats.misses) == (1, 1, 1)
+    assert stats.completed == 2
+    assert stats.cancelled == 0
+    assert stats.hit_rate == 1 / 3